@@ -26,6 +26,10 @@ class AnharmonicityMaker(BaseAnharmonicityMaker):
         Name of the flows produced by this maker.
     phonon_maker: BasePhononMaker
         The maker to generate the phonon model
+    eigen_cache_dir: str | Path | None
+        Directory in which the eigen-decomposition of the dynamical matrix is
+        persisted and shared between jobs. If None, it is stored in the directory
+        of the job computing it.
     """
 
     name: str = "anharmonicity"
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import contextlib
 import io
+import json
+import logging
 import os
 import sys
 import time
@@ -12,6 +14,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from importlib import import_module
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -32,16 +35,17 @@ from scipy.linalg import schur
 
 from atomate2.ase.jobs import _ASE_DATA_OBJECTS, AseMaker
 from atomate2.ase.schemas import AseResult, AseTaskDoc
-from atomate2.ase.utils import TrajectoryObserver
+from atomate2.ase.utils import StreamingTrajectoryObserver, TrajectoryObserver
 
 if TYPE_CHECKING:
-    from pathlib import Path
-    from typing import Literal
+    from typing import Any, Literal
 
     from ase.calculators.calculator import Calculator
 
     from atomate2.ase.schemas import AseMoleculeTaskDoc, AseStructureTaskDoc
 
+logger = logging.getLogger(__name__)
+
 
 class MDEnsemble(Enum):
     """Define known MD ensembles."""
@@ -78,6 +82,156 @@ for preset in DynamicsPresets.__members__:
     _valid_dynamics[ensemble].add(thermostat)
 
 
+_DYNAMICS_EXCLUDED_ATTRS = (
+    "atoms",
+    "optimizable",
+    "observers",
+    "trajectory",
+    "logfile",
+)
+
+
+def write_md_checkpoint(
+    dyn: MolecularDynamics,
+    filename: str | Path,
+    n_steps: int | None = None,
+    completed: bool = False,
+) -> None:
+    """
+    Write a restart checkpoint of an ASE molecular dynamics run.
+
+    The checkpoint is an ``.npz`` file with the positions, momenta and cell of the
+    atoms, the step count and target number of steps, whether the run finished,
+    the state of the random number generators used by the dynamics, and the
+    numerical attributes of the dynamics object (numbers, strings, booleans and
+    numeric arrays, e.g., thermostat variables). Other attributes are recreated
+    when the dynamics object is constructed. The file is written to a temporary
+    name first, so that an interrupted write leaves the previous checkpoint intact.
+
+    Parameters
+    ----------
+    dyn : ASE .MolecularDynamics
+        The dynamics object to checkpoint.
+    filename : str or Path
+        The name of the checkpoint file.
+    n_steps : int or None
+        The total number of steps of the run.
+    completed : bool
+        Whether the run finished. Finished runs are not resumed.
+    """
+    atoms = dyn.atoms
+    arrays = {
+        "positions": atoms.get_positions(),
+        "momenta": atoms.get_momenta(),
+        "cell": atoms.get_cell()[:],
+        "pbc": atoms.get_pbc(),
+    }
+    state: dict[str, Any] = {}
+    rng_states: dict[str, Any] = {}
+    for key, value in vars(dyn).items():
+        if key in _DYNAMICS_EXCLUDED_ATTRS or callable(value):
+            continue
+        if (rng_state := _get_rng_state(value)) is not None:
+            rng_states[key] = rng_state
+        elif value is None or isinstance(value, bool | int | float | str | np.generic):
+            state[key] = value.item() if isinstance(value, np.generic) else value
+        elif isinstance(value, np.ndarray) and value.dtype.kind in "biufc":
+            arrays[f"state.{key}"] = value
+
+    metadata = {
+        "dynamics": type(dyn).__name__,
+        "step": dyn.nsteps,
+        "n_steps": n_steps,
+        "completed": completed,
+        "state": state,
+        "rng_states": rng_states,
+    }
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "wb") as file:
+        np.savez(file, metadata=np.array(json.dumps(metadata)), **arrays)
+    os.replace(tmp_filename, filename)
+
+
+def load_md_checkpoint(filename: str | Path) -> dict[str, Any]:
+    """
+    Load a checkpoint written by :obj:`write_md_checkpoint`.
+
+    Parameters
+    ----------
+    filename : str or Path
+        The name of the checkpoint file.
+
+    Returns
+    -------
+    dict
+        The checkpoint, with the "dynamics" name, "step", total "n_steps", whether
+        the run "completed", "state" of the dynamics object, "rng_states", and the
+        "positions", "momenta", "cell" and "pbc" of the atoms.
+    """
+    with np.load(filename, allow_pickle=False) as data:
+        checkpoint = json.loads(data["metadata"].item())
+        for key in data.files:
+            if key.startswith("state."):
+                checkpoint["state"][key.removeprefix("state.")] = data[key]
+            elif key != "metadata":
+                checkpoint[key] = data[key]
+    return checkpoint
+
+
+def restore_md_checkpoint(dyn: MolecularDynamics, checkpoint: dict[str, Any]) -> None:
+    """
+    Restore the state of an ASE molecular dynamics run from a checkpoint.
+
+    The dynamics object must have been created with the checkpoint atoms.
+
+    Parameters
+    ----------
+    dyn : ASE .MolecularDynamics
+        The dynamics object to restore.
+    checkpoint : dict
+        A checkpoint loaded with :obj:`load_md_checkpoint`.
+    """
+    for key, value in checkpoint["state"].items():
+        setattr(dyn, key, value)
+    dyn.nsteps = checkpoint["step"]
+    for key, rng_state in checkpoint["rng_states"].items():
+        _set_rng_state(getattr(dyn, key, None), rng_state)
+
+
+def _get_rng_state(rng: Any) -> dict[str, Any] | None:
+    """Get the JSON serializable state of a random number generator, if it is one."""
+    if rng is np.random:
+        # ASE thermostats default to the global numpy random state
+        kind, state = "global", np.random.get_state(legacy=False)  # noqa: NPY002
+    elif isinstance(rng, np.random.RandomState):
+        kind, state = "random_state", rng.get_state(legacy=False)
+    elif isinstance(rng, np.random.Generator):
+        kind, state = "generator", rng.bit_generator.state
+    else:
+        return None
+    return {"kind": kind, "state": _to_json(state)}
+
+
+def _set_rng_state(rng: Any, rng_state: dict[str, Any]) -> None:
+    """Set the state of a random number generator from :obj:`_get_rng_state`."""
+    state = rng_state["state"]
+    if rng_state["kind"] == "global":
+        np.random.set_state(state)  # noqa: NPY002
+    elif rng_state["kind"] == "random_state":
+        rng.set_state(state)
+    else:
+        rng.bit_generator.state = state
+
+
+def _to_json(obj: Any) -> Any:
+    """Convert the numpy arrays and scalars in a nested dict to python types."""
+    if isinstance(obj, dict):
+        return {key: _to_json(value) for key, value in obj.items()}
+    if isinstance(obj, np.ndarray | np.generic):
+        return obj.tolist()
+    return obj
+
+
 @dataclass
 class AseMDMaker(AseMaker, metaclass=ABCMeta):
     """
@@ -147,6 +301,12 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
         If "xdatcar, writes a VASP-style XDATCAR
     traj_interval : int
         The step interval for saving the trajectories.
+    traj_chunk_size : int or None
+        If an int, the trajectory is streamed to `traj_file` in chunks of this
+        many frames during the run instead of being held in memory. Only the
+        first and last frames are then kept in the task document, which references
+        the trajectory file. Requires `traj_file` to be set with
+        `traj_file_fmt = "ase"`.
     mb_velocity_seed : int or None
         If an int, a random number seed for generating initial velocities
         from a Maxwell-Boltzmann distribution.
@@ -156,6 +316,16 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
         Whether to initialize the atomic velocities with zero angular momentum
     verbose : bool = False
         Whether to print stdout to screen during the MD run.
+    checkpoint_interval : int or None
+        If an int, write a restart checkpoint to `checkpoint_file` every this many
+        MD steps and at the end of the run.
+    checkpoint_file : str = "md_checkpoint.npz"
+        The name of the checkpoint file, both written to the current directory
+        and read from `prev_dir`.
+    resume : bool = False
+        Whether to resume an unfinished run from the checkpoint in `prev_dir`.
+        Checkpoints of finished runs are ignored, so that chained MD jobs passing
+        the previous directory start a new run from the given structure.
     """
 
     name: str = "ASE MD"
@@ -172,10 +342,14 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
     traj_file: str | Path | None = None
     traj_file_fmt: Literal["pmg", "ase"] = "ase"
     traj_interval: int = 1
+    traj_chunk_size: int | None = None
     mb_velocity_seed: int | None = None
     zero_linear_momentum: bool = False
     zero_angular_momentum: bool = False
     verbose: bool = False
+    checkpoint_interval: int | None = None
+    checkpoint_file: str = "md_checkpoint.npz"
+    resume: bool = False
 
     def __post_init__(self) -> None:
         """Ensure that ensemble is an enum."""
@@ -263,8 +437,8 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
         mol_or_struct: .Molecule or .Structure
             pymatgen molecule or structure
         prev_dir : str or Path or None
-            A previous calculation directory to copy output files from. Unused, just
-            added to match the method signature of other makers.
+            A previous calculation directory. If `resume` is set and it contains
+            the checkpoint of an unfinished run, the run is resumed from it.
         """
         return AseTaskDoc.to_mol_or_struct_metadata_doc(
             getattr(self.calculator, "name", type(self.calculator).__name__),
@@ -295,8 +469,8 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
         mol_or_struct: .Molecule or .Structure
             pymatgen molecule or structure
         prev_dir : str or Path or None
-            A previous calculation directory to copy output files from. Unused, just
-            added to match the method signature of other makers.
+            A previous calculation directory. If `resume` is set and it contains
+            the checkpoint of an unfinished run, the run is resumed from it.
         """
         self._get_ensemble_schedule()
         self._get_ensemble_defaults()
@@ -331,36 +505,94 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
             # Allow user to explicitly run ASE Dynamics class
             dynamics = self.dynamics
 
-        atoms = mol_or_struct.to_ase_atoms()
-
-        if dynamics is NPT:
-            # Note that until dynamics is instantiated,
-            # `isinstance(dynamics,NPT)` is False
-
-            # ASE NPT implementation requires upper triangular cell
-            schur_decomp, _ = schur(atoms.get_cell(complete=True), output="complex")
-            atoms.set_cell(schur_decomp.real, scale_atoms=True)
-
-        if initial_velocities:
-            atoms.set_velocities(initial_velocities)
-        elif not np.isnan(self.t_schedule).any():
-            MaxwellBoltzmannDistribution(
-                atoms=atoms,
-                temperature_K=self.t_schedule[0],
-                rng=np.random.default_rng(seed=self.mb_velocity_seed),
+        checkpoint = None
+        if (
+            self.resume
+            and prev_dir is not None
+            and os.path.isfile(
+                checkpoint_path := os.path.join(prev_dir, self.checkpoint_file)
             )
-            if self.zero_linear_momentum:
-                Stationary(atoms)
-            if self.zero_angular_momentum:
-                ZeroRotation(atoms)
+        ):
+            checkpoint = load_md_checkpoint(checkpoint_path)
+            if checkpoint["completed"]:
+                logger.warning(
+                    "Not resuming from %s as the run already finished.",
+                    checkpoint_path,
+                )
+                checkpoint = None
+            elif checkpoint["dynamics"] != dynamics.__name__:
+                raise ValueError(
+                    f"Cannot resume {dynamics.__name__} dynamics from a "
+                    f"{checkpoint['dynamics']} checkpoint."
+                )
+            elif checkpoint["n_steps"] not in (None, self.n_steps):
+                raise ValueError(
+                    f"Cannot resume a run of {self.n_steps} steps from the "
+                    f"checkpoint of a run of {checkpoint['n_steps']} steps."
+                )
+
+        atoms = mol_or_struct.to_ase_atoms()
+        if checkpoint is not None:
+            # positions, momenta and cell are restored from the checkpoint
+            if len(checkpoint["positions"]) != len(atoms):
+                raise ValueError(
+                    f"The checkpoint has {len(checkpoint['positions'])} atoms, "
+                    f"but the structure has {len(atoms)}."
+                )
+            atoms.set_pbc(checkpoint["pbc"])
+            atoms.set_cell(checkpoint["cell"])
+            atoms.set_positions(checkpoint["positions"])
+            atoms.set_momenta(checkpoint["momenta"])
+        else:
+            if dynamics is NPT:
+                # Note that until dynamics is instantiated,
+                # `isinstance(dynamics,NPT)` is False
+
+                # ASE NPT implementation requires upper triangular cell
+                schur_decomp, _ = schur(atoms.get_cell(complete=True), output="complex")
+                atoms.set_cell(schur_decomp.real, scale_atoms=True)
+
+            if initial_velocities:
+                atoms.set_velocities(initial_velocities)
+            elif not np.isnan(self.t_schedule).any():
+                MaxwellBoltzmannDistribution(
+                    atoms=atoms,
+                    temperature_K=self.t_schedule[0],
+                    rng=np.random.default_rng(seed=self.mb_velocity_seed),
+                )
+                if self.zero_linear_momentum:
+                    Stationary(atoms)
+                if self.zero_angular_momentum:
+                    ZeroRotation(atoms)
 
         atoms.calc = self.calculator
 
-        md_observer = TrajectoryObserver(atoms, store_md_outputs=True)
+        if self.traj_chunk_size:
+            if self.traj_file is None or self.traj_file_fmt != "ase":
+                raise ValueError(
+                    "Streaming the trajectory with `traj_chunk_size` requires "
+                    "`traj_file` to be set and `traj_file_fmt` to be 'ase'."
+                )
+            md_observer = StreamingTrajectoryObserver(
+                atoms,
+                self.traj_file,
+                chunk_size=self.traj_chunk_size,
+                store_md_outputs=True,
+            )
+        else:
+            md_observer = TrajectoryObserver(
+                atoms,
+                store_md_outputs=True,
+                n_frames=self.n_steps // self.traj_interval + 1,
+            )
 
         md_runner = dynamics(
             atoms=atoms, timestep=self.time_step * units.fs, **self.ase_md_kwargs
         )
+        if checkpoint is not None:
+            restore_md_checkpoint(md_runner, checkpoint)
+            # ASE only observes the initial frame of a run starting at step 0
+            md_observer()
 
         md_runner.attach(md_observer, interval=self.traj_interval)
 
@@ -373,12 +605,35 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
             dyn.set_stress(self.p_schedule[dyn.nsteps] * 1e3 * units.bar)
 
         md_runner.attach(_callback, interval=1)
+        if self.checkpoint_interval:
+            md_runner.attach(
+                write_md_checkpoint,
+                interval=self.checkpoint_interval,
+                dyn=md_runner,
+                filename=self.checkpoint_file,
+                n_steps=self.n_steps,
+            )
         with contextlib.redirect_stdout(sys.stdout if self.verbose else io.StringIO()):
             t_i = time.perf_counter()
-            md_runner.run(steps=self.n_steps)
+            try:
+                md_runner.run(steps=max(self.n_steps - md_runner.nsteps, 0))
+            finally:
+                if isinstance(md_observer, StreamingTrajectoryObserver):
+                    md_observer.close()
             t_f = time.perf_counter()
 
-        if self.traj_file is not None:
+        if self.checkpoint_interval:
+            write_md_checkpoint(
+                md_runner, self.checkpoint_file, n_steps=self.n_steps, completed=True
+            )
+
+        streamed = {}
+        if isinstance(md_observer, StreamingTrajectoryObserver):
+            streamed = {
+                "trajectory_file": str(Path(md_observer.filename).absolute()),
+                "n_frames": md_observer.n_frames,
+            }
+        elif self.traj_file is not None:
             md_observer.save(filename=self.traj_file, fmt=self.traj_file_fmt)
 
         mol_or_struct = AseAtomsAdaptor.get_structure(
@@ -391,6 +646,7 @@ class AseMDMaker(AseMaker, metaclass=ABCMeta):
             trajectory=md_observer.to_pymatgen_trajectory(filename=None),
             dir_name=os.getcwd(),
             elapsed_time=t_f - t_i,
+            **streamed,
         )
 
     @property
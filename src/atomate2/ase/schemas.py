@@ -33,6 +33,7 @@ _task_doc_translation_keys = {
     "is_force_converged",
     "energy_downhill",
     "tags",
+    "trajectory_file",
 }
 
 
@@ -51,6 +52,22 @@ class AseResult(BaseModel):
         None, description="The relaxation or molecular dynamics trajectory."
     )
 
+    trajectory_file: str | None = Field(
+        None,
+        description=(
+            "Path to the trajectory file written while the calculation ran. "
+            "If set, `trajectory` only holds the first and last frames."
+        ),
+    )
+
+    n_frames: int | None = Field(
+        None,
+        description=(
+            "Total number of trajectory frames, if larger than the number of "
+            "frames in `trajectory`."
+        ),
+    )
+
     is_force_converged: bool | None = Field(
         None,
         description=(
@@ -232,6 +249,11 @@ class AseStructureTaskDoc(StructureMetadata):
 
     tags: list[str] | None = Field(None, description="List of tags for the task.")
 
+    trajectory_file: str | None = Field(
+        None,
+        description="Path to the trajectory file, if it was written during the run.",
+    )
+
     @classmethod
     def from_ase_task_doc(
         cls, ase_task_doc: AseTaskDoc, **task_document_kwargs
@@ -298,6 +320,11 @@ class AseMoleculeTaskDoc(MoleculeMetadata):
 
     tags: list[str] | None = Field(None, description="List of tags for the task.")
 
+    trajectory_file: str | None = Field(
+        None,
+        description="Path to the trajectory file, if it was written during the run.",
+    )
+
 
 class AseTaskDoc(AseBaseModel):
     """Document containing information on generic ASE jobs."""
@@ -341,6 +368,11 @@ class AseTaskDoc(AseBaseModel):
 
     tags: list[str] | None = Field(None, description="A list of tags for the task.")
 
+    trajectory_file: str | None = Field(
+        None,
+        description="Path to the trajectory file, if it was written during the run.",
+    )
+
     @classmethod
     def from_ase_compatible_result(
         cls,
@@ -445,6 +477,8 @@ class AseTaskDoc(AseBaseModel):
             output_mol_or_struct = input_mol_or_struct
         else:
             output_mol_or_struct = result.final_mol_or_struct
+            # frames streamed to disk are not all held in `trajectory`
+            n_steps = result.n_frames or n_steps
 
         if trajectory is None:
             final_energy = result.final_energy
@@ -459,7 +493,7 @@ class AseTaskDoc(AseBaseModel):
 
             ionic_steps = []
             if ionic_step_data is not None and len(ionic_step_data) > 0:
-                for idx in range(n_steps):
+                for idx in range(len(trajectory)):
                     _ionic_step_data = {
                         key: (
                             trajectory.frame_properties[idx].get(key)
@@ -498,11 +532,12 @@ class AseTaskDoc(AseBaseModel):
                     ionic_steps.append(ionic_step)
 
         objects: dict[AseObject, Any] = {}
-        if store_trajectory != StoreTrajectoryOption.NO:
+        if store_trajectory != StoreTrajectoryOption.NO and not result.trajectory_file:
             # For VASP calculations, the PARTIAL trajectory option removes
             # electronic step info. There is no equivalent for classical
             # forcefields, so we just save the same info for FULL and
             # PARTIAL options.
+            # Trajectories streamed to disk are referenced by `trajectory_file`.
             objects[AseObject.TRAJECTORY] = trajectory  # type: ignore[index]
 
         output_doc = OutputDoc(
@@ -527,6 +562,7 @@ class AseTaskDoc(AseBaseModel):
             energy_downhill=result.energy_downhill,
             dir_name=result.dir_name,
             tags=tags,
+            trajectory_file=result.trajectory_file,
             **task_document_kwargs,
         )
 
@@ -7,11 +7,16 @@ import io
 import os
 import sys
 import time
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import numpy as np
 from ase import Atoms
-from ase.calculators.calculator import PropertyNotImplementedError
+from ase.calculators.calculator import (
+    Calculator,
+    PropertyNotImplementedError,
+    all_changes,
+)
 from ase.calculators.singlepoint import SinglePointCalculator
 from ase.constraints import FixSymmetry
 from ase.filters import FrechetCellFilter
@@ -27,13 +32,14 @@ from pymatgen.io.ase import AseAtomsAdaptor
 from atomate2.ase.schemas import AseResult
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from os import PathLike
-    from typing import Literal
+    from typing import Any, Literal
 
-    from ase.calculators.calculator import Calculator
     from ase.filters import Filter
-    from ase.io.trajectory import TrajectoryReader
+    from ase.io.trajectory import TrajectoryReader, TrajectoryWriter
     from ase.optimize.optimize import Optimizer
+    from typing_extensions import Self
 
 OPTIMIZERS = {
     "FIRE": FIRE,
@@ -46,19 +52,179 @@ OPTIMIZERS = {
     "BFGSLineSearch": BFGSLineSearch,
 }
 
+_LINE_SEARCH_OPTIMIZERS = (BFGSLineSearch, LBFGSLineSearch, SciPyFminBFGS, SciPyFminCG)
+
+
+class _FrameBuffer:
+    """Contiguous storage for a per-frame quantity of fixed shape.
+
+    Frames are stored in a single preallocated float array which is grown
+    geometrically when full, rather than as a list of small arrays.
+    The frame shape is set by the first appended frame.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self._capacity = max(capacity, 1)
+        self._data: np.ndarray | None = None
+        self._n_frames = 0
+
+    def append(self, value: float | np.ndarray) -> None:
+        """Append a frame, growing the storage if needed."""
+        value = np.asarray(value, dtype=float)
+        if self._data is None:
+            self._data = np.empty((self._capacity, *value.shape))
+        elif self._n_frames == len(self._data):
+            data = np.empty((2 * len(self._data), *self._data.shape[1:]))
+            data[: self._n_frames] = self._data
+            self._data = data
+        self._data[self._n_frames] = value
+        self._n_frames += 1
+
+    @property
+    def array(self) -> np.ndarray:
+        """View of the stored frames, with shape (n_frames, *frame_shape)."""
+        if self._data is None:
+            return np.empty(0)
+        return self._data[: self._n_frames]
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes allocated for the buffer."""
+        return 0 if self._data is None else self._data.nbytes
+
+    def retain(self, indices: Sequence[int]) -> None:
+        """Keep only the given frames, in order, without freeing the storage."""
+        if self._data is not None:
+            self._data[: len(indices)] = self._data[list(indices)]
+            self._n_frames = len(indices)
+
+    def tolist(self) -> list:
+        """Convert the stored frames to (nested) lists."""
+        return self.array.tolist()
+
+    def __len__(self) -> int:
+        """Get the number of stored frames."""
+        return self._n_frames
+
+    def __getitem__(self, idx: int | slice) -> np.ndarray:
+        """Get one or more stored frames."""
+        return self.array[idx]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """Iterate over the stored frames."""
+        return iter(self.array)
+
+
+class _FrameView(Sequence):
+    """Read-only sequence of the frames stored in a frame buffer.
+
+    The view does not copy the frames: indexing returns floats for scalar
+    quantities and read-only arrays otherwise. Frames recorded after the view was
+    created are not part of it.
+    """
+
+    def __init__(self, buffer: _FrameBuffer) -> None:
+        self._array = buffer.array.view()
+        self._array.flags.writeable = False
+
+    def __len__(self) -> int:
+        """Get the number of frames."""
+        return len(self._array)
+
+    def __getitem__(self, idx: int | slice) -> Any:
+        """Get one or more frames."""
+        if isinstance(idx, slice):
+            return (
+                self._array[idx].tolist()
+                if self._array.ndim == 1
+                else list(self._array[idx])
+            )
+        return self._array[idx].item() if self._array.ndim == 1 else self._array[idx]
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        """Get the frames as a read-only array."""
+        array = self._array if dtype is None else self._array.astype(dtype)
+        return array.copy() if copy else array
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the frames with another sequence of frames."""
+        if not isinstance(other, Sequence) or len(other) != len(self):
+            return False
+        return bool(np.array_equal(self._array, np.asarray(other)))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Get the frames as a string."""
+        return f"{type(self).__name__}({self[:]!r})"
+
+
+class _FrameList:
+    """Expose a frame buffer of a TrajectoryObserver as a sequence of frames.
+
+    Reading the attribute returns a read-only :obj:`_FrameView` of the stored
+    frames, so that in-place changes fail rather than being silently lost.
+    Assigning a sequence of frames replaces the stored frames.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._buffer_name = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        return _FrameView(getattr(obj, self._buffer_name))
+
+    def __set__(self, obj: Any, frames: Sequence) -> None:
+        buffer = _FrameBuffer(len(frames))
+        for frame in frames:
+            buffer.append(frame)
+        setattr(obj, self._buffer_name, buffer)
+
 
 class TrajectoryObserver:
     """Trajectory observer.
 
     This is a hook in the relaxation process that saves the intermediate structures.
+
+    Each quantity is stored in a contiguous float64 array which is preallocated
+    for ``n_frames`` frames and grown geometrically beyond that. For N atoms,
+    one frame takes 8 * (6N + 16) bytes (energy, forces, stress, positions, cell),
+    plus 8 * (3N + 1) bytes for MD runs (velocities, temperature) and 8N bytes
+    (24N for non-collinear calculations) if magnetic moments are available.
+    A 1000-atom MD frame thus needs about 72 kB.
+
+    The ``energies``, ``forces``, ``stresses``, ``magmoms``, ``atom_positions``,
+    ``cells``, ``velocities`` and ``temperatures`` attributes are read-only
+    sequences of frames rather than lists: they can be indexed, iterated and
+    converted with ``list()`` or ``np.asarray()`` without copying the trajectory,
+    but appending to them or changing frames in place raises an error. Assigning a
+    new sequence of frames replaces the stored frames.
     """
 
-    def __init__(self, atoms: Atoms, store_md_outputs: bool = False) -> None:
+    energies = _FrameList()
+    forces = _FrameList()
+    stresses = _FrameList()
+    magmoms = _FrameList()
+    atom_positions = _FrameList()
+    cells = _FrameList()
+    velocities = _FrameList()
+    temperatures = _FrameList()
+
+    def __init__(
+        self,
+        atoms: Atoms,
+        store_md_outputs: bool = False,
+        n_frames: int | None = None,
+    ) -> None:
         """Initialize the Observer.
 
         Parameters
         ----------
         atoms (Atoms): the structure to observe.
+        store_md_outputs (bool): whether to also store velocities and temperatures.
+        n_frames (int or None): the expected number of frames, used to preallocate
+            storage. More frames can be stored at the cost of reallocations.
 
         Returns
         -------
@@ -66,8 +232,9 @@ class TrajectoryObserver:
         """
         self.atoms = atoms
         self._is_periodic = any(atoms.pbc)
-        self.energies: list[float] = []
-        self.forces: list[np.ndarray] = []
+        capacity = n_frames or 1
+        self._energies = _FrameBuffer(capacity)
+        self._forces = _FrameBuffer(capacity)
 
         self._calc_kwargs = {
             "stress": (
@@ -77,46 +244,65 @@ class TrajectoryObserver:
             "velocities": False,
             "temperature": False,
         }
-        self.stresses: list[np.ndarray] = []
+        self._stresses = _FrameBuffer(capacity)
 
-        self.magmoms: list[np.ndarray] = []
+        self._magmoms = _FrameBuffer(capacity)
 
-        self.atom_positions: list[np.ndarray] = []
-        self.cells: list[np.ndarray] = []
+        self._atom_positions = _FrameBuffer(capacity)
+        self._cells = _FrameBuffer(capacity)
 
         self._store_md_outputs = store_md_outputs
         if store_md_outputs:
             self._calc_kwargs |= dict(velocities=True, temperature=True)
         # `self.{velocities,temperatures}` always initialized,
         # but data is only stored / saved to trajectory for MD runs
-        self.velocities: list[np.ndarray] = []
-        self.temperatures: list[float] = []
+        self._velocities = _FrameBuffer(capacity)
+        self._temperatures = _FrameBuffer(capacity)
 
     def __call__(self) -> None:
         """Save the properties of an Atoms during the relaxation."""
-        self.energies.append(self.compute_energy())
-        self.forces.append(self.atoms.get_forces())
+        self._energies.append(self.compute_energy())
+        self._forces.append(self.atoms.get_forces())
         # MD needs kinetic energy parts of stress, relaxations do not
         # When _store_md_outputs is True, ideal gas contribution to
         # stress is included.
         # Only store stress for periodic systems.
         if self._calc_kwargs["stress"]:
-            self.stresses.append(
+            self._stresses.append(
                 self.atoms.get_stress(include_ideal_gas=self._store_md_outputs)
             )
 
         if self._calc_kwargs["magmoms"]:
             try:
-                self.magmoms.append(self.atoms.get_magnetic_moments())
+                self._magmoms.append(self.atoms.get_magnetic_moments())
             except PropertyNotImplementedError:
                 self._calc_kwargs["magmoms"] = False
 
-        self.atom_positions.append(self.atoms.get_positions())
-        self.cells.append(self.atoms.get_cell()[:])
+        self._atom_positions.append(self.atoms.get_positions())
+        self._cells.append(self.atoms.get_cell()[:])
 
         if self._store_md_outputs:
-            self.velocities.append(self.atoms.get_velocities())
-            self.temperatures.append(self.atoms.get_temperature())
+            self._velocities.append(self.atoms.get_velocities())
+            self._temperatures.append(self.atoms.get_temperature())
+
+    @property
+    def _buffers(self) -> tuple[_FrameBuffer, ...]:
+        """All per-frame buffers of the observer."""
+        return (
+            self._energies,
+            self._forces,
+            self._stresses,
+            self._magmoms,
+            self._atom_positions,
+            self._cells,
+            self._velocities,
+            self._temperatures,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes allocated to store the trajectory."""
+        return sum(buffer.nbytes for buffer in self._buffers)
 
     def compute_energy(self) -> float:
         """
@@ -150,6 +336,27 @@ class TrajectoryObserver:
         elif fmt == "ase":
             self.to_ase_trajectory(filename=filename)
 
+    def _frame_to_atoms(self, idx: int) -> Atoms:
+        """Get a stored frame as an Atoms object with its computed properties."""
+        atoms = self.atoms.copy()
+        atoms.set_positions(self._atom_positions[idx])
+        atoms.set_cell(self._cells[idx])
+
+        if self._store_md_outputs:
+            atoms.set_velocities(self._velocities[idx])
+
+        kwargs = {
+            "energy": self._energies[idx],
+            "forces": self._forces[idx],
+        }
+        if self._calc_kwargs["stress"]:
+            kwargs["stress"] = self._stresses[idx]
+        if self._calc_kwargs["magmoms"]:
+            kwargs["magmom"] = self._magmoms[idx]
+
+        atoms.calc = SinglePointCalculator(atoms=atoms, **kwargs)
+        return atoms
+
     def to_ase_trajectory(
         self, filename: str | None = "atoms.traj"
     ) -> TrajectoryReader:
@@ -162,26 +369,9 @@ class TrajectoryObserver:
             Name of the file to write the ASE trajectory to.
             If None, no file is written.
         """
-        for idx in range(len(self.cells)):
-            atoms = self.atoms.copy()
-            atoms.set_positions(self.atom_positions[idx])
-            atoms.set_cell(self.cells[idx])
-
-            if self._store_md_outputs:
-                atoms.set_velocities(self.velocities[idx])
-
-            kwargs = {
-                "energy": self.energies[idx],
-                "forces": self.forces[idx],
-            }
-            if self._calc_kwargs["stress"]:
-                kwargs["stress"] = self.stresses[idx]
-            if self._calc_kwargs["magmoms"]:
-                kwargs["magmom"] = self.magmoms[idx]
-
-            atoms.calc = SinglePointCalculator(atoms=atoms, **kwargs)
-            with AseTrajectory(filename, "a" if idx > 0 else "w", atoms=atoms) as file:
-                file.write()
+        with AseTrajectory(filename, "w") as file:
+            for idx in range(len(self._cells)):
+                file.write(self._frame_to_atoms(idx))
 
         return AseTrajectory(filename, "r")
 
@@ -207,51 +397,51 @@ class TrajectoryObserver:
             if self._calc_kwargs[k]:
                 frame_property_keys += [k]
 
-        to_singular = {"energies": "energy", "stresses": "stress"}
-
-        traj = self.as_dict() if hasattr(self, "as_dict") else self.__dict__
-
-        n_md_steps = len(traj["cells"])
-        species = AseAtomsAdaptor.get_structure(
-            traj["atoms"], cls=Structure if self._is_periodic else Molecule
-        ).species
-
-        if self._is_periodic:
-            frames = [
-                Structure(
-                    lattice=traj["cells"][idx],
-                    coords=traj["atom_positions"][idx],
-                    species=species,
-                    coords_are_cartesian=True,
-                )
-                for idx in range(n_md_steps)
-            ]
-        else:
-            frames = [
-                Molecule(
-                    species,
-                    coords=traj["atom_positions"][idx],
-                    charge=getattr(traj["atoms"], "charge", 0),
-                    spin_multiplicity=getattr(traj["atoms"], "spin_multiplicity", None),
-                )
-                for idx in range(n_md_steps)
-            ]
+        buffers = {
+            "energy": self._energies,
+            "forces": self._forces,
+            "stress": self._stresses,
+            "magmoms": self._magmoms,
+            "velocities": self._velocities,
+            "temperature": self._temperatures,
+        }
+        n_md_steps = len(self._cells)
 
+        # frame properties are converted to lists in one pass per quantity
+        property_values = {key: buffers[key].tolist() for key in frame_property_keys}
         frame_properties = [
-            {
-                to_singular.get(key, key): traj[key][idx]
-                for key in frame_property_keys
-                if key in traj
-            }
+            {key: values[idx] for key, values in property_values.items()}
             for idx in range(n_md_steps)
         ]
 
-        traj_method = "from_structures" if self._is_periodic else "from_molecules"
-        pmg_traj = getattr(PmgTrajectory, traj_method)(
-            frames,
-            frame_properties=frame_properties,
-            constant_lattice=False,
-        )
+        # Coordinates and lattices are passed to pymatgen as arrays,
+        # without constructing an intermediate Structure / Molecule per frame.
+        if self._is_periodic:
+            species = AseAtomsAdaptor.get_structure(self.atoms, cls=Structure).species
+            lattices = self._cells.array
+            pmg_traj = PmgTrajectory(
+                species=species,
+                coords=np.matmul(self._atom_positions.array, np.linalg.inv(lattices)),
+                lattice=lattices,
+                site_properties=[{} for _ in range(n_md_steps)],
+                frame_properties=frame_properties,
+                constant_lattice=False,
+            )
+        else:
+            molecule = Molecule(
+                AseAtomsAdaptor.get_structure(self.atoms, cls=Molecule).species,
+                coords=self._atom_positions[0],
+                charge=getattr(self.atoms, "charge", 0),
+                spin_multiplicity=getattr(self.atoms, "spin_multiplicity", None),
+            )
+            pmg_traj = PmgTrajectory(
+                species=molecule.species,
+                coords=self._atom_positions.array,
+                charge=int(molecule.charge),
+                spin_multiplicity=int(molecule.spin_multiplicity),
+                site_properties=[{} for _ in range(n_md_steps)],
+                frame_properties=frame_properties,
+            )
 
         if filename:
             if file_format == "pmg":
@@ -264,29 +454,116 @@ class TrajectoryObserver:
     def as_dict(self) -> dict:
         """Make JSONable dict representation of the Trajectory."""
         traj_dict = {
-            "energy": self.energies,
-            "forces": self.forces,
-            "stress": self.stresses,
-            "atom_positions": self.atom_positions,
-            "cells": self.cells,
+            "energy": self._energies,
+            "forces": self._forces,
+            "stress": self._stresses,
+            "atom_positions": self._atom_positions,
+            "cells": self._cells,
             "atoms": self.atoms,
             "atomic_number": self.atoms.get_atomic_numbers(),
         }
 
         if self._calc_kwargs["magmoms"]:
-            traj_dict["magmoms"] = self.magmoms
+            traj_dict["magmoms"] = self._magmoms
 
         if self._store_md_outputs:
-            traj_dict.update(velocities=self.velocities, temperature=self.temperatures)
+            traj_dict.update(
+                velocities=self._velocities, temperature=self._temperatures
+            )
         # sanitize dict
         for key, value in traj_dict.items():
-            if all(isinstance(val, np.ndarray) for val in value):
-                traj_dict[key] = [val.tolist() for val in value]
-            elif isinstance(value, np.ndarray):
+            if isinstance(value, _FrameBuffer | np.ndarray):
                 traj_dict[key] = value.tolist()
         return traj_dict
 
 
+class StreamingTrajectoryObserver(TrajectoryObserver):
+    """Trajectory observer which writes frames to disk while the run progresses.
+
+    Frames are appended to an ASE .Trajectory file, an append-only binary format
+    with a frame index, every ``chunk_size`` frames. Only the first and the most
+    recent frame are kept in memory after each flush, so that memory use is
+    bounded by the chunk size rather than the length of the run. As the file
+    header is updated after every frame, the frames already written remain
+    readable if the run is interrupted.
+    """
+
+    def __init__(
+        self,
+        atoms: Atoms,
+        filename: str | PathLike,
+        chunk_size: int = 100,
+        store_md_outputs: bool = False,
+    ) -> None:
+        """Initialize the Observer.
+
+        Parameters
+        ----------
+        atoms (Atoms): the structure to observe.
+        filename (str or PathLike): the ASE trajectory file to write frames to.
+        chunk_size (int): the number of frames to buffer before writing to disk.
+        store_md_outputs (bool): whether to also store velocities and temperatures.
+
+        Returns
+        -------
+            None
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+        super().__init__(
+            atoms, store_md_outputs=store_md_outputs, n_frames=chunk_size + 2
+        )
+        self.filename = str(filename)
+        self.chunk_size = chunk_size
+        self.n_frames_written = 0
+        # number of leading frames in memory which are already on disk
+        self._n_flushed = 0
+        self._writer: TrajectoryWriter | None = None
+
+    def __call__(self) -> None:
+        """Save the properties of an Atoms and flush full chunks to disk."""
+        super().__call__()
+        if len(self._cells) - self._n_flushed >= self.chunk_size:
+            self.flush()
+
+    @property
+    def n_frames(self) -> int:
+        """Total number of observed frames, both on disk and in memory."""
+        return self.n_frames_written + len(self._cells) - self._n_flushed
+
+    def flush(self) -> None:
+        """Write buffered frames to disk, keeping the first and latest in memory."""
+        n_buffered = len(self._cells)
+        if n_buffered == self._n_flushed:
+            return
+        if self._writer is None:
+            self._writer = AseTrajectory(self.filename, "w")
+        for idx in range(self._n_flushed, n_buffered):
+            self._writer.write(self._frame_to_atoms(idx))
+        self.n_frames_written += n_buffered - self._n_flushed
+
+        keep = [0, n_buffered - 1] if n_buffered > 1 else [0]
+        for buffer in self._buffers:
+            if len(buffer) == n_buffered:
+                buffer.retain(keep)
+        self._n_flushed = len(keep)
+
+    def close(self) -> None:
+        """Flush the remaining frames and close the trajectory file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> Self:
+        """Enter a context which closes the trajectory file on exit."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the trajectory file."""
+        self.close()
+
+
 class AseRelaxer:
     """Relax a structure using the Atomic Simulation Environment."""
 
@@ -373,7 +650,7 @@ class AseRelaxer:
             atoms.set_constraint(FixSymmetry(atoms, symprec=self.symprec))
         atoms.calc = self.calculator
         with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
-            obs = TrajectoryObserver(atoms)
+            obs = TrajectoryObserver(atoms, n_frames=steps // interval + 2)
             if self.relax_cell and (not is_mol):
                 atoms = cell_filter(atoms)
             optimizer = self.opt_class(atoms, **kwargs)
@@ -413,3 +690,249 @@ class AseRelaxer:
             dir_name=os.getcwd(),
             elapsed_time=t_f - t_i,
         )
+
+
+class _BatchResultsCalculator(Calculator):
+    """Serve properties computed for a whole batch of structures at once.
+
+    The results are set externally by :obj:`AseBatchRelaxer` after every batched
+    evaluation. Requesting properties for a different configuration is an error.
+    """
+
+    def __init__(self, calculator: Calculator) -> None:
+        super().__init__()
+        self.implemented_properties = list(calculator.implemented_properties)
+
+    def set_results(self, atoms: Atoms, results: dict[str, Any]) -> None:
+        """Store the results of the calculation for atoms."""
+        self.atoms = atoms.copy()
+        self.results = dict(results)
+
+    def calculate(
+        self,
+        atoms: Atoms | None = None,
+        properties: Sequence[str] | None = None,
+        system_changes: Sequence[str] = all_changes,
+    ) -> None:
+        """Raise an error if the configuration was not evaluated in the batch."""
+        if system_changes:
+            raise RuntimeError(
+                "Properties were requested for a configuration that was not "
+                "evaluated in the current batch."
+            )
+
+
+class AseBatchRelaxer(AseRelaxer):
+    """Relax several structures in lockstep using a shared calculator.
+
+    At every optimizer step, the energies, forces and stresses of all structures
+    which are not yet converged are evaluated together. By default, this is done
+    with the shared calculator one structure at a time, which avoids reloading the
+    calculator but not the individual model calls. A ``batch_calculate`` function
+    can be supplied to evaluate all structures in a single (batched) model call.
+    Converged structures are removed from the batch.
+    """
+
+    def __init__(
+        self,
+        calculator: Calculator,
+        optimizer: Optimizer | str = "FIRE",
+        relax_cell: bool = True,
+        fix_symmetry: bool = False,
+        symprec: float = 1e-2,
+        batch_calculate: Callable[[list[Atoms], list[str]], list[dict]] | None = None,
+    ) -> None:
+        """Initialize the Relaxer.
+
+        Parameters
+        ----------
+        calculator (ase Calculator): an ase calculator
+        optimizer (str or ase Optimizer): the optimization algorithm.
+        relax_cell (bool): if True, cell parameters will be optimized.
+        fix_symmetry (bool): if True, symmetry will be fixed during relaxation.
+        symprec (float): Tolerance for symmetry finding in case of fix_symmetry.
+        batch_calculate (callable or None): a function taking a list of atoms and
+            a list of properties, and returning a dict of results for each of the
+            atoms. If None, the atoms are evaluated one at a time.
+        """
+        super().__init__(
+            calculator,
+            optimizer=optimizer,
+            relax_cell=relax_cell,
+            fix_symmetry=fix_symmetry,
+            symprec=symprec,
+        )
+        if self.opt_class in _LINE_SEARCH_OPTIMIZERS:
+            raise ValueError(
+                "Line-search optimizers evaluate trial configurations and cannot be "
+                "run in a batch."
+            )
+        self.batch_calculate = batch_calculate or self._serial_calculate
+
+    def _serial_calculate(
+        self, atoms_list: list[Atoms], properties: list[str]
+    ) -> list[dict]:
+        """Evaluate each of the atoms with the shared calculator."""
+        results = []
+        for atoms in atoms_list:
+            result = {}
+            for prop in properties:
+                if prop == "stress" and not any(atoms.pbc):
+                    continue
+                try:
+                    result[prop] = self.calculator.get_property(prop, atoms)
+                except PropertyNotImplementedError:
+                    continue
+            results.append(result)
+        return results
+
+    def _evaluate(self, members: list[dict]) -> None:
+        """Evaluate all members of the batch in one call."""
+        properties = ["energy", "forces", "stress", "magmoms"]
+        properties = [
+            prop
+            for prop in properties
+            if prop in self.calculator.implemented_properties
+        ]
+        atoms_list = [member["atoms"] for member in members]
+        results = self.batch_calculate(atoms_list, properties)
+        for atoms, result in zip(atoms_list, results, strict=True):
+            if not any(atoms.pbc):
+                result.pop("stress", None)
+            atoms.calc.set_results(atoms, result)
+
+    def relax(  # type: ignore[override]
+        self,
+        atoms: Sequence[Atoms | Structure | Molecule],
+        fmax: float = 0.1,
+        steps: int = 500,
+        final_atoms_object_file: str | None = "final_atoms_object.xyz",
+        interval: int = 1,
+        verbose: bool = False,
+        cell_filter: Filter = FrechetCellFilter,
+        **kwargs,
+    ) -> list[AseResult]:
+        """
+        Relax several molecules or structures.
+
+        Parameters
+        ----------
+        atoms : list of ASE Atoms, pymatgen Structure, or pymatgen Molecule
+            The atoms for relaxation.
+        fmax : float
+            Total force tolerance for relaxation convergence.
+        steps : int
+            Max number of steps for relaxation.
+        final_atoms_object_file: str
+            The file to append the final atoms objects to.
+        interval : int
+            The step interval for saving the trajectories.
+        verbose : bool
+            If True, screen output will be shown.
+        **kwargs
+            Further kwargs passed to the optimizer.
+
+        Returns
+        -------
+            list of AseResult, in the same order as the input atoms
+        """
+        members = []
+        for input_atoms in atoms:
+            is_mol = isinstance(input_atoms, Molecule) or (
+                isinstance(input_atoms, Atoms)
+                and all(not pbc for pbc in input_atoms.pbc)
+            )
+            _atoms = (
+                self.ase_adaptor.get_atoms(input_atoms)
+                if isinstance(input_atoms, Structure | Molecule)
+                else input_atoms.copy()
+            )
+            if self.fix_symmetry:
+                _atoms.set_constraint(FixSymmetry(_atoms, symprec=self.symprec))
+            _atoms.calc = _BatchResultsCalculator(self.calculator)
+            members.append({"atoms": _atoms, "is_mol": is_mol})
+
+        with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+            t_i = time.perf_counter()
+            self._evaluate(members)
+            for member in members:
+                member["observer"] = TrajectoryObserver(
+                    member["atoms"], n_frames=steps // interval + 2
+                )
+                opt_atoms = (
+                    cell_filter(member["atoms"])
+                    if self.relax_cell and not member["is_mol"]
+                    else member["atoms"]
+                )
+                optimizer = self.opt_class(opt_atoms, **kwargs)
+                optimizer.attach(member["observer"], interval=interval)
+                optimizer.fmax = fmax
+                optimizer.call_observers()
+                member.update(optimizable=opt_atoms, optimizer=optimizer)
+
+            active = [
+                member for member in members if not self._is_converged(member, fmax)
+            ]
+            for member in members:
+                if member not in active:
+                    member["elapsed_time"] = time.perf_counter() - t_i
+
+            # Static calculations (steps <= 1) only need the initial evaluation,
+            # see the corresponding workaround in AseTaskDoc.
+            max_steps = steps if steps > 1 else 0
+            n_steps = 0
+            while active and n_steps < max_steps:
+                for member in active:
+                    member["optimizer"].step()
+                self._evaluate(active)
+                n_steps += 1
+
+                still_active = []
+                for member in active:
+                    member["optimizer"].nsteps += 1
+                    member["optimizer"].call_observers()
+                    if self._is_converged(member, fmax):
+                        member["elapsed_time"] = time.perf_counter() - t_i
+                    else:
+                        still_active.append(member)
+                active = still_active
+
+            for member in active:
+                member["elapsed_time"] = time.perf_counter() - t_i
+            for member in members:
+                member["observer"]()
+
+        results = []
+        for member in members:
+            struct = self.ase_adaptor.get_structure(
+                member["atoms"], cls=Molecule if member["is_mol"] else Structure
+            )
+            traj = member["observer"].to_pymatgen_trajectory(None)
+            if final_atoms_object_file is not None:
+                write(
+                    final_atoms_object_file,
+                    member["atoms"],
+                    format="extxyz",
+                    append=True,
+                )
+            results.append(
+                AseResult(
+                    final_mol_or_struct=struct,
+                    trajectory=traj,
+                    is_force_converged=all(
+                        np.linalg.norm(force) < abs(fmax)
+                        for force in traj.frame_properties[-1]["forces"]
+                    ),
+                    energy_downhill=traj.frame_properties[-1]["energy"]
+                    < traj.frame_properties[0]["energy"],
+                    dir_name=os.getcwd(),
+                    elapsed_time=member["elapsed_time"],
+                )
+            )
+        return results
+
+    @staticmethod
+    def _is_converged(member: dict, fmax: float) -> bool:
+        """Check whether the (generalized) forces on a member are converged."""
+        forces = member["optimizable"].get_forces()
+        return bool((forces**2).sum(axis=1).max() < fmax**2)
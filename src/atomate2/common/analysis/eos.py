@@ -0,0 +1,329 @@
+"""Tools for fitting equations of state to several datasets."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pymatgen.analysis.eos import EOS, EOSBase, EOSError
+from scipy.optimize import leastsq
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+
+def birch_murnaghan_pressure(
+    volume: float | np.ndarray, b0: float, b1: float, v0: float
+) -> float | np.ndarray:
+    """
+    Compute pressure from Birch-Murnaghan equation of state.
+
+    Parameters
+    ----------
+    volume : float or np.ndarray
+        A single volume or array of them to evaluate the pressure.
+    b0 : float
+        The Birch-Murnaghan (BM) bulk modulus at the equilibrium volume V = v0
+    b1 : float
+        The derivative of the bulk modulus wrt pressure at v0
+    v0 : float
+        The equilibrium volume
+
+    Returns
+    -------
+    float or np.ndarray : the BM pressure
+
+    BM EOS for E(V) has the form::
+
+        E(V) = E0 + 9 B0 V0 / 16 * (
+            (B1 - 4)*eta**6 + (14 - 3*B1)*eta**4 + (3*B1 - 16)*eta**2 + 6 - B1
+        )
+        eta = (V0/V)**(1/3).
+
+    This function computes p = - dE / dV via the chain rule,::
+
+        p = d E / d eta * (- d eta / dV)
+        = eta**4/(3*V0) * d E / d eta
+
+    """
+    eta = (v0 / volume) ** (1.0 / 3.0)
+    return (
+        3
+        * b0
+        * eta**5
+        / 8.0
+        * (3 * (b1 - 4) * eta**4 + 2 * (14.0 - 3 * b1) * eta**2 + 3 * b1 - 16.0)
+    )
+
+
+def birch_murnaghan_pressure_jacobian(
+    volume: np.ndarray, b0: float, b1: float, v0: float
+) -> np.ndarray:
+    """
+    Compute the derivatives of the Birch-Murnaghan pressure wrt its parameters.
+
+    Parameters
+    ----------
+    volume : np.ndarray
+        The volumes to evaluate the derivatives at.
+    b0 : float
+        The Birch-Murnaghan (BM) bulk modulus at the equilibrium volume V = v0
+    b1 : float
+        The derivative of the bulk modulus wrt pressure at v0
+    v0 : float
+        The equilibrium volume
+
+    Returns
+    -------
+    np.ndarray
+        The derivatives wrt (b0, b1, v0), with shape (len(volume), 3).
+    """
+    eta = (v0 / np.asarray(volume)) ** (1.0 / 3.0)
+    poly = 3 * (b1 - 4) * eta**4 + 2 * (14.0 - 3 * b1) * eta**2 + 3 * b1 - 16.0
+    d_poly_d_eta = 12 * (b1 - 4) * eta**3 + 4 * (14.0 - 3 * b1) * eta
+    d_pressure_d_eta = 3 * b0 / 8.0 * (5 * eta**4 * poly + eta**5 * d_poly_d_eta)
+    return np.column_stack(
+        (
+            3 * eta**5 / 8.0 * poly,
+            3 * b0 * eta**5 / 8.0 * (3 * eta**4 - 6 * eta**2 + 3),
+            d_pressure_d_eta * eta / (3 * v0),
+        )
+    )
+
+
+def get_initial_pressure_fit(
+    volumes: Sequence[float],
+    pressures: Sequence[float],
+    energies: Sequence[float] | None = None,
+) -> list[float]:
+    """
+    Generate initial polynomial fit for p(V) curve.
+
+    ::
+        p(V) / V = a V**2 + b V + c
+
+    Parameters
+    ----------
+    volumes : Sequence of float
+        The volumes.
+    pressures : Sequence of float
+        The pressures at each volume.
+    energies : Sequence of float or None
+        The energies at each volume. If the polynomial has no suitable root, the
+        volume of lowest energy (or lowest absolute pressure if no energies are
+        given) is used as the initial equilibrium volume.
+
+    Returns
+    -------
+    list of float
+        The initial guess of (b0, b1, v0).
+    """
+    volumes = np.asarray(volumes)
+    pressures = np.asarray(pressures)
+    poly_pars = np.polyfit(volumes, pressures / volumes, deg=2)
+
+    def bulk_modulus(v0: np.ndarray) -> np.ndarray:
+        # B = -V dp/dV for p = a V**3 + b V**2 + c V
+        return -v0 * (3 * poly_pars[0] * v0**2 + 2 * poly_pars[1] * v0 + poly_pars[2])
+
+    # the equilibrium volume is a root of the polynomial with a positive bulk
+    # modulus, take the one closest to the data if there are two
+    radicand = poly_pars[1] ** 2 - 4.0 * poly_pars[0] * poly_pars[2]
+    roots = np.array([])
+    if radicand >= 0.0:
+        roots = (-poly_pars[1] + np.array([1, -1]) * radicand**0.5) / (
+            2.0 * poly_pars[0]
+        )
+        roots = roots[(roots > 0.0) & (bulk_modulus(roots) > 0.0)]
+
+    if len(roots) > 0:
+        v0 = roots[np.argmin(np.abs(roots - np.median(volumes)))]
+    else:
+        reference = np.abs(pressures) if energies is None else energies
+        v0 = volumes[np.argmin(reference)]
+
+    # B' = dB/dp = -V/B dB/dV
+    b0 = bulk_modulus(v0)
+    b1 = v0 * (9 * poly_pars[0] * v0**2 + 4 * poly_pars[1] * v0 + poly_pars[2]) / b0
+    return [float(b0), float(b1), float(v0)]
+
+
+def fit_pressure_eos(
+    volumes: Sequence[Sequence[float]],
+    pressures: Sequence[Sequence[float]],
+    energies: Sequence[Sequence[float] | None] | None = None,
+    warm_start: bool = True,
+) -> list[np.ndarray | None]:
+    """
+    Fit the Birch-Murnaghan p(V) equation of state to several datasets.
+
+    Each dataset is fitted by least squares using the analytic Jacobian. If
+    ``warm_start`` is set, the parameters fitted to the previous dataset are also
+    tried as a starting point, and used if they give a smaller initial residual
+    than the polynomial guess. Datasets should therefore be ordered such that
+    neighbouring datasets are similar, e.g., by temperature.
+
+    Parameters
+    ----------
+    volumes : Sequence of Sequence of float
+        The volumes of each dataset.
+    pressures : Sequence of Sequence of float
+        The pressures of each dataset.
+    energies : Sequence of (Sequence of float or None) or None
+        The energies of each dataset, only used for the initial guess.
+    warm_start : bool
+        Whether to start from the parameters of the previous dataset if closer.
+
+    Returns
+    -------
+    list of np.ndarray or None
+        The fitted (b0, b1, v0) of each dataset, or None if the fit failed.
+    """
+    energies = energies or [None] * len(volumes)
+
+    fitted: list[np.ndarray | None] = []
+    previous = None
+    for vols, press, ens in zip(volumes, pressures, energies, strict=True):
+        data = (np.asarray(vols, dtype=float), np.asarray(press, dtype=float))
+
+        guesses = [get_initial_pressure_fit(*data, ens)]
+        if warm_start and previous is not None:
+            guesses.append(previous)
+        guess = _get_best_guess(guesses, _pressure_residual, data)
+
+        params, ierr = leastsq(
+            _pressure_residual, guess, args=data, Dfun=_pressure_residual_jacobian
+        )
+        if ierr in (1, 2, 3, 4):
+            fitted.append(params)
+            previous = params
+        else:
+            fitted.append(None)
+    return fitted
+
+
+def _pressure_residual(
+    pars: Sequence, volumes: np.ndarray, pressures: np.ndarray
+) -> np.ndarray:
+    """Get the residuals of the Birch-Murnaghan pressure."""
+    return pressures - birch_murnaghan_pressure(volumes, *pars)
+
+
+def _pressure_residual_jacobian(
+    pars: Sequence, volumes: np.ndarray, _: np.ndarray
+) -> np.ndarray:
+    """Get the Jacobian of the residuals of the Birch-Murnaghan pressure."""
+    return -birch_murnaghan_pressure_jacobian(volumes, *pars)
+
+
+def fit_energy_eos(
+    volumes: Sequence[Sequence[float]],
+    energies: Sequence[Sequence[float]],
+    eos_models: Sequence[str],
+    warm_start: bool = True,
+) -> list[dict[str, dict]]:
+    """
+    Fit several E(V) equations of state to several datasets.
+
+    The equations of state are those implemented in :obj:`pymatgen.analysis.eos`.
+    The parabola fitted to each dataset is used as the starting point, as in
+    pymatgen. If ``warm_start`` is set, the parameters fitted to the previous
+    dataset with the same equation of state are also tried as a starting point,
+    and used if they give a smaller initial residual.
+
+    Parameters
+    ----------
+    volumes : Sequence of Sequence of float
+        The volumes of each dataset.
+    energies : Sequence of Sequence of float
+        The energies of each dataset.
+    eos_models : Sequence of str
+        The names of the equations of state to fit.
+    warm_start : bool
+        Whether to start from the parameters of the previous dataset if closer.
+
+    Returns
+    -------
+    list of dict
+        For each dataset, the results of each equation of state, with the fitted
+        parameters and bulk modulus in GPa, or the exception raised by the fit.
+    """
+    fitted: list[dict[str, dict]] = []
+    previous: dict[str, np.ndarray] = {}
+    for vols, ens in zip(volumes, energies, strict=True):
+        results: dict[str, dict] = {}
+        for eos_name in eos_models:
+            eos = EOS(eos_name=eos_name).model(np.array(vols), np.array(ens))
+            try:
+                params = _fit_energy_model(eos, previous.get(eos_name))
+            except EOSError as exc:
+                results[eos_name] = {"exception": str(exc)}
+                continue
+
+            if warm_start:
+                previous[eos_name] = params
+            results[eos_name] = {**eos.results, "b0 GPa": float(eos.b0_GPa)}
+        fitted.append(results)
+    return fitted
+
+
+def _fit_energy_model(eos: EOSBase, warm_start: np.ndarray | None = None) -> np.ndarray:
+    """
+    Fit a pymatgen equation of state, optionally from a warm start.
+
+    Parameters
+    ----------
+    eos : .EOSBase
+        The pymatgen equation of state, initialized with the data to fit.
+    warm_start : np.ndarray or None
+        Alternative starting parameters (e0, b0, b1, v0).
+
+    Returns
+    -------
+    np.ndarray
+        The fitted parameters.
+    """
+    if warm_start is None or type(eos).fit is not EOSBase.fit:
+        eos.fit()
+        return np.asarray(eos.eos_params)
+
+    # this also raises an EOSError if the minimum is outside of the volume range
+    guesses = [np.asarray(eos._initial_guess()), warm_start]  # noqa: SLF001
+
+    def residual(pars: Sequence, vols: np.ndarray, ens: np.ndarray) -> Any:
+        return ens - eos._func(vols, pars)  # noqa: SLF001
+
+    guess = _get_best_guess(guesses, residual, (eos.volumes, eos.energies))
+    params, ierr = leastsq(residual, guess, args=(eos.volumes, eos.energies))
+    eos.eos_params = eos._params = params  # noqa: SLF001
+    if ierr not in (1, 2, 3, 4):
+        raise EOSError("Optimal parameters not found")
+    return np.asarray(params)
+
+
+def _get_best_guess(
+    guesses: list, residual: Callable, args: tuple[np.ndarray, np.ndarray]
+) -> Sequence:
+    """
+    Get the starting point with the smallest sum of squared residuals.
+
+    Parameters
+    ----------
+    guesses : list
+        The candidate starting parameters, the first one is the default.
+    residual : Callable
+        The residual function, called as ``residual(guess, *args)``.
+    args : tuple of np.ndarray
+        The data to compute the residuals for.
+
+    Returns
+    -------
+    Sequence
+        The best starting parameters.
+    """
+    with np.errstate(all="ignore"):
+        costs = np.array([np.sum(residual(guess, *args) ** 2) for guess in guesses])
+    if not np.isfinite(costs).any():
+        return guesses[0]
+    return guesses[int(np.nanargmin(np.where(np.isfinite(costs), costs, np.nan)))]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from emmet.core.utils import jsanitize
@@ -9,6 +10,7 @@ from maggma.builders import Builder
 from monty.serialization import MontyDecoder
 from pymatgen.analysis.structure_matcher import StructureMatcher
 
+from atomate2.common.builders.utils import get_last_updated, get_updated_keys
 from atomate2.common.schemas.magnetism import MagneticOrderingsDocument
 
 if TYPE_CHECKING:
@@ -40,6 +42,10 @@ class MagneticOrderingsBuilder(Builder):
         Numerical length tolerance for structure equivalence. Default is 0.3
     structure_match_angle_tol : float
         Numerical angle tolerance in degrees for structure equivalence. Default is 5.
+    incremental : bool
+        Whether to only process formulas with tasks that were updated after the most
+        recent magnetic orderings document, based on the ``last_updated_field`` of
+        the stores. Default is False.
     **kwargs : dict
         Keyword arguments that will be passed to the Builder init.
     """
@@ -52,6 +58,7 @@ class MagneticOrderingsBuilder(Builder):
         structure_match_stol: float = 0.3,
         structure_match_ltol: float = 0.2,
         structure_match_angle_tol: float = 5,
+        incremental: bool = False,
         **kwargs,
     ) -> None:
         self.tasks = tasks
@@ -60,6 +67,7 @@ class MagneticOrderingsBuilder(Builder):
         self.structure_match_stol = structure_match_stol
         self.structure_match_ltol = structure_match_ltol
         self.structure_match_angle_tol = structure_match_angle_tol
+        self.incremental = incremental
 
         self.kwargs = kwargs
 
@@ -74,8 +82,9 @@ class MagneticOrderingsBuilder(Builder):
     def get_items(self) -> Iterator[list[dict]]:
         """Get all items to process into magnetic ordering documents.
 
-        This step does a first grouping by formula (which is fast) and then the magnetic
-        orderings are grouped by parent structure.
+        This step only groups the tasks by formula (which is fast). The grouping by
+        parent structure is performed in :obj:`process_item`, so that it can run in
+        parallel.
 
         Yields
         ------
@@ -90,9 +99,18 @@ class MagneticOrderingsBuilder(Builder):
         criteria = dict(self.query)
         criteria.update({"metadata.ordering": {"$exists": True}})
         self.logger.info("Grouping by formula...")
-        num_formulas = len(
-            self.tasks.distinct("output.formula_pretty", criteria=criteria)
-        )
+        if self.incremental:
+            formulas = get_updated_keys(
+                self.tasks,
+                self.magnetic_orderings,
+                "output.formula_pretty",
+                criteria,
+                self.logger,
+            )
+            criteria["output.formula_pretty"] = {"$in": formulas}
+        else:
+            formulas = self.tasks.distinct("output.formula_pretty", criteria=criteria)
+        num_formulas = len(formulas)
         results = self.tasks.groupby("output.formula_pretty", criteria=criteria)
 
         for n_formula, (keys, docs) in enumerate(results):
@@ -100,25 +118,9 @@ class MagneticOrderingsBuilder(Builder):
             self.logger.debug(
                 "Getting %s (Formula %d of %d)", formula, n_formula + 1, num_formulas
             )
-            decoded_docs = MontyDecoder().process_decoded(docs)
-            grouped_tasks = _group_orderings(
-                decoded_docs,
-                self.structure_match_ltol,
-                self.structure_match_stol,
-                self.structure_match_angle_tol,
-            )
-            n_groups = len(grouped_tasks)
-            for n_group, group in enumerate(grouped_tasks):
-                self.logger.debug(
-                    "Found %d tasks for %s (Parent structure %d of %d)",
-                    len(group),
-                    formula,
-                    n_group + 1,
-                    n_groups,
-                )
-                yield group
-
-    def process_item(self, tasks: list[dict]) -> list[MagneticOrderingsDocument]:
+            yield docs
+
+    def process_item(self, tasks: list[dict]) -> list[dict]:
         """Process magnetic ordering relaxation/static calculations into documents.
 
         The magnetic ordering tasks will be grouped based on their parent structure
@@ -132,30 +134,56 @@ class MagneticOrderingsBuilder(Builder):
 
         Returns
         -------
-        list of .MagneticOrderingsDocument
-            A list of magnetic ordering documents (one for each unique parent
-            structure).
+        list of dict
+            A list of serialized magnetic ordering documents (one for each unique
+            parent structure).
         """
-        self.logger.debug("Processing %s", tasks[0]["output"].formula_pretty)
-
         if not tasks:
             return []
 
-        return jsanitize(
-            MagneticOrderingsDocument.from_tasks(tasks).model_dump(),
-            allow_bson=True,
+        last_updated_field = self.tasks.last_updated_field
+        tasks = MontyDecoder().process_decoded(tasks)
+        formula = tasks[0]["output"].formula_pretty
+        self.logger.debug("Processing %s", formula)
+
+        grouped_tasks = _group_orderings(
+            tasks,
+            self.structure_match_ltol,
+            self.structure_match_stol,
+            self.structure_match_angle_tol,
         )
+        n_groups = len(grouped_tasks)
+        docs = []
+        for n_group, group in enumerate(grouped_tasks):
+            self.logger.debug(
+                "Found %d tasks for %s (Parent structure %d of %d)",
+                len(group),
+                formula,
+                n_group + 1,
+                n_groups,
+            )
+            doc = jsanitize(
+                MagneticOrderingsDocument.from_tasks(group).model_dump(),
+                allow_bson=True,
+            )
+            last_updated = get_last_updated(group, last_updated_field)
+            if last_updated is not None:
+                doc[self.magnetic_orderings.last_updated_field] = last_updated
+            docs.append(doc)
+        return docs
 
-    def update_targets(self, items: list[MagneticOrderingsDocument]) -> None:
+    def update_targets(self, items: list[list[dict]]) -> None:
         """Insert new magnetic orderings into the magnetic orderings Store.
 
         Parameters
         ----------
-        items : list of .MagneticOrderingsDocument
-            A list of magnetic ordering documents to add to the database.
+        items : list of list of dict
+            Lists of serialized magnetic ordering documents to add to the database.
         """
-        self.logger.info("Updating %s magnetic orderings documents", len(items))
-        self.magnetic_orderings.update(items, key="ground_state_uuid")
+        docs = list(chain.from_iterable(items))
+        self.logger.info("Updating %s magnetic orderings documents", len(docs))
+        if docs:
+            self.magnetic_orderings.update(docs, key="ground_state_uuid")
 
 
 def _group_orderings(
@@ -169,38 +197,34 @@ def _group_orderings(
     ----------
     tasks : list[dict]
         A list of ordering tasks.
-    tol : float
-        Numerical tolerance for structure equivalence.
+    ltol : float
+        Numerical length tolerance for structure equivalence.
+    stol : float
+        Numerical site tolerance for structure equivalence.
+    angle_tol : float
+        Numerical angle tolerance in degrees for structure equivalence.
 
     Returns
     -------
     list[list[dict]]
-        The tasks grouped by their parent structure.
+        The tasks grouped by their parent structure. The groups are ordered by their
+        first task and the tasks within a group keep their order in ``tasks``.
     """
     tasks = [dict(task) for task in tasks]
-
-    grouped_tasks = [[tasks[0]]]
+    decoder = MontyDecoder()
+    parents = [
+        decoder.process_decoded(task["metadata"]["parent_structure"]) for task in tasks
+    ]
+
+    #  parent structure lattice/coords may be same but in different order
+    #  so we need to be more rigorous in checking equivalence. The structures are
+    #  reduced once and pre-grouped by composition before matching.
     sm = StructureMatcher(ltol=ltol, stol=stol, angle_tol=angle_tol)
-
-    for task in tasks[1:]:
-        parent_structure = MontyDecoder().process_decoded(
-            task["metadata"]["parent_structure"]
-        )
-
-        match = False
-        for group in grouped_tasks:
-            group_parent_structure = MontyDecoder().process_decoded(
-                group[0]["metadata"]["parent_structure"]
-            )
-
-            #  parent structure lattice/coords may be same but in different order
-            #  so we need to be more rigorous in checking equivalence
-            if sm.fit(parent_structure, group_parent_structure):
-                group.append(task)
-                match = True
-                break
-
-        if not match:
-            grouped_tasks.append([task])
-
-    return MontyDecoder().process_decoded(grouped_tasks)
+    indices = {id(parent): idx for idx, parent in enumerate(parents)}
+    grouped_indices = [
+        sorted(indices[id(parent)] for parent in group)
+        for group in sm.group_structures(parents)
+    ]
+
+    # keep the groups, and the tasks within a group, in the order of the tasks
+    return [[tasks[idx] for idx in group] for group in sorted(grouped_indices)]
@@ -0,0 +1,71 @@
+"""Utilities shared by the builders."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pydash import get
+
+if TYPE_CHECKING:
+    import logging
+    from datetime import datetime
+    from typing import Any
+
+    from maggma.core import Store
+
+
+def get_updated_keys(
+    source: Store, target: Store, key: str, criteria: dict, logger: logging.Logger
+) -> list[Any]:
+    """Get the values of a key for source documents updated after the target.
+
+    Only the ``last_updated`` date of the target store as a whole is compared, i.e.,
+    documents that are older than the most recent target document are never
+    returned, even if their target documents are missing or outdated.
+
+    Parameters
+    ----------
+    source : .Store
+        Store of the source documents, e.g., task documents.
+    target : .Store
+        Store of the built documents.
+    key : str
+        The key to get the distinct values of, e.g., ``"output.formula_pretty"``.
+    criteria : dict
+        Query to limit the source documents.
+    logger : logging.Logger
+        Logger of the builder.
+
+    Returns
+    -------
+    list
+        The distinct values of ``key`` of the updated source documents.
+    """
+    last_updated = target.last_updated
+    logger.info("Only processing documents updated after %s", last_updated)
+    return source.distinct(
+        key, criteria=criteria | {source.last_updated_field: {"$gt": last_updated}}
+    )
+
+
+def get_last_updated(docs: list[dict], last_updated_field: str) -> datetime | None:
+    """Get the most recent ``last_updated`` date of a list of documents.
+
+    Parameters
+    ----------
+    docs : list of dict
+        The documents, e.g., the tasks that a built document is made of.
+    last_updated_field : str
+        The field of the documents with the last updated date.
+
+    Returns
+    -------
+    datetime or None
+        The most recent date or None if no document has a date.
+    """
+    last_updated = [
+        get(doc, last_updated_field)
+        for doc in docs
+        if get(doc, last_updated_field) is not None
+    ]
+    return max(last_updated, default=None)
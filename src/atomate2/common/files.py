@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from pathlib import Path
 
+from atomate2 import SETTINGS
 from atomate2.utils.file_client import FileClient, auto_fileclient
 
 
@@ -175,10 +177,16 @@ def gzip_files(
     allow_missing: bool = False,
     force: bool = False,
     file_client: FileClient = None,
+    workers: int = SETTINGS.GZIP_WORKERS,
+    block_size: int | None = SETTINGS.GZIP_BLOCK_SIZE,
 ) -> None:
     r"""
     Gzip files in a directory.
 
+    If ``workers > 1``, local files larger than ``block_size`` are compressed one
+    after the other, each split into blocks compressed in parallel. The remaining
+    files are then compressed concurrently, one file per thread.
+
     Parameters
     ----------
     directory : str or Path or None
@@ -200,6 +208,11 @@ def gzip_files(
         Whether to overwrite files if they exist.
     file_client : .FileClient
         A file client to use for performing file operations.
+    workers : int
+        Number of threads used for the compression of local files.
+    block_size : int or None
+        Local files larger than this size (in bytes) are compressed in parallel
+        blocks if ``workers > 1``. If None, each file is compressed by one thread.
     """
     if directory is None:
         directory = Path.cwd() if host is None else Path("~/")
@@ -211,13 +224,41 @@ def gzip_files(
         file_client, directory, include_files, exclude_files, host
     )
 
-    for file in files:
+    def gzip_file(file: Path) -> None:
         try:
-            file_client.gzip(directory / file, host=host, force=force)
+            file_client.gzip(
+                directory / file,
+                host=host,
+                force=force,
+                workers=workers,
+                block_size=block_size,
+            )
         except FileNotFoundError:
             if not allow_missing:
                 raise
 
+    if host is not None or workers <= 1:
+        for file in files:
+            gzip_file(file)
+        return
+
+    # large files are split into blocks that are compressed in parallel
+    large_files = [
+        file
+        for file in files
+        if block_size
+        and (directory / file).is_file()
+        and (directory / file).stat().st_size > block_size
+    ]
+    for file in large_files:
+        gzip_file(file)
+
+    small_files = [file for file in files if file not in large_files]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(gzip_file, file) for file in small_files]
+        for future in futures:
+            future.result()
+
 
 @auto_fileclient
 def gunzip_files(
@@ -306,22 +347,24 @@ def find_and_filter_files(
     directory = file_client.abspath(directory, host=host)
     exclude_files = [] if exclude_files is None else exclude_files
 
-    if include_files is None:
-        files = file_client.listdir(directory, host=host)
-        files = [f for f in files if file_client.is_file(directory / f, host=host)]
-    else:
-        files = []
-        for file in include_files:
-            # expand any glob matches
-            globbed_files = file_client.glob(directory / file, host=host)
-
-            if len(globbed_files) > 0:
-                # Need to get the path relative to directory
-                globbed_files = [p.relative_to(directory) for p in globbed_files]
-                files.extend(globbed_files)
-            else:
-                # no matches, only add the original file to be dealt with later
-                files.append(Path(file))
+    # list each directory once rather than querying every file separately
+    with file_client.snapshot():
+        if include_files is None:
+            files = file_client.listdir(directory, host=host)
+            files = [f for f in files if file_client.is_file(directory / f, host=host)]
+        else:
+            files = []
+            for file in include_files:
+                # expand any glob matches
+                globbed_files = file_client.glob(directory / file, host=host)
+
+                if len(globbed_files) > 0:
+                    # Need to get the path relative to directory
+                    globbed_files = [p.relative_to(directory) for p in globbed_files]
+                    files.extend(globbed_files)
+                else:
+                    # no matches, only add the original file to be dealt with later
+                    files.append(Path(file))
 
     filtered_files = []
     for file in files:
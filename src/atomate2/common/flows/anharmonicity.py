@@ -14,6 +14,7 @@ from jobflow import Flow, Maker
 
 from atomate2.common.jobs.anharmonicity import (
     displace_structure,
+    get_dynmat_eigensystem,
     get_forces,
     get_phonon_supercell,
     get_sigmas,
@@ -48,10 +49,16 @@ class BaseAnharmonicityMaker(Maker, ABC):
         Name of the flows produced by this maker.
     phonon_maker: BasePhononMaker
         The maker to generate the phonon model
+    eigen_cache_dir: str | Path | None
+        Directory in which the eigen-decomposition of the dynamical matrix is
+        persisted and shared between jobs. If None, it is stored in the directory
+        of the job computing it. Jobs which cannot access the directory recompute
+        the eigen-decomposition.
     """
 
     name: str = "anharmonicity"
     phonon_maker: BasePhononMaker = None
+    eigen_cache_dir: str | Path | None = None
 
     def make(
         self,
@@ -223,6 +230,14 @@ class BaseAnharmonicityMaker(Maker, ABC):
 
         phonon_supercell = phonon_supercell_job.output
 
+        # Diagonalize the dynamical matrix once for all downstream jobs
+        eigensystem_job = get_dynmat_eigensystem(
+            phonon_doc.force_constants,
+            phonon_supercell,
+            cache_dir=self.eigen_cache_dir,
+        )
+        jobs.append(eigensystem_job)
+
         displace_supercell = displace_structure(
             phonon_supercell=phonon_supercell,
             force_constants=phonon_doc.force_constants,
@@ -230,6 +245,7 @@ class BaseAnharmonicityMaker(Maker, ABC):
             one_shot=one_shot_approx,
             seed=seed,
             n_samples=n_samples,
+            eigen_cache=eigensystem_job.output,
         )
         jobs.append(displace_supercell)
 
@@ -262,6 +278,7 @@ class BaseAnharmonicityMaker(Maker, ABC):
             element_resolved,
             mode_resolved,
             site_resolved,
+            eigen_cache=eigensystem_job.output,
         )
         jobs.append(sigma_calcs)
         sigma_a_vals = sigma_calcs.output
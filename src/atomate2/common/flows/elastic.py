@@ -72,6 +72,9 @@ class BaseElasticMaker(Maker, ABC):
         Keyword arguments passed to :obj:`fit_elastic_tensor`.
     task_document_kwargs : dict
         Additional keyword args passed to :obj:`.ElasticDocument.from_stresses()`.
+    batch_deformations : bool
+        If True, relax all deformed structures in a single job. Only supported by
+        makers accepting a list of structures, e.g., force fields.
     """
 
     name: str = "elastic"
@@ -86,6 +89,7 @@ class BaseElasticMaker(Maker, ABC):
     generate_elastic_deformations_kwargs: dict = field(default_factory=dict)
     fit_elastic_tensor_kwargs: dict = field(default_factory=dict)
     task_document_kwargs: dict = field(default_factory=dict)
+    batch_deformations: bool = False
 
     def make(
         self,
@@ -140,6 +144,7 @@ class BaseElasticMaker(Maker, ABC):
             deformations.output,
             elastic_relax_maker=self.elastic_relax_maker,
             prev_dir=prev_dir,
+            batch=self.batch_deformations,
         )
         fit_tensor = fit_elastic_tensor(
             structure,
@@ -77,6 +77,11 @@ class BaseGruneisenMaker(Maker, ABC):
         Keyword arguments passed to :obj:`compute_gruneisen_param`.
     symprec: float
         Symmetry precision for symmetry checks and phonon runs.
+    shared_displacements: bool
+        If True, the displacements of the three structures are planned in a single
+        job that only runs the symmetry analysis once, using the supercell of the
+        ground state structure for all of them, and the displacement calculations
+        are run as one set of jobs.
     """
 
     name: str = "Gruneisen"
@@ -89,6 +94,7 @@ class BaseGruneisenMaker(Maker, ABC):
     mesh: tuple[float, float, float] | float = 7_000
     compute_gruneisen_param_kwargs: dict = field(default_factory=dict)
     symprec: float = SETTINGS.PHONON_SYMPREC
+    shared_displacements: bool = False
 
     def make(self, structure: Structure, prev_dir: str | Path | None = None) -> Flow:
         """
@@ -168,6 +174,7 @@ class BaseGruneisenMaker(Maker, ABC):
             symprec=self.symprec,
             prev_calc_dir_argname=self.prev_calc_dir_argname,
             prev_dir_dict=prev_dir_dict,
+            shared_displacements=self.shared_displacements,
         )
         jobs.append(phonon_jobs)
         # might not work well, put this into a job
@@ -12,9 +12,11 @@ from atomate2 import SETTINGS
 from atomate2.common.jobs.phonons import (
     generate_frequencies_eigenvectors,
     generate_phonon_displacements,
+    generate_shared_phonon_displacements,
     get_supercell_size,
     get_total_energy_per_cell,
     run_phonon_displacements,
+    run_shared_phonon_displacements,
 )
 from atomate2.common.jobs.utils import structure_to_conventional, structure_to_primitive
 
@@ -115,6 +117,9 @@ class BasePhononMaker(Maker, ABC):
             If store_force_constants is True, the file name to store the force constants
         - calculate_pdos: bool
             If True, the projected phonon density of states will be calculated
+        - compact_force_constants: bool
+            If True, stored force constants are serialized as compressed binary data
+            that is only decoded when the force constants are accessed
     create_thermal_displacements: bool
         Bool that determines if thermal_displacement_matrices are computed
     kpath_scheme: str
@@ -133,6 +138,9 @@ class BasePhononMaker(Maker, ABC):
         if True, force constants will be stored
     socket: bool
         If True, use the socket for the calculation
+    batch_displacements: bool
+        If True, compute the forces for all displacements in a single job. Only
+        supported by makers accepting a list of structures, e.g., force fields.
     """
 
     name: str = "phonon"
@@ -166,6 +174,7 @@ class BasePhononMaker(Maker, ABC):
     code: str = None
     store_force_constants: bool = True
     socket: bool = False
+    batch_displacements: bool = False
 
     def make(
         self,
@@ -206,31 +215,7 @@ class BasePhononMaker(Maker, ABC):
             Instead of min_length, also a supercell_matrix can be given, e.g.
             [[1.0,0.0,0.0],[0.0,1.0,0.0],[0.0,0.0,1.0]
         """
-        use_symmetrized_structure = self.use_symmetrized_structure
-        kpath_scheme = self.kpath_scheme
-        valid_structs = (None, "primitive", "conventional")
-        if use_symmetrized_structure not in valid_structs:
-            raise ValueError(
-                f"Invalid {use_symmetrized_structure=}, use one of {valid_structs}"
-            )
-
-        if use_symmetrized_structure != "primitive" and kpath_scheme != "seekpath":
-            raise ValueError(
-                f"You can't use {kpath_scheme=} with the primitive standard "
-                "structure, please use seekpath"
-            )
-
-        valid_schemes = ("seekpath", "hinuma", "setyawan_curtarolo", "latimer_munro")
-        if kpath_scheme not in valid_schemes:
-            raise ValueError(
-                f"{kpath_scheme=} is not implemented, use one of {valid_schemes}"
-            )
-
-        if self.code is None or self.code not in SUPPORTED_CODES:
-            raise ValueError(
-                "The code variable must be passed and it must be a supported code."
-                f" Supported codes are: {SUPPORTED_CODES}"
-            )
+        self._check_settings()
 
         jobs = []
 
@@ -325,6 +310,7 @@ class BasePhononMaker(Maker, ABC):
             supercell_matrix=supercell_matrix,
             phonon_maker=self.phonon_displacement_maker,
             socket=self.socket,
+            batch=self.batch_displacements,
             prev_dir_argname=self.prev_calc_dir_argname,
             prev_dir=prev_dir,
         )
@@ -378,6 +364,204 @@ class BasePhononMaker(Maker, ABC):
         # create a flow including all jobs for a phonon computation
         return Flow(jobs, phonon_collect.output)
 
+    def make_volumes(
+        self,
+        structures: list[Structure],
+        prev_dirs: list[str | Path | None] | None = None,
+        supercell_matrix: Matrix3D | None = None,
+    ) -> Flow:
+        """Make flow to calculate the phonon properties of several volumes.
+
+        In contrast to calling :obj:`make` for every structure, the displacements
+        of all structures are planned in a single job that runs the symmetry
+        analysis only once for structures with the same symmetry (e.g.,
+        isotropically scaled volumes), and all displacement calculations are run
+        as one set of jobs. If ``batch_displacements`` is True, the forces of all
+        structures and displacements are computed in one job.
+
+        Parameters
+        ----------
+        structures : list[Structure]
+            Pymatgen structure objects of the same material, e.g., at different
+            volumes.
+        prev_dirs : list[str or Path or None] or None
+            The previous calculation directory of every structure.
+        supercell_matrix: list
+            The supercell matrix shared by all structures. If None, it is determined
+            from the first structure.
+
+        Returns
+        -------
+        Flow
+            A flow with the list of :obj:`.PhononBSDOSDoc` of all structures as
+            output. The i-th output is a reference to the output of the analysis
+            job of the i-th structure.
+        """
+        self._check_settings()
+        if self.socket:
+            raise ValueError("Shared displacements do not support the socket.")
+
+        jobs = []
+        prev_dirs = list(prev_dirs or [None] * len(structures))
+        structures = list(structures)
+        run_dirs: dict[str, list] = {"optimization": [], "static": []}
+        run_uuids: dict[str, list] = {"optimization": [], "static": []}
+        total_dft_energies = []
+        for istruct in range(len(structures)):
+            if self.use_symmetrized_structure == "primitive":
+                sym_job = structure_to_primitive(structures[istruct], self.symprec)
+            elif self.use_symmetrized_structure == "conventional":
+                sym_job = structure_to_conventional(structures[istruct], self.symprec)
+            else:
+                sym_job = None
+            if sym_job is not None:
+                jobs.append(sym_job)
+                structures[istruct] = sym_job.output
+
+            run_dirs["optimization"].append(None)
+            run_uuids["optimization"].append(None)
+            if self.bulk_relax_maker is not None:
+                bulk_kwargs = {}
+                if self.prev_calc_dir_argname is not None:
+                    bulk_kwargs[self.prev_calc_dir_argname] = prev_dirs[istruct]
+                bulk = self.bulk_relax_maker.make(structures[istruct], **bulk_kwargs)
+                bulk.append_name(f" structure {istruct + 1}")
+                jobs.append(bulk)
+                structures[istruct] = bulk.output.structure
+                prev_dirs[istruct] = bulk.output.dir_name
+                run_dirs["optimization"][-1] = bulk.output.dir_name
+                run_uuids["optimization"][-1] = bulk.output.uuid
+
+            total_dft_energies.append(None)
+            run_dirs["static"].append(None)
+            run_uuids["static"].append(None)
+            if self.static_energy_maker is not None:
+                static_job_kwargs = {}
+                if self.prev_calc_dir_argname is not None:
+                    static_job_kwargs[self.prev_calc_dir_argname] = prev_dirs[istruct]
+                static_job = self.static_energy_maker.make(
+                    structure=structures[istruct], **static_job_kwargs
+                )
+                static_job.append_name(f" structure {istruct + 1}")
+                jobs.append(static_job)
+                total_dft_energies[-1] = static_job.output.output.energy
+                run_dirs["static"][-1] = static_job.output.dir_name
+                run_uuids["static"][-1] = static_job.output.uuid
+                prev_dirs[istruct] = static_job.output.dir_name
+
+        if supercell_matrix is None:
+            supercell_job = get_supercell_size(
+                structure=structures[0],
+                min_length=self.min_length,
+                max_length=self.max_length,
+                prefer_90_degrees=self.prefer_90_degrees,
+                allow_orthorhombic=self.allow_orthorhombic,
+                **self.get_supercell_size_kwargs,
+            )
+            jobs.append(supercell_job)
+            supercell_matrix = supercell_job.output
+
+        displacements = generate_shared_phonon_displacements(
+            structures=structures,
+            supercell_matrix=supercell_matrix,
+            displacement=self.displacement,
+            sym_reduce=self.sym_reduce,
+            symprec=self.symprec,
+            use_symmetrized_structure=self.use_symmetrized_structure,
+            kpath_scheme=self.kpath_scheme,
+            code=self.code,
+        )
+        jobs.append(displacements)
+
+        displacement_calcs = run_shared_phonon_displacements(
+            displacements=displacements.output["displacements"],
+            structures=structures,
+            supercell_matrix=supercell_matrix,
+            phonon_maker=self.phonon_displacement_maker,
+            prev_dirs=prev_dirs,
+            prev_dir_argname=self.prev_calc_dir_argname,
+            batch=self.batch_displacements,
+        )
+        jobs.append(displacement_calcs)
+
+        born_outputs = []
+        for istruct, structure in enumerate(structures):
+            born_outputs.append(dict.fromkeys(("born", "epsilon", "dir", "uuid")))
+            if self.born_maker is not None:
+                born_kwargs = {}
+                if self.prev_calc_dir_argname is not None:
+                    born_kwargs[self.prev_calc_dir_argname] = prev_dirs[istruct]
+                born_job = self.born_maker.make(structure, **born_kwargs)
+                born_job.append_name(f" structure {istruct + 1}")
+                jobs.append(born_job)
+                born_output = born_job.output.calcs_reversed[0].output
+                born_outputs[-1] = {
+                    "born": born_output.outcar["born"],
+                    "epsilon": born_output.epsilon_static,
+                    "dir": born_job.output.dir_name,
+                    "uuid": born_job.output.uuid,
+                }
+
+        phonon_collects = []
+        for istruct, structure in enumerate(structures):
+            phonon_collect = generate_frequencies_eigenvectors(
+                supercell_matrix=supercell_matrix,
+                displacement=self.displacement,
+                sym_reduce=self.sym_reduce,
+                symprec=self.symprec,
+                use_symmetrized_structure=self.use_symmetrized_structure,
+                kpath_scheme=self.kpath_scheme,
+                code=self.code,
+                structure=structure,
+                displacement_data=displacement_calcs.output[istruct],
+                displacement_dataset=displacements.output["datasets"][istruct],
+                epsilon_static=born_outputs[istruct]["epsilon"],
+                born=born_outputs[istruct]["born"],
+                total_dft_energy=total_dft_energies[istruct],
+                static_run_job_dir=run_dirs["static"][istruct],
+                static_run_uuid=run_uuids["static"][istruct],
+                born_run_job_dir=born_outputs[istruct]["dir"],
+                born_run_uuid=born_outputs[istruct]["uuid"],
+                optimization_run_job_dir=run_dirs["optimization"][istruct],
+                optimization_run_uuid=run_uuids["optimization"][istruct],
+                create_thermal_displacements=self.create_thermal_displacements,
+                store_force_constants=self.store_force_constants,
+                **self.generate_frequencies_eigenvectors_kwargs,
+            )
+            phonon_collect.append_name(f" structure {istruct + 1}")
+            phonon_collects.append(phonon_collect)
+        jobs.extend(phonon_collects)
+
+        return Flow(jobs, [collect.output for collect in phonon_collects])
+
+    def _check_settings(self) -> None:
+        """Check that the settings of the maker are valid."""
+        use_symmetrized_structure = self.use_symmetrized_structure
+        kpath_scheme = self.kpath_scheme
+        valid_structs = (None, "primitive", "conventional")
+        if use_symmetrized_structure not in valid_structs:
+            raise ValueError(
+                f"Invalid {use_symmetrized_structure=}, use one of {valid_structs}"
+            )
+
+        if use_symmetrized_structure != "primitive" and kpath_scheme != "seekpath":
+            raise ValueError(
+                f"You can't use {kpath_scheme=} with the primitive standard "
+                "structure, please use seekpath"
+            )
+
+        valid_schemes = ("seekpath", "hinuma", "setyawan_curtarolo", "latimer_munro")
+        if kpath_scheme not in valid_schemes:
+            raise ValueError(
+                f"{kpath_scheme=} is not implemented, use one of {valid_schemes}"
+            )
+
+        if self.code is None or self.code not in SUPPORTED_CODES:
+            raise ValueError(
+                "The code variable must be passed and it must be a supported code."
+                f" Supported codes are: {SUPPORTED_CODES}"
+            )
+
     @property
     @abstractmethod
     def prev_calc_dir_argname(self) -> str | None:
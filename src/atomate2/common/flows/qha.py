@@ -80,6 +80,12 @@ class CommonQhaMaker(Maker, ABC):
         with 3 90 degree angles
     get_supercell_size_kwargs: dict
         kwargs that will be passed to get_supercell_size to determine supercell size
+    shared_displacements: bool
+        If True, the displacements of all volumes are planned in a single job that
+        only runs the symmetry analysis once for volumes with the same symmetry, and
+        the displacement calculations of all volumes are run as one set of jobs.
+        Together with ``batch_displacements`` of a force field phonon maker, the
+        forces of all volumes and displacements are computed in one job.
     """
 
     name: str = "QHA Maker"
@@ -99,6 +105,7 @@ class CommonQhaMaker(Maker, ABC):
     prefer_90_degrees: bool = True
     allow_orthorhombic: bool = False
     get_supercell_size_kwargs: dict = field(default_factory=dict)
+    shared_displacements: bool = False
 
     def make(
         self,
@@ -158,6 +165,7 @@ class CommonQhaMaker(Maker, ABC):
             phonon_maker=self.phonon_maker,
             eos_output=eos_job.output,
             supercell_matrix=supercell_matrix,
+            shared_displacements=self.shared_displacements,
         )
         qha_jobs.append(phonon_jobs)
         if not self.skip_analysis:
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import logging
+import os
+from collections.abc import MutableMapping
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 from jobflow import Flow, Response, job
+from monty.json import MSONable
 from phonopy import Phonopy
 from pymatgen.core import Structure
 from pymatgen.core.units import kb
@@ -19,9 +24,11 @@ from atomate2.aims.utils.units import omegaToTHz
 from atomate2.common.schemas.anharmonicity import AnharmonicityDoc
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator, Sequence
     from typing import Any
 
+    from pymatgen.core import Lattice
+
     from atomate2.aims.jobs.base import BaseAimsMaker
     from atomate2.common.schemas.phonons import ForceConstants, PhononBSDOSDoc
     from atomate2.forcefields.jobs import ForceFieldStaticMaker
@@ -51,6 +58,107 @@ class ImaginaryModeError(Exception):
         super().__init__(self.message)
 
 
+class DynmatEigenCache(MutableMapping):
+    """Cache of dynamical matrix eigen-decompositions persisted on disk.
+
+    Each eigensystem is stored as a compressed ``.npz`` file named after its
+    `get_dynmat_hash` key, so that jobs sharing the directory reuse the result
+    of a single diagonalization.
+
+    Parameters
+    ----------
+    directory: str | Path
+        The directory the eigensystems are stored in
+    """
+
+    prefix = "dynmat_eigens_"
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{self.prefix}{key}.npz"
+
+    def __getitem__(self, key: str) -> tuple[np.ndarray, np.ndarray]:
+        """Load an eigensystem."""
+        try:
+            with np.load(self._path(key)) as data:
+                return (data["eig_val"], data["eig_vec"])
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: tuple[np.ndarray, np.ndarray]) -> None:
+        """Store an eigensystem, replacing the file atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path(key).with_suffix(".tmp.npz")
+        np.savez_compressed(tmp_path, eig_val=value[0], eig_vec=value[1])
+        os.replace(tmp_path, self._path(key))
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a stored eigensystem."""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether an eigensystem is stored, without loading it."""
+        return isinstance(key, str) and self._path(key).is_file()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of the stored eigensystems."""
+        for path in self.directory.glob(f"{self.prefix}*.npz"):
+            if not path.name.endswith(".tmp.npz"):
+                yield path.name[len(self.prefix) : -len(".npz")]
+
+    def __len__(self) -> int:
+        """Get the number of stored eigensystems."""
+        return sum(1 for _ in self)
+
+
+class StructureBatch(MSONable):
+    """Structures sharing a lattice and species, with stacked coordinates.
+
+    Individual :obj:`.Structure` objects are only built when accessed, so
+    that many samples can be generated and stored cheaply.
+
+    Parameters
+    ----------
+    lattice: Lattice
+        The lattice shared by all structures
+    species: Sequence
+        The species of the sites, shared by all structures
+    coords: np.ndarray
+        Cartesian coordinates of shape (n_structures, n_sites, 3)
+    """
+
+    def __init__(self, lattice: Lattice, species: Sequence, coords: np.ndarray) -> None:
+        self.lattice = lattice
+        self.species = [str(specie) for specie in species]
+        self.coords = np.asarray(coords, dtype=float)
+
+    def __len__(self) -> int:
+        """Get the number of structures."""
+        return len(self.coords)
+
+    def __getitem__(self, idx: int) -> Structure:
+        """Get one structure."""
+        return Structure(
+            lattice=self.lattice,
+            species=self.species,
+            coords=self.coords[idx],
+            coords_are_cartesian=True,
+        )
+
+    def __iter__(self) -> Iterator[Structure]:
+        """Iterate over the structures."""
+        return (self[idx] for idx in range(len(self)))
+
+    def to_structures(self) -> list[Structure]:
+        """Get all structures as a list."""
+        return list(self)
+
+
 @job
 def get_phonon_supercell(
     structure: Structure, supercell_matrix: np.ndarray
@@ -229,15 +337,52 @@ def box_muller(
     np.ndarray
         Array with iid normally distributed displacements
     """
+    return sample_displacements(eig_vals, eig_vecs, temp, rng, 1)[0]
+
+
+def sample_displacements(
+    eig_vals: np.ndarray,
+    eig_vecs: np.ndarray,
+    temp: float,
+    rng: np.random.Generator,
+    n_samples: int,
+) -> np.ndarray:
+    """Draw normally distributed displacements for several samples at once.
+
+    Uses the Box-Muller transform like `box_muller`, and consumes random numbers
+    in the same order as `n_samples` successive calls to it.
+
+    Parameters
+    ----------
+    eig_vals: np.ndarray
+        Vector of harmonic eigenvalues (with first 3 removed for translational modes)
+    eig_vecs: np.ndarray
+        Matrix of harmonic eigenvectors (with first 3 removed for translational modes)
+    temp: float
+        Temperature in K to find velocity and displacement at
+    rng: np.random.Generator
+        Seeded random number generator
+    n_samples: int
+        Number of displacement sets to draw
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_samples, n_atoms, 3) with the displacements
+        (not normalized by sqrt(masses) yet)
+    """
     n_eigvals = eig_vals.shape[0]
-    spread = np.sqrt(-2.0 * np.log(1.0 - rng.random(size=n_eigvals)))
+    uniform = rng.random(size=(n_samples, 2, n_eigvals))
+    spread = np.sqrt(-2.0 * np.log(1.0 - uniform[:, 0]))
 
     # Assign amplitudes (A_s) and phases (phi_s)
     a_s = spread * (np.sqrt(temp * kb) / eig_vals)
-    phi_s = 2.0 * np.pi * rng.random(size=n_eigvals)
+    phi_s = 2.0 * np.pi * uniform[:, 1]
 
-    # Get displacement (not normalized by sqrt(masses) yet)
-    return (a_s * np.cos(phi_s) * eig_vecs).sum(axis=2)
+    # Get displacements for all samples with a single matrix product
+    return (a_s * np.cos(phi_s) @ eig_vecs.reshape(-1, n_eigvals).T).reshape(
+        (n_samples, *eig_vecs.shape[:-1])
+    )
 
 
 @job
@@ -249,7 +394,8 @@ def displace_structure(
     seed: int | None = None,
     mode_resolved: bool = False,
     n_samples: int = 1,
-) -> list[Structure]:
+    eigen_cache: MutableMapping | str | Path | None = None,
+) -> StructureBatch:
     """Calculate the displaced structure.
 
     Procedure defined in doi.org/10.1103/PhysRevB.94.075125.
@@ -274,11 +420,14 @@ def displace_structure(
     n_samples: int
         Number of samples to generate (must be >= 1).
         An error is raised if n_samples == 1 and mode_resolved == True
+    eigen_cache: MutableMapping | str | Path | None
+        Cache of dynamical matrix eigen-decompositions, see `get_dynmat_eigens`.
 
     Returns
     -------
-    list[Structure]
-        List of displaced Pymatgen structures
+    StructureBatch
+        The displaced structures, which can be used as a list of Pymatgen
+        structures
     """
     if n_samples != 1 and one_shot:
         raise ValueError(
@@ -294,14 +443,16 @@ def displace_structure(
     disp = np.zeros(coords.shape)
 
     masses = np.array([site.species.weight for site in phonon_supercell.sites])
-    dynamical_matrix = build_dynmat(force_constants, phonon_supercell)
-    eig_val, eig_vec = get_eigens(dynamical_matrix)
+    eig_val, eig_vec = get_dynmat_eigens(
+        force_constants, phonon_supercell, cache=eigen_cache
+    )
 
     # Check for imaginary modes
     if eig_val[3] < 0.0001:
         raise ImaginaryModeError(eig_val[3])
     eig_val = eig_val[3:]
-    x_acs = eig_vec[:, 3:].reshape((-1, 3, len(eig_val)))
+    # copy, as the eigenvectors may be shared through the cache
+    x_acs = eig_vec[:, 3:].reshape((-1, 3, len(eig_val))).copy()
 
     # gauge eigenvectors: largest value always positive
     for ii in range(x_acs.shape[-1]):
@@ -314,27 +465,18 @@ def displace_structure(
         zetas = (-1) ** np.arange(len(eig_val))
         a_s = np.sqrt(temp * kb) / eig_val * zetas
         disp = (a_s * x_acs).sum(axis=2) * inv_sqrt_mass[:, None]
-        return [
-            Structure(
-                lattice=phonon_supercell.lattice,
-                species=phonon_supercell.species,
-                coords=coords + disp,
-                coords_are_cartesian=True,
-            )
-        ]
-
-    samples = []
-    for _ in range(n_samples):
-        disp = box_muller(eig_val, x_acs, temp, rng) * inv_sqrt_mass[:, None]
-        samples.append(
-            Structure(
-                lattice=phonon_supercell.lattice,
-                species=phonon_supercell.species,
-                coords=coords + disp,
-                coords_are_cartesian=True,
-            )
+        return StructureBatch(
+            lattice=phonon_supercell.lattice,
+            species=phonon_supercell.species,
+            coords=(coords + disp)[None],
         )
-    return samples
+
+    disps = sample_displacements(eig_val, x_acs, temp, rng, n_samples)
+    return StructureBatch(
+        lattice=phonon_supercell.lattice,
+        species=phonon_supercell.species,
+        coords=coords + disps * inv_sqrt_mass[:, None],
+    )
 
 
 def build_dynmat(
@@ -355,14 +497,17 @@ def build_dynmat(
     np.ndarray
         The dynamical matrix
     """
-    force_constants_2d = (
-        np.array(force_constants.force_constants)
+    dynmat = (
+        np.array(force_constants.force_constants, dtype=float)
         .swapaxes(1, 2)
         .reshape(2 * (len(structure) * 3,))
     )
     masses = np.array([site.species.weight for site in structure.sites])
     rminv = (masses**-0.5).repeat(3)
-    return force_constants_2d * rminv[:, None] * rminv[None, :]
+    # scale in place to avoid (3N)x(3N) temporaries
+    dynmat *= rminv[:, None]
+    dynmat *= rminv[None, :]
+    return dynmat
 
 
 def get_eigens(dynmat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
@@ -384,11 +529,106 @@ def get_eigens(dynmat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return (eig_val, eig_vec)
 
 
+def get_dynmat_hash(force_constants: ForceConstants, structure: Structure) -> str:
+    """Get a content hash identifying the dynamical matrix.
+
+    Parameters
+    ----------
+    force_constants: ForceConstants
+        Force constants calculated by Phonopy
+    structure: Structure
+        Structure as a Pymatgen Structure object
+
+    Returns
+    -------
+    str
+        The SHA-256 hex digest of the force constants and atomic masses
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(force_constants.force_constants, float))
+    digest.update(np.array([site.species.weight for site in structure.sites], float))
+    return digest.hexdigest()
+
+
+def get_dynmat_eigens(
+    force_constants: ForceConstants,
+    structure: Structure,
+    cache: MutableMapping | str | Path | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build and diagonalize the dynamical matrix, reusing cached results.
+
+    Parameters
+    ----------
+    force_constants: ForceConstants
+        Force constants calculated by Phonopy
+    structure: Structure
+        Structure as a Pymatgen Structure object
+    cache: MutableMapping | str | Path | None
+        Mapping from `get_dynmat_hash` keys to the output of `get_eigens`, or a
+        directory used as a :obj:`DynmatEigenCache`. If given, it is searched
+        before diagonalizing and updated afterwards. If the cache cannot be read
+        or written (e.g., the directory is not accessible from this node), the
+        eigensystem is computed and returned without being stored.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The eigenfrequencies and eigenmodes, as returned by `get_eigens`
+    """
+    if cache is None:
+        return get_eigens(build_dynmat(force_constants, structure))
+
+    if isinstance(cache, str | Path):
+        cache = DynmatEigenCache(cache)
+    key = get_dynmat_hash(force_constants, structure)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    except OSError as exc:
+        logger.warning(f"Could not read dynamical matrix eigensystem: {exc}")
+
+    eigens = get_eigens(build_dynmat(force_constants, structure))
+    try:
+        cache[key] = eigens
+    except OSError as exc:
+        logger.warning(f"Could not store dynamical matrix eigensystem: {exc}")
+    return eigens
+
+
+@job
+def get_dynmat_eigensystem(
+    force_constants: ForceConstants,
+    phonon_supercell: Structure,
+    cache_dir: str | Path | None = None,
+) -> str:
+    """Diagonalize the dynamical matrix once and persist the eigensystem.
+
+    Parameters
+    ----------
+    force_constants: ForceConstants
+        Force constants calculated by Phonopy
+    phonon_supercell: Structure
+        The supercell used for the phonon calculation
+    cache_dir: str | Path | None
+        Directory to store the eigensystem in. Defaults to the job directory.
+
+    Returns
+    -------
+    str
+        The cache directory, to be passed as `eigen_cache` to downstream jobs
+    """
+    cache_dir = Path(cache_dir or os.getcwd()).absolute()
+    get_dynmat_eigens(force_constants, phonon_supercell, cache=cache_dir)
+    return str(cache_dir)
+
+
 def get_sigma_a_per_mode(
     force_constants: ForceConstants,
     structure: Structure,
     dft_forces: np.ndarray,
     harmonic_forces: np.ndarray,
+    eigen_cache: MutableMapping | str | Path | None = None,
 ) -> list[tuple[float, float]]:
     """Calculate sigma^A for each mode.
 
@@ -402,6 +642,8 @@ def get_sigma_a_per_mode(
         Array of DFT forces
     harmonic_forces: np.ndarray
         Array of harmonically approximated forces
+    eigen_cache: MutableMapping | str | Path | None
+        Cache of dynamical matrix eigen-decompositions, see `get_dynmat_eigens`.
 
     Returns
     -------
@@ -409,42 +651,38 @@ def get_sigma_a_per_mode(
         List of tuples in the form (mode frequency in THz, Sigma^A)
         for all the modes in the structure
     """
-    # Projecting the forces
-    dynamical_matrix = build_dynmat(force_constants, structure)
-    eig_val, eig_vec = get_eigens(dynamical_matrix)
+    eig_val, eig_vec = get_dynmat_eigens(force_constants, structure, cache=eigen_cache)
     eig_val = eig_val[3:] * omegaToTHz
-    # Projection matrix P
-    p = eig_vec.T
     masses = np.array([site.species.weight for site in structure.sites])
-    m = masses ** (-0.5)
-    # Project the forces
-    dft_forces = m.reshape((len(structure), 1)) * dft_forces
-    dft_proj = np.array([p @ (f.flatten()) for f in np.array(dft_forces)])[:, 3:]
-    harmonic_forces = m.reshape((len(structure), 1)) * harmonic_forces
-    harmonic_proj = np.array([p @ (f.flatten()) for f in np.array(harmonic_forces)])[
-        :, 3:
-    ]
-    # Calculate sigma^A for each mode
-    mode_sigma_vals = []
-    for mode in np.unique(eig_val):
-        dft_vals = np.array(
-            [dft_proj[:, idx] for idx in range(len(eig_val)) if eig_val[idx] == mode]
-        ).flatten()
-        harmonic_vals = np.array(
-            [
-                harmonic_proj[:, idx]
-                for idx in range(len(eig_val))
-                if eig_val[idx] == mode
-            ]
-        ).flatten()
-        anharmonic_vals = [
-            dft_force - harmonic_force
-            for dft_force, harmonic_force in zip(dft_vals, harmonic_vals, strict=True)
-        ]
-        sigma_a = np.std(anharmonic_vals) / np.std(dft_vals)
-        mode_sigma_vals.append((mode, sigma_a))
+    inv_sqrt_mass = (masses ** (-0.5)).repeat(3)
+
+    # Project the mass-weighted forces of all samples onto the modes at once
+    n_dof = 3 * len(structure)
+    dft_proj = (np.reshape(dft_forces, (-1, n_dof)) * inv_sqrt_mass) @ eig_vec[:, 3:]
+    harmonic_proj = (
+        np.reshape(harmonic_forces, (-1, n_dof)) * inv_sqrt_mass
+    ) @ eig_vec[:, 3:]
+
+    # Calculate sigma^A for each group of degenerate modes
+    modes, mode_idx = np.unique(eig_val, return_inverse=True)
+    return list(
+        zip(
+            modes.tolist(),
+            (
+                _grouped_std(dft_proj - harmonic_proj, mode_idx)
+                / _grouped_std(dft_proj, mode_idx)
+            ).tolist(),
+            strict=True,
+        )
+    )
 
-    return mode_sigma_vals
+
+def _grouped_std(values: np.ndarray, group_idx: np.ndarray) -> np.ndarray:
+    """Get the standard deviation of the values in each group of columns."""
+    counts = np.bincount(group_idx) * len(values)
+    means = np.bincount(group_idx, weights=values.sum(axis=0)) / counts
+    sq_devs = ((values - means[group_idx]) ** 2).sum(axis=0)
+    return np.sqrt(np.bincount(group_idx, weights=sq_devs) / counts)
 
 
 @job
@@ -452,6 +690,8 @@ def get_forces(
     force_constants: ForceConstants,
     phonon_supercell: Structure,
     displaced_structures: dict[str, list],
+    dtype: str = "float64",
+    chunk_size: int | None = None,
 ) -> list[np.ndarray]:
     """Calculate the DFT forces and harmonic forces.
 
@@ -463,36 +703,51 @@ def get_forces(
         The supercell used for the phonon calculation
     displaced_structures: dict[str, list]
         The output of run_displacements
+    dtype: str
+        Floating point type used to evaluate the harmonic forces. "float32"
+        halves the memory of the force constants at reduced precision.
+    chunk_size: int | None
+        Number of displaced structures to evaluate per matrix product, to bound
+        the memory used. If None, all structures are evaluated at once.
 
     Returns
     -------
     list[np.ndarray]
-        List of forces in the form [DFT forces, harmonic forces]
+        List of forces in the form [DFT forces, harmonic forces], each an array of
+        shape (n_displacements, n_sites, 3)
     """
-    force_constants_2d = np.swapaxes(
-        force_constants.force_constants,
-        1,
-        2,
-    ).reshape(2 * (len(phonon_supercell) * 3,))
+    n_dof = len(phonon_supercell) * 3
+    force_constants_2d = (
+        np.asarray(force_constants.force_constants, dtype=dtype)
+        .swapaxes(1, 2)
+        .reshape(n_dof, n_dof)
+    )
     if isinstance(displaced_structures["coords"][0], Calculation):
-        displacements = [
-            disp_data.output.structure.cart_coords - phonon_supercell.cart_coords
-            for disp_data in displaced_structures["coords"]
-        ]
+        coords = np.array(
+            [
+                disp_data.output.structure.cart_coords
+                for disp_data in displaced_structures["coords"]
+            ]
+        )
     else:
-        displacements = [
-            np.array(disp_data) - phonon_supercell.cart_coords
-            for disp_data in displaced_structures["coords"]
-        ]
-
-    harmonic_forces = [
-        (-force_constants_2d @ displacement.flatten()).reshape((-1, 3))
-        for displacement in displacements
-    ]
+        coords = np.array(displaced_structures["coords"], dtype=float)
+    displacements = (coords - phonon_supercell.cart_coords).reshape(-1, n_dof)
+    displacements = displacements.astype(dtype, copy=False)
+
+    # F = -Phi u for all displacements, as (u_1, ..., u_n)^T Phi^T
+    n_displacements = len(displacements)
+    chunk_size = chunk_size or max(n_displacements, 1)
+    harmonic_forces = np.empty((n_displacements, n_dof), dtype=dtype)
+    for start in range(0, n_displacements, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        np.matmul(
+            displacements[chunk], force_constants_2d.T, out=harmonic_forces[chunk]
+        )
+    np.negative(harmonic_forces, out=harmonic_forces)
 
-    dft_forces = [np.array(disp_data) for disp_data in displaced_structures["forces"]]
+    dft_forces = np.array(displaced_structures["forces"], dtype=float)
 
-    return [dft_forces, harmonic_forces]
+    return [dft_forces, harmonic_forces.reshape(n_displacements, -1, 3)]
 
 
 @job
@@ -505,6 +760,7 @@ def get_sigmas(
     element_resolved: bool = False,
     mode_resolved: bool = False,
     site_resolved: bool = False,
+    eigen_cache: str | Path | None = None,
 ) -> dict:
     """Get the desired sigma^A measures.
 
@@ -530,6 +786,9 @@ def get_sigmas(
     site_resolved: bool
         If true, resolve sigma^A to the different sites.
         Default is false.
+    eigen_cache: str | Path | None
+        Directory of a :obj:`DynmatEigenCache` to reuse the eigen-decomposition
+        of the dynamical matrix from, for mode-resolved sigma^A.
 
     Returns
     -------
@@ -537,16 +796,9 @@ def get_sigmas(
         Dictionary in the form {sigma^A type: float/list with sigma^A values}
         that contains all the sigma^A values
     """
-    dft_forces = np.array(dft_forces)
-    harmonic_forces = np.array(harmonic_forces)
-    anharmonic_forces = np.array(
-        [
-            dft_force - harmonic_force
-            for dft_force, harmonic_force in zip(
-                dft_forces, harmonic_forces, strict=True
-            )
-        ]
-    )
+    dft_forces = np.asarray(dft_forces, dtype=float)
+    harmonic_forces = np.asarray(harmonic_forces, dtype=float)
+    anharmonic_forces = dft_forces - harmonic_forces
 
     sigma_dict: dict[str, Any] = {}
 
@@ -556,6 +808,7 @@ def get_sigmas(
             structure,
             dft_forces,
             harmonic_forces,
+            eigen_cache=eigen_cache,
         )
     if element_resolved:
         sigma_dict["element-resolved"] = get_sigma_per_element(
@@ -600,7 +853,7 @@ def calc_sigma_a(
 
 @job(data=["forces", "displaced_structures"])
 def run_displacements(
-    displacements: list[Structure],
+    displacements: list[Structure] | StructureBatch,
     phonon_supercell: Structure,
     force_eval_maker: BaseVaspMaker | ForceFieldStaticMaker | BaseAimsMaker = None,
     prev_dir: str | Path = None,
@@ -644,6 +897,8 @@ def run_displacements(
         force_eval_job_kwargs[prev_dir_argname] = prev_dir
 
     if socket:
+        # socket calculations need the structures, not a StructureBatch
+        displacements = list(displacements)
         force_eval_job = force_eval_maker.make(displacements, **force_eval_job_kwargs)
         info = {
             "phonon_supercell": phonon_supercell,
@@ -106,12 +106,13 @@ def run_elastic_deformations(
     prev_dir: str | Path | None = None,
     prev_dir_argname: str = None,
     elastic_relax_maker: BaseVaspMaker | ForceFieldRelaxMaker = None,
+    batch: bool = False,
 ) -> Response:
     """
     Run elastic deformations.
 
     Note, this job will replace itself with N relaxation calculations, where N is
-    the number of deformations.
+    the number of deformations, or a single batch relaxation of all deformations.
 
     Parameters
     ----------
@@ -125,7 +126,33 @@ def run_elastic_deformations(
         argument name for the prev_dir variable
     elastic_relax_maker : .BaseVaspMaker or .ForceFieldRelaxMaker
         A VaspMaker or a ForceFieldMaker to use to generate the elastic relaxation jobs.
+    batch: bool
+        If True, relax all deformed structures in a single job. The elastic relax
+        maker must accept a list of structures and return a list of task documents,
+        e.g., :obj:`.BatchForceFieldRelaxMaker`.
     """
+    elastic_job_kwargs = {}
+    if prev_dir is not None and prev_dir_argname is not None:
+        elastic_job_kwargs[prev_dir_argname] = prev_dir
+
+    if batch:
+        deformed_structures = [
+            DeformStructureTransformation(deformation).apply_transformation(structure)
+            for deformation in deformations
+        ]
+        relax_job = elastic_relax_maker.make(deformed_structures, **elastic_job_kwargs)
+        relax_job.append_name(f" {len(deformations)} deformations")
+        outputs = [
+            {
+                "stress": relax_job.output[idx].output.stress,
+                "deformation": deformation,
+                "uuid": relax_job.output.uuid,
+                "job_dir": relax_job.output[idx].dir_name,
+            }
+            for idx, deformation in enumerate(deformations)
+        ]
+        return Response(replace=Flow([relax_job], outputs))
+
     relaxations = []
     outputs = []
     for idx, deformation in enumerate(deformations):
@@ -141,9 +168,6 @@ def run_elastic_deformations(
             # automatically converted to a "." in the filename.
             elastic_relax_maker.write_additional_data["transformations:json"] = ts
 
-        elastic_job_kwargs = {}
-        if prev_dir is not None and prev_dir_argname is not None:
-            elastic_job_kwargs[prev_dir_argname] = prev_dir
         # create the job
         relax_job = elastic_relax_maker.make(deformed_structure, **elastic_job_kwargs)
         relax_job.append_name(f" {idx + 1}/{len(deformations)}")
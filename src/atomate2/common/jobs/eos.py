@@ -9,14 +9,13 @@ import numpy as np
 from jobflow import job
 from monty.json import MSONable
 from pymatgen.alchemy.materials import TransformedStructure
-from pymatgen.analysis.eos import EOS, EOSError
 from pymatgen.transformations.standard_transformations import (
     DeformStructureTransformation,
 )
-from scipy.optimize import leastsq
+
+from atomate2.common.analysis.eos import fit_energy_eos, fit_pressure_eos
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
     from typing import Any
 
     from jobflow import Job
@@ -174,19 +173,13 @@ class PostProcessEosEnergy(EOSPostProcessor):
 
     def eval(self) -> None:
         """Fit the input data to each EOS in ``self.eos_models``."""
-        for jobtype in self._use_job_types:
-            self.results[jobtype]["EOS"] = {}
-            for eos_name in self.eos_models:
-                try:
-                    eos = EOS(eos_name=eos_name).fit(
-                        self.results[jobtype]["volume"], self.results[jobtype]["energy"]
-                    )
-                    self.results[jobtype]["EOS"][eos_name] = {
-                        **eos.results,
-                        "b0 GPa": float(eos.b0_GPa),
-                    }
-                except EOSError as exc:
-                    self.results[jobtype]["EOS"][eos_name] = {"exception": str(exc)}
+        fitted = fit_energy_eos(
+            [self.results[jobtype]["volume"] for jobtype in self._use_job_types],
+            [self.results[jobtype]["energy"] for jobtype in self._use_job_types],
+            self.eos_models,
+        )
+        for jobtype, eos_results in zip(self._use_job_types, fitted, strict=True):
+            self.results[jobtype]["EOS"] = eos_results
 
 
 class PostProcessEosPressure(EOSPostProcessor):
@@ -230,57 +223,8 @@ class PostProcessEosPressure(EOSPostProcessor):
     name: str = "EOS pressure vs volume fit"
     min_data_points: int | None = 3
 
-    @staticmethod
-    def _birch_murnaghan_pressure(
-        volume: float, b0: float, b1: float, v0: float
-    ) -> float:
-        """
-        Compute pressure from Birch-Murnaghan equation of state.
-
-        Parameters
-        ----------
-        volume : float
-            A single volume or list of them to evaluate the pressure.
-        b0 : float
-            The Birch-Murnaghan (BM) bulk modulus at the equilibrium volume V = v0
-        b1 : float
-            The derivative of the bulk modulus wrt pressure at v0
-        v0 : float
-            The equilibrium volume
-
-        Returns
-        -------
-        float : the BM pressure
-
-        BM EOS for E(V) has the form::
-
-            E(V) = E0 + 9 B0 V0 / 16 * (
-                (B1 - 4)*eta**6 + (14 - 3*B1)*eta**4 + (3*B1 - 16)*eta**2 + 6 - B1
-            )
-            eta = (V0/V)**(1/3).
-
-        This function computes p = - dE / dV via the chain rule,::
-
-            p = d E / d eta * (- d eta / dV)
-            = eta**4/(3*V0) * d E / d eta
-
-        """
-        eta = (v0 / volume) ** (1.0 / 3.0)
-        return (
-            3
-            * b0
-            * eta**5
-            / 8.0
-            * (3 * (b1 - 4) * eta**4 + 2 * (14.0 - 3 * b1) * eta**2 + 3 * b1 - 16.0)
-        )
-
-    def _initial_fit(self) -> dict:
-        """Generate initial polynomial fit for p(V) curve.
-
-        ::
-            p(V) / V = a + b V + c V**2
-        """
-        init_pars = {}
+    def _get_pressures(self) -> None:
+        """Compute the pressures from the stress tensors if needed."""
         for jobtype in self._use_job_types:
             if self.results[jobtype].get("stress") and (
                 not self.results[jobtype].get("pressure")
@@ -289,59 +233,18 @@ class PostProcessEosPressure(EOSPostProcessor):
                     1.0 / 3.0 * np.trace(np.array(stress_tensor))
                     for stress_tensor in self.results[jobtype]["stress"]
                 ]
-            poly_pars = np.polyfit(
-                self.results[jobtype]["volume"],
-                np.array(self.results[jobtype]["pressure"])
-                / np.array(self.results[jobtype]["volume"]),
-                deg=2,
-            )
-
-            radicand = poly_pars[1] ** 2 - 4.0 * poly_pars[0] * poly_pars[2]
-            if radicand < 0.0:
-                v0 = self.results[jobtype]["volume"][
-                    np.argmin(self.results[jobtype]["energy"])
-                ]
-            else:
-                min_abs_pressure = 1e20
-                for i in range(2):
-                    _v0 = (-poly_pars[1] + (-1) ** i * radicand ** (0.5)) / (
-                        2.0 * poly_pars[0]
-                    )
-                    pressure = _v0 * np.polyval(poly_pars, _v0)
-                    if _v0 > 0.0 and abs(pressure) < min_abs_pressure:
-                        min_abs_pressure = abs(pressure)
-                        v0 = _v0
-
-            b0 = -(
-                3 * poly_pars[0] * v0**3 + 2 * poly_pars[1] * v0**2 + poly_pars[0] * v0
-            )
-            b1 = (
-                v0
-                * (9 * poly_pars[0] * v0**2 + 4 * poly_pars[1] * v0 + poly_pars[0])
-                / b0
-            )
-
-            init_pars[jobtype] = [b0, b1, v0]
-
-        return init_pars
-
-    def _objective(self, pars: Sequence, jobtype: str) -> float:
-        return np.array(
-            self.results[jobtype]["pressure"]
-        ) - self._birch_murnaghan_pressure(
-            np.array(self.results[jobtype]["volume"]), *pars
-        )
 
     def eval(self) -> None:
         """Fit the input data to the Birch-Murnaghan pressure EOS."""
-        initial_pars = self._initial_fit()
-        for jobtype in self._use_job_types:
-            eos_params, ierr = leastsq(
-                self._objective, initial_pars[jobtype], args=(jobtype,)
-            )
-
+        self._get_pressures()
+        fitted = fit_pressure_eos(
+            [self.results[jobtype]["volume"] for jobtype in self._use_job_types],
+            [self.results[jobtype]["pressure"] for jobtype in self._use_job_types],
+            [self.results[jobtype].get("energy") for jobtype in self._use_job_types],
+        )
+        for jobtype, eos_params in zip(self._use_job_types, fitted, strict=True):
             self.results[jobtype]["EOS"] = {}
-            if ierr not in (1, 2, 3, 4):
+            if eos_params is None:
                 self.results[jobtype]["EOS"]["exception"] = (
                     "Optimal EOS parameters not found."
                 )
@@ -427,20 +330,8 @@ class MPMorphPVPostProcess(PostProcessEosPressure):
 
     def eval(self) -> None:
         """Fit the input data to the Birch-Murnaghan pressure EOS."""
-        initial_pars = self._initial_fit()
-        for jobtype in self._use_job_types:
-            eos_params, ierr = leastsq(
-                self._objective, initial_pars[jobtype], args=(jobtype,)
-            )
-            self.results[jobtype]["EOS"] = {}
-            if ierr not in (1, 2, 3, 4):
-                self.results[jobtype]["EOS"]["exception"] = (
-                    "Optimal EOS parameters not found."
-                )
-            else:
-                for i, key in enumerate(["b0", "b1", "v0"]):
-                    self.results[jobtype]["EOS"][key] = eos_params[i]
-
+        super().eval()
+        jobtype = self._use_job_types[-1]
         self.results["V0"] = self.results[jobtype]["EOS"].get("v0")
         self.results["Vmax"] = max(self.results["relax"]["volume"])
         self.results["Vmin"] = min(self.results["relax"]["volume"])
@@ -458,21 +349,9 @@ class MPMorphEVPostProcess(PostProcessEosEnergy):
     )
 
     def eval(self) -> None:
-        """Fit the input data to the Birch-Murnaghan pressure EOS."""
-        for jobtype in self._use_job_types:
-            self.results[jobtype]["EOS"] = {}
-            for eos_name in self.eos_models:
-                try:
-                    eos = EOS(eos_name=eos_name).fit(
-                        self.results[jobtype]["volume"], self.results[jobtype]["energy"]
-                    )
-                    self.results[jobtype]["EOS"][eos_name] = {
-                        **eos.results,
-                        "b0 GPa": float(eos.b0_GPa),
-                    }
-                except EOSError as exc:
-                    self.results[jobtype]["EOS"][eos_name] = {"exception": str(exc)}
-
+        """Fit the input data to each EOS in ``self.eos_models``."""
+        super().eval()
+        jobtype = self._use_job_types[-1]
         for eos_func in self.eos_models:
             if v0 := self.results[jobtype]["EOS"][eos_func].get("v0"):
                 self.results["V0"] = v0
@@ -57,6 +57,7 @@ def run_phonon_jobs(
     symprec: float = SETTINGS.SYMPREC,
     prev_calc_dir_argname: str = None,
     prev_dir_dict: dict = None,
+    shared_displacements: bool = False,
 ) -> Response:
     """Run all phonon jobs if the symmetry stayed the same.
 
@@ -73,6 +74,9 @@ def run_phonon_jobs(
     prev_dir_dict: dict
         dictionary of previous calculation directories keyed by the different
         types of optimization runs
+    shared_displacements: bool
+        If True, plan the displacements of all structures in one job and run them
+        as one set of jobs, see :obj:`.BasePhononMaker.make_volumes`.
 
     Returns
     -------
@@ -87,28 +91,46 @@ def run_phonon_jobs(
         jobs = []
         phonon_yaml_dirs = dict.fromkeys(("ground", "plus", "minus"), None)
         phonon_imaginary_modes = dict.fromkeys(("ground", "plus", "minus"), None)
-        for st, struct in opt_struct.items():
-            # phonon run for all 3 optimized structures (ground state, expanded, shrunk)
-            phonon_kwargs = {}
-            if prev_calc_dir_argname is not None:
-                phonon_kwargs[prev_calc_dir_argname] = prev_dir_dict[st]
-            phonon_job = phonon_maker.make(structure=struct, **phonon_kwargs)
-            phonon_job.append_name(f" {st}")
+        if shared_displacements:
+            # supercell matrix is determined from the ground state structure
+            phonon_flow = phonon_maker.make_volumes(
+                list(opt_struct.values()),
+                prev_dirs=[prev_dir_dict[st] for st in opt_struct],
+            )
+            jobs.append(phonon_flow)
+            # the outputs of the flow reference the analysis job of each structure
+            flow_jobs = {flow_job.uuid: flow_job for flow_job in phonon_flow.jobs}
+            phonon_collects = [flow_jobs[output.uuid] for output in phonon_flow.output]
+            for st, phonon_collect in zip(opt_struct, phonon_collects, strict=True):
+                phonon_collect.append_name(f" {st}")
+        else:
+            phonon_collects = []
+            for st, struct in opt_struct.items():
+                # phonon run for all 3 optimized structures
+                # (ground state, expanded, shrunk)
+                phonon_kwargs = {}
+                if prev_calc_dir_argname is not None:
+                    phonon_kwargs[prev_calc_dir_argname] = prev_dir_dict[st]
+                phonon_job = phonon_maker.make(structure=struct, **phonon_kwargs)
+                phonon_job.append_name(f" {st}")
+                jobs.append(phonon_job)
+                phonon_collects.append(phonon_job.jobs[-1])
+
+        for st, phonon_collect in zip(opt_struct, phonon_collects, strict=True):
             # change default phonopy.yaml file name to ensure workflow can be
             # run without having to create folders, thus
             # prevent overwriting and easier to identify yaml file belong
             # to corresponding phonon run
-            phonon_job.jobs[-1].function_kwargs.update(
+            phonon_collect.function_kwargs.update(
                 filename_phonopy_yaml=f"{st}_phonopy.yaml",
                 filename_band_yaml=f"{st}_phonon_band_structure.yaml",
                 filename_dos_yaml=f"{st}_phonon_dos.yaml",
                 filename_bs=f"{st}_phonon_band_structure.pdf",
                 filename_dos=f"{st}_phonon_dos.pdf",
             )
-            jobs.append(phonon_job)
             # store each phonon run task doc
-            phonon_yaml_dirs[st] = phonon_job.output.jobdirs.taskdoc_run_job_dir
-            phonon_imaginary_modes[st] = phonon_job.output.has_imaginary_modes
+            phonon_yaml_dirs[st] = phonon_collect.output.jobdirs.taskdoc_run_job_dir
+            phonon_imaginary_modes[st] = phonon_collect.output.has_imaginary_modes
 
         return Response(
             replace=Flow(jobs),
@@ -8,6 +8,7 @@ import warnings
 from typing import TYPE_CHECKING
 
 import numpy as np
+import spglib
 from jobflow import Flow, Response, job
 from phonopy import Phonopy
 from pymatgen.core import Structure
@@ -133,6 +134,32 @@ def generate_phonon_displacements(
         "of the symmetry of the structure and thus will be removed now.",
         stacklevel=2,
     )
+    phonon = _get_displaced_phonopy(
+        structure,
+        supercell_matrix,
+        displacement,
+        sym_reduce,
+        symprec,
+        use_symmetrized_structure,
+        kpath_scheme,
+        code,
+    )
+    supercells = phonon.supercells_with_displacements
+
+    return [get_pmg_structure(cell) for cell in supercells]
+
+
+def _get_displaced_phonopy(
+    structure: Structure,
+    supercell_matrix: np.array,
+    displacement: float,
+    sym_reduce: bool,
+    symprec: float,
+    use_symmetrized_structure: str | None,
+    kpath_scheme: str,
+    code: str,
+) -> Phonopy:
+    """Get a phonopy object with generated displacements for a structure."""
     if "magmom" in structure.site_properties:
         # remove_site_property is in-place so make a structure copy first
         no_mag_struct = structure.copy().remove_site_property(property_name="magmom")
@@ -166,10 +193,130 @@ def generate_phonon_displacements(
         is_symmetry=sym_reduce,
     )
     phonon.generate_displacements(distance=displacement)
+    return phonon
 
-    supercells = phonon.supercells_with_displacements
 
-    return [get_pmg_structure(cell) for cell in supercells]
+def _get_symmetry_key(structure: Structure, symprec: float) -> tuple:
+    """
+    Get a key identifying structures with the same displacement pattern.
+
+    Structures with equal keys have the same space group operations in the
+    basis of their own lattice and the same site symmetries, so that phonopy
+    chooses the same displacement directions in lattice coordinates.
+    """
+    dataset = spglib.get_symmetry_dataset(
+        (
+            structure.lattice.matrix,
+            structure.frac_coords,
+            [site.specie.Z for site in structure],
+        ),
+        symprec=symprec,
+    )
+    if dataset is None:
+        return (None, id(structure))
+    return (
+        dataset.number,
+        tuple(site.specie.Z for site in structure),
+        tuple(dataset.equivalent_atoms.tolist()),
+        np.asarray(dataset.rotations, dtype=int).tobytes(),
+    )
+
+
+@job(data=[Structure])
+def generate_shared_phonon_displacements(
+    structures: list[Structure],
+    supercell_matrix: np.array,
+    displacement: float,
+    sym_reduce: bool,
+    symprec: float,
+    use_symmetrized_structure: str | None,
+    kpath_scheme: str,
+    code: str,
+) -> dict[str, list]:
+    """
+    Generate displaced structures for several volumes of the same material.
+
+    The symmetry analysis and displacement generation of phonopy are only run once
+    for every set of structures sharing the same space group operations and site
+    symmetries, e.g., isotropically scaled volumes. The displacements are
+    transferred to the other structures of the set in lattice coordinates, which
+    reproduces the displacements phonopy would generate for them.
+
+    Parameters
+    ----------
+    structures: list[Structure]
+        Fully optimized input structures for the phonon runs, all with the same
+        number and order of sites
+    supercell_matrix: np.array
+        array to describe supercell matrix, shared by all structures
+    displacement: float
+        displacement in Angstrom
+    sym_reduce: bool
+        if True, symmetry will be used to generate displacements
+    symprec: float
+        precision to determine symmetry
+    use_symmetrized_structure: str or None
+        primitive, conventional or None
+    kpath_scheme: str
+        scheme to generate kpath
+    code:
+        code to perform the computations
+
+    Returns
+    -------
+    dict
+        The displaced structures ("displacements") and phonopy displacement
+        datasets ("datasets") of every structure, and the index of the symmetry
+        group every structure was assigned to ("groups").
+    """
+    planned: dict[tuple, tuple[int, Phonopy]] = {}
+    outputs: dict[str, list] = {"displacements": [], "datasets": [], "groups": []}
+    for structure in structures:
+        key = _get_symmetry_key(structure, symprec) if sym_reduce else ()
+        if key not in planned:
+            reference = _get_displaced_phonopy(
+                structure,
+                supercell_matrix,
+                displacement,
+                sym_reduce,
+                symprec,
+                use_symmetrized_structure,
+                kpath_scheme,
+                code,
+            )
+            planned[key] = (len(planned), reference)
+        group, reference = planned[key]
+
+        # supercells do not depend on symmetry, so skip the symmetry analysis
+        cell = get_phonopy_structure(structure)
+        cell.magnetic_moments = None
+        phonon = Phonopy(
+            cell, supercell_matrix, primitive_matrix=None, is_symmetry=False
+        )
+        ref_lattice = reference.supercell.cell
+        lattice = phonon.supercell.cell
+        first_atoms = []
+        for disp in reference.dataset["first_atoms"]:
+            cart = np.linalg.solve(ref_lattice.T, disp["displacement"]) @ lattice
+            first_atoms.append(
+                {
+                    "number": disp["number"],
+                    "displacement": cart * displacement / np.linalg.norm(cart),
+                }
+            )
+        phonon.dataset = {"natom": len(phonon.supercell), "first_atoms": first_atoms}
+
+        outputs["displacements"].append(
+            [get_pmg_structure(cell) for cell in phonon.supercells_with_displacements]
+        )
+        outputs["datasets"].append(phonon.dataset)
+        outputs["groups"].append(group)
+
+    logger.info(
+        f"Planned displacements for {len(structures)} structures with "
+        f"{len(planned)} symmetry analyses"
+    )
+    return outputs
 
 
 @job(
@@ -251,12 +398,13 @@ def run_phonon_displacements(
     prev_dir: str | Path = None,
     prev_dir_argname: str = None,
     socket: bool = False,
+    batch: bool = False,
 ) -> Flow:
     """
     Run phonon displacements.
 
     Note, this job will replace itself with N displacement calculations,
-    or a single socket calculation for all displacements.
+    or a single socket or batch calculation for all displacements.
 
     Parameters
     ----------
@@ -274,6 +422,10 @@ def run_phonon_displacements(
         argument name for the prev_dir variable
     socket: bool
         If True use the socket-io interface to increase performance
+    batch: bool
+        If True, compute all displacements in a single job. The phonon maker must
+        accept a list of structures and return a list of task documents, e.g.,
+        :obj:`.BatchForceFieldStaticMaker`.
     """
     phonon_jobs = []
     outputs: dict[str, list] = {
@@ -301,6 +453,18 @@ def run_phonon_displacements(
         outputs["uuids"] = [phonon_job.output.uuid] * len(displacements)
         outputs["dirs"] = [phonon_job.output.dir_name] * len(displacements)
         outputs["forces"] = phonon_job.output.output.all_forces
+    elif batch:
+        phonon_job = phonon_maker.make(displacements, **phonon_job_kwargs)
+        phonon_job.append_name(f" {len(displacements)} displacements")
+        phonon_jobs.append(phonon_job)
+        outputs["displacement_number"] = list(range(len(displacements)))
+        outputs["uuids"] = [phonon_job.output.uuid] * len(displacements)
+        outputs["dirs"] = [
+            phonon_job.output[idx].dir_name for idx in range(len(displacements))
+        ]
+        outputs["forces"] = [
+            phonon_job.output[idx].output.forces for idx in range(len(displacements))
+        ]
     else:
         for idx, displacement in enumerate(displacements):
             if prev_dir is not None:
@@ -329,3 +493,104 @@ def run_phonon_displacements(
 
     displacement_flow = Flow(phonon_jobs, outputs)
     return Response(replace=displacement_flow)
+
+
+@job(data=["forces", "displaced_structures"])
+def run_shared_phonon_displacements(
+    displacements: list[list[Structure]],
+    structures: list[Structure],
+    supercell_matrix: Matrix3D,
+    phonon_maker: BaseVaspMaker | ForceFieldStaticMaker | BaseAimsMaker = None,
+    prev_dirs: list[str | Path | None] | None = None,
+    prev_dir_argname: str = None,
+    batch: bool = False,
+) -> Flow:
+    """
+    Run the phonon displacements of several structures as one set of jobs.
+
+    Note, this job will replace itself with the displacement calculations of all
+    structures, or a single batch calculation for all structures and displacements.
+
+    Parameters
+    ----------
+    displacements: list[list[Structure]]
+        The displacements to calculate for every structure, e.g., as generated by
+        :obj:`generate_shared_phonon_displacements`.
+    structures: list[Structure]
+        Fully optimized structures used for the phonon computations.
+    supercell_matrix: Matrix3D
+        supercell matrix for meta data
+    phonon_maker : .BaseVaspMaker or .ForceFieldStaticMaker or .BaseAimsMaker
+        A maker to use to generate dispacement calculations
+    prev_dirs: list[str or Path or None] or None
+        The previous working directory of every structure
+    prev_dir_argname: str
+        argument name for the prev_dir variable
+    batch: bool
+        If True, compute all displacements of all structures in a single job. The
+        phonon maker must accept a list of structures and return a list of task
+        documents, e.g., :obj:`.BatchForceFieldStaticMaker`. Previous directories
+        are not passed to the batch job.
+
+    Returns
+    -------
+    Flow
+        A flow with a list of displacement outputs, one per structure, in the
+        format of :obj:`run_phonon_displacements`.
+    """
+    prev_dirs = prev_dirs or [None] * len(structures)
+    phonon_jobs = []
+    outputs: list[dict[str, list]] = [
+        {"displacement_number": [], "forces": [], "uuids": [], "dirs": []}
+        for _ in structures
+    ]
+
+    if batch:
+        flat_displacements = [disp for disps in displacements for disp in disps]
+        phonon_job = phonon_maker.make(flat_displacements)
+        phonon_job.append_name(
+            f" {len(flat_displacements)} displacements of {len(structures)} structures"
+        )
+        phonon_jobs.append(phonon_job)
+        offset = 0
+        for disps, output in zip(displacements, outputs, strict=True):
+            for idx in range(len(disps)):
+                output["displacement_number"].append(idx)
+                output["uuids"].append(phonon_job.output.uuid)
+                output["dirs"].append(phonon_job.output[offset + idx].dir_name)
+                output["forces"].append(phonon_job.output[offset + idx].output.forces)
+            offset += len(disps)
+    else:
+        for istruct, (disps, structure, prev_dir, output) in enumerate(
+            zip(displacements, structures, prev_dirs, outputs, strict=True)
+        ):
+            for idx, displacement in enumerate(disps):
+                phonon_job_kwargs = {}
+                if prev_dir is not None and prev_dir_argname is not None:
+                    phonon_job_kwargs[prev_dir_argname] = prev_dir
+                phonon_job = phonon_maker.make(displacement, **phonon_job_kwargs)
+                phonon_job.append_name(
+                    f" structure {istruct + 1} {idx + 1}/{len(disps)}"
+                )
+
+                # we will add some meta data
+                info = {
+                    "displacement_number": idx,
+                    "structure_number": istruct,
+                    "original_structure": structure,
+                    "supercell_matrix": supercell_matrix,
+                    "displaced_structure": displacement,
+                }
+                with contextlib.suppress(Exception):
+                    phonon_job.update_maker_kwargs(
+                        {"_set": {"write_additional_data->phonon_info:json": info}},
+                        dict_mod=True,
+                    )
+                phonon_jobs.append(phonon_job)
+                output["displacement_number"].append(idx)
+                output["uuids"].append(phonon_job.output.uuid)
+                output["dirs"].append(phonon_job.output.dir_name)
+                output["forces"].append(phonon_job.output.output.forces)
+
+    displacement_flow = Flow(phonon_jobs, outputs)
+    return Response(replace=displacement_flow)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from jobflow import Flow, Response, job
 
 from atomate2.common.schemas.phonons import PhononBSDOSDoc
@@ -58,7 +59,10 @@ def get_supercell_size(
 
 @job(data=[PhononBSDOSDoc])
 def get_phonon_jobs(
-    phonon_maker: BasePhononMaker, eos_output: dict, supercell_matrix: list[list[float]]
+    phonon_maker: BasePhononMaker,
+    eos_output: dict,
+    supercell_matrix: list[list[float]],
+    shared_displacements: bool = False,
 ) -> Flow:
     """
     Start all relevant phonon jobs.
@@ -71,7 +75,19 @@ def get_phonon_jobs(
         Output from EOSMaker
     supercell_matrix:
         Supercell matrix to be passed into the phonon runs.
+    shared_displacements: bool
+        If True, plan the displacements of all volumes in one job and run them as
+        one set of jobs, see :obj:`.BasePhononMaker.make_volumes`.
     """
+    if shared_displacements:
+        phonon_flow = phonon_maker.make_volumes(
+            eos_output["relax"]["structure"],
+            prev_dirs=eos_output["relax"]["dir_name"],
+            supercell_matrix=supercell_matrix,
+        )
+        phonon_flow.append_name(" eos deformations")
+        return Response(replace=phonon_flow)
+
     phonon_jobs = []
     outputs = []
     for istructure, structure in enumerate(eos_output["relax"]["structure"]):
@@ -121,55 +137,45 @@ def analyze_free_energy(
     kwargs: dict
         Additional keywords to pass to this job
     """
-    # only add free energies if there are no imaginary modes
-    # tolerance has to be tested
-    electronic_energies: list[list[float]] = []
-    free_energies: list[list[float]] = []
-    heat_capacities: list[list[float]] = []
-    entropies: list[list[float]] = []
-    temperatures: list[float] = []
-    formula_units: list[int] = []
-    volume: list[float] = [
+    volumes = [
         output.volume_per_formula_unit * output.formula_units
         for output in phonon_outputs
     ]
     supercell_matrix: list[list[float]] = phonon_outputs[0].supercell_matrix
+    temperatures = np.asarray(phonon_outputs[0].temperatures, dtype=float)
 
-    for itemp, temp in enumerate(phonon_outputs[0].temperatures):
-        temperatures.append(float(temp))
-        sorted_volume = []
-        electronic_energies.append([])
-        free_energies.append([])
-        heat_capacities.append([])
-        entropies.append([])
-
-        for _, output in sorted(zip(volume, phonon_outputs, strict=True)):
-            # check if imaginary modes
-            if (not output.has_imaginary_modes) or ignore_imaginary_modes:
-                electronic_energies[itemp].append(output.total_dft_energy)
-                # convert from J/mol in kJ/mol
-                free_energies[itemp].append(output.free_energies[itemp] / 1000.0)
-                heat_capacities[itemp].append(output.heat_capacities[itemp])
-                entropies[itemp].append(output.entropies[itemp])
-                sorted_volume.append(output.volume_per_formula_unit)
-                formula_units.append(output.formula_units)
+    # only add free energies if there are no imaginary modes
+    # tolerance has to be tested
+    outputs = [
+        phonon_outputs[idx]
+        for idx in np.argsort(volumes, kind="stable")
+        if ignore_imaginary_modes or not phonon_outputs[idx].has_imaginary_modes
+    ]
 
     # potentially implement a space group check in the future
 
-    if len(set(formula_units)) != 1:
+    formula_units = {output.formula_units for output in outputs}
+    if len(formula_units) != 1:
         raise ValueError("There should be only one formula unit.")
 
+    # properties of shape (temperatures, volumes)
+    free_energies = np.array([output.free_energies for output in outputs]).T
+    electronic_energies = np.broadcast_to(
+        [output.total_dft_energy for output in outputs], free_energies.shape
+    )
+
     return PhononQHADoc.from_phonon_runs(
-        volumes=sorted_volume,
-        free_energies=free_energies,
+        volumes=[output.volume_per_formula_unit for output in outputs],
+        # convert from J/mol in kJ/mol
+        free_energies=free_energies / 1000.0,
         electronic_energies=electronic_energies,
-        entropies=entropies,
-        heat_capacities=heat_capacities,
+        entropies=np.array([output.entropies for output in outputs]).T,
+        heat_capacities=np.array([output.heat_capacities for output in outputs]).T,
         temperatures=temperatures,
         structure=structure,
         t_max=t_max,
         pressure=pressure,
-        formula_units=next(iter(set(formula_units))),
+        formula_units=next(iter(formula_units)),
         eos_type=eos_type,
         supercell_matrix=supercell_matrix,
         **kwargs,
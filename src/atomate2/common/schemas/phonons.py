@@ -1,11 +1,14 @@
 """Schemas for phonon documents."""
 
+import base64
 import copy
 import logging
+import zlib
 from pathlib import Path
 from typing import Optional, Union
 
 import numpy as np
+import scipy.constants as const
 from emmet.core.math import Matrix3D
 from emmet.core.structure import StructureMetadata
 from monty.json import MSONable
@@ -23,7 +26,7 @@ from pymatgen.io.phonopy import (
 )
 from pymatgen.io.vasp import Kpoints
 from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
-from pymatgen.phonon.dos import PhononDos
+from pymatgen.phonon.dos import BOLTZ_THZ_PER_K, THZ_TO_J, PhononDos
 from pymatgen.phonon.plotter import PhononBSPlotter, PhononDosPlotter
 from pymatgen.symmetry.bandstructure import HighSymmKpath
 from pymatgen.symmetry.kpath import KPathSeek
@@ -33,6 +36,9 @@ from atomate2.aims.utils.units import omegaToTHz
 
 logger = logging.getLogger(__name__)
 
+# np.trapz was renamed to np.trapezoid in numpy 2.0
+_trapezoid = np.trapezoid if hasattr(np, "trapezoid") else np.trapz  # noqa: NPY201
+
 
 def get_factor(code: str) -> float:
     """
@@ -60,6 +66,144 @@ def get_factor(code: str) -> float:
     raise ValueError(f"Frequency conversion factor for code ({code}) not defined.")
 
 
+def get_phonopy_dataset(dataset: dict) -> dict:
+    """
+    Convert a (possibly JSON-sanitized) phonopy displacement dataset to arrays.
+
+    Parameters
+    ----------
+    dataset: dict
+        A phonopy type-1 displacement dataset
+
+    Returns
+    -------
+    dict
+        The dataset with displacements as numpy arrays
+    """
+    return {
+        "natom": int(dataset["natom"]),
+        "first_atoms": [
+            {
+                "number": int(disp["number"]),
+                "displacement": np.array(disp["displacement"], dtype=float),
+            }
+            for disp in dataset["first_atoms"]
+        ],
+    }
+
+
+def encode_array(array: np.ndarray | list) -> dict:
+    """
+    Encode an array as zlib-compressed, base64-encoded raw bytes.
+
+    Parameters
+    ----------
+    array: np.ndarray or list
+        The array to encode
+
+    Returns
+    -------
+    dict
+        The encoded data with the dtype and shape needed to decode it
+    """
+    array = np.ascontiguousarray(array)
+    return {
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(zlib.compress(array.tobytes())).decode("ascii"),
+    }
+
+
+def decode_array(encoded: dict) -> np.ndarray:
+    """
+    Decode an array encoded with :obj:`encode_array`.
+
+    Parameters
+    ----------
+    encoded: dict
+        The encoded array
+
+    Returns
+    -------
+    np.ndarray
+        The decoded (writable) array
+    """
+    # a bytearray buffer makes the array writable without another copy
+    return np.frombuffer(
+        bytearray(zlib.decompress(base64.b64decode(encoded["data"]))),
+        dtype=encoded["dtype"],
+    ).reshape(encoded["shape"])
+
+
+def get_thermal_properties(
+    dos: PhononDos, temperatures: np.ndarray, structure: Structure
+) -> dict[str, np.ndarray]:
+    """
+    Get thermodynamic properties for all temperatures at once from a phonon DOS.
+
+    This evaluates the same DOS integrals as the corresponding methods of
+    pymatgen's PhononDos, but for all temperatures in one array operation.
+    Only positive frequencies are used.
+
+    Parameters
+    ----------
+    dos: PhononDos
+        The phonon density of states
+    temperatures: np.ndarray
+        The temperatures in K
+    structure: Structure
+        The structure used to determine the number of formula units
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The Helmholtz free energies and internal energies in J/mol, and the
+        entropies and heat capacities in J/(K*mol), per formula unit
+    """
+    temperatures = np.asarray(temperatures, dtype=float)
+    # the same (non-negative) frequencies as used by the PhononDos methods
+    is_positive = np.asarray(dos.frequencies) >= 0
+    if not is_positive.any():
+        raise ValueError("No positive frequencies found")
+    freqs = np.asarray(dos.frequencies)[is_positive]
+    dens = np.asarray(dos.densities)[is_positive]
+    formula_units = (
+        structure.composition.num_atoms
+        / structure.composition.reduced_composition.num_atoms
+    )
+
+    is_zero = temperatures == 0
+    temps = np.where(is_zero, 1.0, temperatures)[:, None]
+    wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temps)
+    log_2sinh = np.log(2 * np.sinh(wd2kt))
+    coth = 1 / np.tanh(wd2kt)
+    mol_k = const.Boltzmann * const.Avogadro / formula_units
+
+    free_energies = _trapezoid(log_2sinh * dens, x=freqs, axis=1)
+    free_energies *= mol_k * temps[:, 0]
+    entropies = _trapezoid((wd2kt * coth - log_2sinh) * dens, x=freqs, axis=1)
+    entropies *= mol_k
+    internal_energies = _trapezoid(freqs * coth * dens, x=freqs, axis=1) / 2
+    internal_energies *= THZ_TO_J * const.Avogadro / formula_units
+    csch2 = 1 / np.sinh(wd2kt) ** 2
+    heat_capacities = _trapezoid(wd2kt**2 * csch2 * dens, x=freqs, axis=1)
+    heat_capacities *= mol_k
+
+    # at 0 K, only the zero-point energy remains
+    zero_point_energy = dos.zero_point_energy(structure=structure)
+    free_energies[is_zero] = zero_point_energy
+    internal_energies[is_zero] = zero_point_energy
+    entropies[is_zero] = 0
+    heat_capacities[is_zero] = 0
+
+    return {
+        "free_energies": free_energies,
+        "entropies": entropies,
+        "internal_energies": internal_energies,
+        "heat_capacities": heat_capacities,
+    }
+
+
 class PhononComputationalSettings(BaseModel):
     """Collection to store computational settings for the phonon computation."""
 
@@ -107,10 +251,57 @@ class PhononUUIDs(BaseModel):
 
 
 class ForceConstants(MSONable):
-    """A force constants class."""
+    """A force constants class.
+
+    If ``compact`` is True, the force constants are serialized as zlib-compressed
+    raw bytes with dtype and shape metadata instead of nested lists. Compact data
+    are only decoded when the force constants are first accessed.
+    """
+
+    def __init__(
+        self,
+        force_constants: list[list[Matrix3D]] | np.ndarray | None = None,
+        compact: bool = False,
+    ) -> None:
+        self._force_constants = force_constants
+        self._encoded: dict | None = None
+        self.compact = compact
+
+    @property
+    def force_constants(self) -> list[list[Matrix3D]] | np.ndarray:
+        """The force constants, decoded from the compact form if needed."""
+        if self._force_constants is None and self._encoded is not None:
+            self._force_constants = decode_array(self._encoded)
+            self._encoded = None
+        return self._force_constants
+
+    @force_constants.setter
+    def force_constants(self, force_constants: list | np.ndarray) -> None:
+        self._force_constants = force_constants
+        self._encoded = None
+
+    def as_dict(self) -> dict:
+        """Get a JSON serializable dict representation."""
+        dct = {"@module": type(self).__module__, "@class": type(self).__name__}
+        if self.compact:
+            dct["compact"] = True
+            dct["force_constants"] = self._encoded or encode_array(
+                self._force_constants
+            )
+        elif isinstance(self.force_constants, np.ndarray):
+            dct["force_constants"] = self.force_constants.tolist()
+        else:
+            dct["force_constants"] = self.force_constants
+        return dct
 
-    def __init__(self, force_constants: list[list[Matrix3D]]) -> None:
-        self.force_constants = force_constants
+    @classmethod
+    def from_dict(cls, dct: dict) -> Self:
+        """Create a ForceConstants object, without decoding compact data."""
+        if not dct.get("compact"):
+            return cls(dct["force_constants"])
+        force_constants = cls(compact=True)
+        force_constants._encoded = dct["force_constants"]  # noqa: SLF001
+        return force_constants
 
 
 class PhononJobDirs(BaseModel):
@@ -313,7 +504,11 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             symprec=symprec,
             is_symmetry=sym_reduce,
         )
-        phonon.generate_displacements(distance=displacement)
+        if kwargs.get("displacement_dataset") is not None:
+            # displacements planned once for several volumes
+            phonon.dataset = get_phonopy_dataset(kwargs["displacement_dataset"])
+        else:
+            phonon.generate_displacements(distance=displacement)
         set_of_forces = [np.array(forces) for forces in displacement_data["forces"]]
 
         if born is not None and epsilon_static is not None:
@@ -424,22 +619,29 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             force_gamma=True,
         )
 
+        # The q-point mesh is diagonalized once and reused for the total and
+        # projected DOS and the thermal displacement matrices. Eigenvectors on the
+        # full mesh are only needed for the latter two.
+        with_eigenvectors = bool(
+            kwargs.get("calculate_pdos", False)
+            or kwargs.get("create_thermal_displacements")
+        )
+        phonon.run_mesh(
+            kpoint.kpts[0],
+            with_eigenvectors=with_eigenvectors,
+            is_mesh_symmetry=not with_eigenvectors,
+        )
+        phonon_dos_sigma = kwargs.get("phonon_dos_sigma")
+        dos_use_tetrahedron_method = kwargs.get("dos_use_tetrahedron_method", True)
+
         # projected dos
         if kwargs.get("calculate_pdos", False):
-            phonon.run_mesh(
-                kpoint.kpts[0], with_eigenvectors=True, is_mesh_symmetry=False
-            )
-            phonon_dos_sigma = kwargs.get("phonon_dos_sigma")
-            dos_use_tetrahedron_method = kwargs.get("dos_use_tetrahedron_method", True)
             phonon.run_projected_dos(
                 sigma=phonon_dos_sigma,
                 use_tetrahedron_method=dos_use_tetrahedron_method,
             )
             phonon.write_projected_dos()
 
-        phonon.run_mesh(kpoint.kpts[0])
-        phonon_dos_sigma = kwargs.get("phonon_dos_sigma")
-        dos_use_tetrahedron_method = kwargs.get("dos_use_tetrahedron_method", True)
         phonon.run_total_dos(
             sigma=phonon_dos_sigma, use_tetrahedron_method=dos_use_tetrahedron_method
         )
@@ -457,37 +659,14 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             kwargs.get("tmin", 0), kwargs.get("tmax", 500), kwargs.get("tstep", 10)
         )
 
-        free_energies = [
-            dos.helmholtz_free_energy(
-                temp=temp, structure=get_pmg_structure(phonon.primitive)
-            )
-            for temp in temperature_range
-        ]
-
-        entropies = [
-            dos.entropy(temp=temp, structure=get_pmg_structure(phonon.primitive))
-            for temp in temperature_range
-        ]
-
-        internal_energies = [
-            dos.internal_energy(
-                temp=temp, structure=get_pmg_structure(phonon.primitive)
-            )
-            for temp in temperature_range
-        ]
-
-        heat_capacities = [
-            dos.cv(temp=temp, structure=get_pmg_structure(phonon.primitive))
-            for temp in temperature_range
-        ]
+        thermal_properties = get_thermal_properties(
+            dos, temperature_range, get_pmg_structure(phonon.primitive)
+        )
 
         # will compute thermal displacement matrices
         # for the primitive cell (phonon.primitive!)
         # only this is available in phonopy
         if kwargs.get("create_thermal_displacements"):
-            phonon.run_mesh(
-                kpoint.kpts[0], with_eigenvectors=True, is_mesh_symmetry=False
-            )
             freq_min_thermal_displacements = kwargs.get(
                 "freq_min_thermal_displacements", 0.0
             )
@@ -532,16 +711,19 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             meta_structure=structure,
             phonon_bandstructure=bs_symm_line,
             phonon_dos=dos,
-            free_energies=free_energies,
-            internal_energies=internal_energies,
-            heat_capacities=heat_capacities,
-            entropies=entropies,
+            free_energies=thermal_properties["free_energies"].tolist(),
+            internal_energies=thermal_properties["internal_energies"].tolist(),
+            heat_capacities=thermal_properties["heat_capacities"].tolist(),
+            entropies=thermal_properties["entropies"].tolist(),
             temperatures=temperature_range.tolist(),
             total_dft_energy=total_dft_energy_per_formula_unit,
             volume_per_formula_unit=volume_per_formula_unit,
             formula_units=formula_units,
             has_imaginary_modes=imaginary_modes,
-            force_constants={"force_constants": phonon.force_constants.tolist()}
+            force_constants=ForceConstants(
+                phonon.force_constants,
+                compact=kwargs.get("compact_force_constants", False),
+            )
             if kwargs["store_force_constants"]
             else None,
             born=borns.tolist() if borns is not None else None,
@@ -93,12 +93,12 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
     def from_phonon_runs(
         cls,
         structure: Structure,
-        volumes: list[float],
-        temperatures: list[float],
-        electronic_energies: list[list[float]],
-        free_energies: list[list[float]],
-        heat_capacities: list[list[float]],
-        entropies: list[list[float]],
+        volumes: Union[list[float], np.ndarray],
+        temperatures: Union[list[float], np.ndarray],
+        electronic_energies: Union[list[list[float]], np.ndarray],
+        free_energies: Union[list[list[float]], np.ndarray],
+        heat_capacities: Union[list[list[float]], np.ndarray],
+        entropies: Union[list[list[float]], np.ndarray],
         supercell_matrix: list[list[float]],
         t_max: float = None,
         pressure: float = None,
@@ -111,12 +111,16 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
         Parameters
         ----------
         structure: Structure object
-        volumes: list of floats
-        temperatures: list of floats
-        electronic_energies: list of list of floats
-        free_energies: list of list of floats
-        heat_capacities: list of list of floats
-        entropies: list of list of floats
+        volumes: list of floats or array of shape (volumes,)
+        temperatures: list of floats or array of shape (temperatures,)
+        electronic_energies: list of list of floats or array
+            shape (temperatures, volumes)
+        free_energies: list of list of floats or array
+            in kJ/mol, shape (temperatures, volumes)
+        heat_capacities: list of list of floats or array
+            shape (temperatures, volumes)
+        entropies: list of list of floats or array
+            shape (temperatures, volumes)
         supercell_matrix: list of list of floats
         t_max: float
         pressure: float
@@ -131,17 +135,23 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
         """
         import warnings
 
+        volumes = np.asarray(volumes, dtype=float)
+        temperatures = np.asarray(temperatures, dtype=float)
+        free_energies = np.asarray(free_energies, dtype=float)
+        heat_capacities = np.asarray(heat_capacities, dtype=float)
+        entropies = np.asarray(entropies, dtype=float)
+
         with warnings.catch_warnings():
             # Phonopy messes with the warnings
             # Turns all warnings into errors
 
             qha = PhonopyQHA(
-                volumes=np.array(volumes),
-                electronic_energies=np.array(electronic_energies),
-                temperatures=np.array(temperatures),
-                free_energy=np.array(free_energies),
-                cv=np.array(heat_capacities),
-                entropy=np.array(entropies),
+                volumes=volumes,
+                electronic_energies=np.asarray(electronic_energies, dtype=float),
+                temperatures=temperatures,
+                free_energy=free_energies,
+                cv=heat_capacities,
+                entropy=entropies,
                 t_max=t_max,
                 pressure=pressure,
                 eos=eos_type,
@@ -229,11 +239,11 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
             gruneisen_temperature=qha.gruneisen_temperature,
             pressure=pressure,
             t_max=t_max,
-            temperatures=temperatures,
-            volumes=volumes,
-            free_energies=np.array(np.array(free_energies) * 1000.0).tolist(),
-            heat_capacities=heat_capacities,
-            entropies=entropies,
+            temperatures=temperatures.tolist(),
+            volumes=volumes.tolist(),
+            free_energies=(free_energies * 1000.0).tolist(),
+            heat_capacities=heat_capacities.tolist(),
+            entropies=entropies.tolist(),
             formula_units=formula_units,
             supercell_matrix=supercell_matrix,
         )
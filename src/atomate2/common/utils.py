@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import itertools
 import re
+from functools import lru_cache
 from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from monty.serialization import loadfn
-from pymatgen.transformations.advanced_transformations import (
-    CubicSupercellTransformation,
-)
+from pymatgen.core import Lattice
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -53,32 +54,253 @@ def get_supercell_matrix(
         force_diagonal=kwargs["force_diagonal"],
     )
     if not prefer_90_degrees:
-        transformation = CubicSupercellTransformation(
+        transformation_matrix = _get_cubic_supercell_matrix(
+            structure,
             **common_kwds,
             force_90_degrees=False,
             allow_orthorhombic=allow_orthorhombic,
         )
-        transformation.apply_transformation(structure=structure)
     else:
         try:
             common_kwds.update({"max_atoms": kwargs.get("max_atoms", 1200)})
-            transformation = CubicSupercellTransformation(
+            transformation_matrix = _get_cubic_supercell_matrix(
+                structure,
                 **common_kwds,
                 force_90_degrees=True,
                 angle_tolerance=kwargs.get("angle_tolerance", 1e-2),
                 allow_orthorhombic=allow_orthorhombic,
             )
-            transformation.apply_transformation(structure=structure)
 
         except AttributeError:
-            transformation = CubicSupercellTransformation(
+            transformation_matrix = _get_cubic_supercell_matrix(
+                structure,
                 **common_kwds,
                 force_90_degrees=False,
                 allow_orthorhombic=allow_orthorhombic,
             )
-            transformation.apply_transformation(structure=structure)
     # matrix from pymatgen has to be transposed
-    return transformation.transformation_matrix.transpose().tolist()
+    return transformation_matrix.transpose().tolist()
+
+
+def _get_cubic_supercell_matrix(
+    structure: Structure,
+    min_length: float = 15.0,
+    max_length: float | None = None,
+    min_atoms: int | None = None,
+    max_atoms: int | None = None,
+    step_size: float = 0.1,
+    force_diagonal: bool = False,
+    force_90_degrees: bool = False,
+    angle_tolerance: float = 1e-3,
+    allow_orthorhombic: bool = False,
+) -> np.ndarray:
+    """
+    Get the transformation matrix of a pymatgen CubicSupercellTransformation.
+
+    This performs the same search as
+    :obj:`.CubicSupercellTransformation.apply_transformation`, but only builds the
+    supercell lattices rather than the supercell structures, skips transformation
+    matrices that have already been rejected, and stops as soon as the number of
+    atoms exceeds ``max_atoms``. Results are memoized on the lattice, the number of
+    sites and the search parameters. The lattice is part of the memo key as an exact
+    tuple of floats, so lattices that differ only by numerical noise (e.g., nearly
+    identical volumes in a quasi-harmonic workflow) are not served from the cache.
+
+    Parameters
+    ----------
+    structure : .Structure
+        The structure to find the supercell for.
+    min_length : float
+        Minimum length of the smallest supercell lattice vector.
+    max_length : float or None
+        Maximum length of the larger supercell lattice vector.
+    min_atoms : int or None
+        Minimum number of atoms allowed in the supercell.
+    max_atoms : int or None
+        Maximum number of atoms allowed in the supercell.
+    step_size : float
+        Step size used to increase the supercell.
+    force_diagonal : bool
+        Whether to return a diagonal transformation matrix.
+    force_90_degrees : bool
+        Whether to require a supercell with 90 degree angles.
+    angle_tolerance : float
+        Tolerance to determine the 90 degree angles.
+    allow_orthorhombic : bool
+        Whether orthorhombic rather than only cubic supercells are allowed.
+
+    Returns
+    -------
+    np.ndarray
+        The supercell transformation matrix (in the pymatgen convention).
+
+    Raises
+    ------
+    AttributeError
+        If no supercell satisfying the constraints can be found.
+    """
+    transformation_matrix, error = _search_cubic_supercell_matrix(
+        tuple(map(tuple, structure.lattice.matrix.tolist())),
+        len(structure),
+        min_length,
+        max_length,
+        min_atoms or -np.inf,
+        max_atoms or np.inf,
+        step_size,
+        force_diagonal,
+        force_90_degrees,
+        angle_tolerance,
+        allow_orthorhombic,
+    )
+    if error is not None:
+        raise AttributeError(error)
+    return np.array(transformation_matrix)
+
+
+@lru_cache(maxsize=256)
+def _search_cubic_supercell_matrix(
+    lattice: tuple[tuple[float, ...], ...],
+    n_sites: int,
+    min_length: float,
+    max_length: float | None,
+    min_atoms: float,
+    max_atoms: float,
+    step_size: float,
+    force_diagonal: bool,
+    force_90_degrees: bool,
+    angle_tolerance: float,
+    allow_orthorhombic: bool,
+) -> tuple[tuple[tuple[int, ...], ...] | None, str | None]:
+    """
+    Search for a cubic or orthorhombic supercell transformation matrix.
+
+    See :obj:`_get_cubic_supercell_matrix`. The arguments must be hashable, and
+    failures are returned as an error message rather than raised, so that both
+    are memoized.
+
+    Returns
+    -------
+    tuple
+        The transformation matrix, or None and the reason no matrix was found.
+    """
+    lat_vecs = np.array(lattice)
+
+    if max_length is None and allow_orthorhombic:
+        return None, "max_length is required for orthorhombic cells"
+
+    if force_diagonal:
+        scale = min_length / np.array(Lattice(lat_vecs).abc)
+        return tuple(map(tuple, np.diag(np.ceil(scale).astype(int)).tolist())), None
+
+    inv_lat_vecs = np.linalg.inv(lat_vecs)
+    rejected: set[bytes] = set()
+
+    def check_supercell(target_sc_lat_vecs: np.ndarray) -> np.ndarray | None:
+        # same checks as CubicSupercellTransformation.check_constraints and
+        # check_exceptions, without building the superstructure
+        matrix = _round_to_nonsingular(target_sc_lat_vecs @ inv_lat_vecs)
+        if matrix.tobytes() in rejected:
+            return None
+
+        n_atoms = n_sites * round(abs(np.linalg.det(matrix)))
+        if n_atoms > max_atoms:
+            raise AttributeError(
+                "While trying to solve for the supercell, the max number of atoms "
+                "was exceeded. Try lowering the number of nearest neighbor distances."
+            )
+
+        sc_lat_vecs = matrix @ lat_vecs
+        lengths = np.linalg.norm(
+            [
+                vec - np.dot(vec, onto) / np.dot(onto, onto) * onto
+                for vec, onto in itertools.permutations(sc_lat_vecs, 2)
+            ],
+            axis=1,
+        )
+        if (
+            np.min(lengths) >= min_length
+            and min_atoms <= n_atoms
+            and (
+                not force_90_degrees
+                or np.all(
+                    np.absolute(np.array(Lattice(sc_lat_vecs).angles) - 90)
+                    < angle_tolerance
+                )
+            )
+        ):
+            return matrix
+
+        if max_length is not None and np.max(lengths) >= max_length:
+            raise AttributeError(
+                "While trying to solve for the supercell, the max length was exceeded."
+            )
+        rejected.add(matrix.tobytes())
+        return None
+
+    try:
+        if not allow_orthorhombic:
+            target_sc_size = min_length
+            while (matrix := check_supercell(np.eye(3) * target_sc_size)) is None:
+                # increase threshold until proposed supercell meets requirements
+                target_sc_size += step_size
+        else:
+            if force_90_degrees:
+                # prevent a too long search for the supercell
+                step_size *= 5
+
+            sizes = np.arange(min_length, max_length, step_size)
+            combined = np.stack(np.meshgrid(sizes, sizes, sizes, indexing="ij"))
+            combined = combined.reshape(3, -1).T
+            # same order as sorting the list of sizes by their sum
+            sums = combined[:, 0] + combined[:, 1] + combined[:, 2]
+            for size_idx in np.argsort(sums, kind="stable"):
+                if (matrix := check_supercell(np.diag(combined[size_idx]))) is not None:
+                    break
+            else:
+                return None, "Unable to find orthorhombic supercell"
+    except AttributeError as exc:
+        return None, str(exc)
+
+    return tuple(map(tuple, matrix.tolist())), None
+
+
+def _round_to_nonsingular(matrix: np.ndarray) -> np.ndarray:
+    """
+    Round a matrix to integers without introducing zero rows or columns.
+
+    The same rounding as used by pymatgen's CubicSupercellTransformation: all
+    elements are rounded to the nearest integer. In every row that becomes zero, the
+    element with the largest magnitude is rounded away from zero instead (ties are
+    broken randomly). The same is repeated for zero columns, rounding all elements
+    with the largest magnitude away from zero. Rows or columns that are zero in
+    ``matrix`` are left unchanged.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        The matrix to round.
+
+    Returns
+    -------
+    np.ndarray
+        The rounded integer matrix.
+    """
+
+    def round_away_from_zero(value: float) -> float:
+        return np.ceil(abs(value)) * np.sign(value)
+
+    rounded = np.around(matrix)
+    for row_idx in np.where(~rounded.any(axis=1))[0]:
+        row = np.absolute(matrix[row_idx])
+        col_idxs = np.where(row == np.amax(row))[0]
+        col_idx = col_idxs[np.random.default_rng().integers(len(col_idxs))]
+        rounded[row_idx, col_idx] = round_away_from_zero(matrix[row_idx, col_idx])
+
+    for col_idx in np.where(~rounded.any(axis=0))[0]:
+        col = np.absolute(matrix[:, col_idx])
+        for row_idx in np.where(col == np.amax(col))[0]:
+            rounded[row_idx, col_idx] = round_away_from_zero(matrix[row_idx, col_idx])
+    return rounded.astype(int)
 
 
 def get_transformations(
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 from atomate2 import SETTINGS
 from atomate2.common.flows.elastic import BaseElasticMaker
 from atomate2.forcefields import MLFF, _get_formatted_ff_name
-from atomate2.forcefields.jobs import ForceFieldRelaxMaker
+from atomate2.forcefields.jobs import BatchForceFieldRelaxMaker, ForceFieldRelaxMaker
 
 if TYPE_CHECKING:
     from typing import Any
@@ -67,6 +67,10 @@ class ElasticMaker(BaseElasticMaker):
         Keyword arguments passed to :obj:`fit_elastic_tensor`.
     task_document_kwargs : dict
         Additional keyword args passed to :obj:`.ElasticDocument.from_stresses()`.
+    batch_deformations : bool
+        If True, relax all deformed structures in a single job with one calculator.
+        A :obj:`.ForceFieldRelaxMaker` given as ``elastic_relax_maker`` is converted
+        to a :obj:`.BatchForceFieldRelaxMaker` with the same settings.
     """
 
     name: str = "elastic"
@@ -88,6 +92,15 @@ class ElasticMaker(BaseElasticMaker):
     fit_elastic_tensor_kwargs: dict = field(default_factory=dict)
     task_document_kwargs: dict = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Use a batch maker for the deformations if requested."""
+        if self.batch_deformations and not isinstance(
+            self.elastic_relax_maker, BatchForceFieldRelaxMaker
+        ):
+            self.elastic_relax_maker = BatchForceFieldRelaxMaker.from_relax_maker(
+                self.elastic_relax_maker
+            )
+
     @property
     def prev_calc_dir_argname(self) -> str | None:
         """Name of argument informing static maker of previous calculation directory.
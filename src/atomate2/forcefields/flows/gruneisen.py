@@ -59,6 +59,10 @@ class GruneisenMaker(BaseGruneisenMaker):
         Keyword arguments passed to :obj:`compute_gruneisen_param`.
     symprec: float
         Symmetry precision for symmetry checks and phonon runs.
+    shared_displacements: bool
+        If True, the displacements of the three structures are planned in a single
+        job and run as one set of jobs. Set ``batch_displacements`` of the phonon
+        maker to compute all forces in one job.
     """
 
     name: str = "Gruneisen"
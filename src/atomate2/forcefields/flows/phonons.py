@@ -8,7 +8,11 @@ from typing import TYPE_CHECKING, Literal
 from atomate2 import SETTINGS
 from atomate2.common.flows.phonons import BasePhononMaker
 from atomate2.forcefields import _get_formatted_ff_name
-from atomate2.forcefields.jobs import ForceFieldRelaxMaker, ForceFieldStaticMaker
+from atomate2.forcefields.jobs import (
+    BatchForceFieldStaticMaker,
+    ForceFieldRelaxMaker,
+    ForceFieldStaticMaker,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -112,6 +116,11 @@ class PhononMaker(BasePhononMaker):
         if True, force constants will be stored
     socket: bool
         If True, use the socket for the calculation
+    batch_displacements: bool
+        If True, compute the forces for all displacements in a single job with
+        one calculator. A :obj:`.ForceFieldStaticMaker` given as
+        ``phonon_displacement_maker`` is converted to a
+        :obj:`.BatchForceFieldStaticMaker` with the same settings.
     """
 
     name: str = "phonon"
@@ -141,6 +150,17 @@ class PhononMaker(BasePhononMaker):
     code: str = "forcefields"
     born_maker: ForceFieldStaticMaker | None = None
 
+    def __post_init__(self) -> None:
+        """Use a batch maker for the displacements if requested."""
+        if self.batch_displacements and not isinstance(
+            self.phonon_displacement_maker, BatchForceFieldStaticMaker
+        ):
+            self.phonon_displacement_maker = (
+                BatchForceFieldStaticMaker.from_static_maker(
+                    self.phonon_displacement_maker
+                )
+            )
+
     @property
     def prev_calc_dir_argname(self) -> None:
         """Name of argument informing static maker of previous calculation directory.
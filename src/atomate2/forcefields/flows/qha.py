@@ -62,6 +62,10 @@ class ForceFieldQhaMaker(CommonQhaMaker):
         with 3 90 degree angles
     get_supercell_size_kwargs: dict
         kwargs that will be passed to get_supercell_size to determine supercell size
+    shared_displacements: bool
+        If True, the displacements of all volumes are planned in a single job and
+        run as one set of jobs. Set ``batch_displacements`` of the phonon maker to
+        compute the forces of all volumes and displacements in one job.
 
     """
 
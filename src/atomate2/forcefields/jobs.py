@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import TYPE_CHECKING
 
 from ase.io import Trajectory as AseTrajectory
@@ -13,10 +13,17 @@ from jobflow import job
 from monty.dev import deprecated
 from pymatgen.core.trajectory import Trajectory as PmgTrajectory
 
+from atomate2 import SETTINGS
 from atomate2.ase.jobs import AseRelaxMaker
+from atomate2.ase.utils import AseBatchRelaxer
 from atomate2.forcefields import MLFF, _get_formatted_ff_name
 from atomate2.forcefields.schemas import ForceFieldTaskDocument
-from atomate2.forcefields.utils import ase_calculator, revert_default_dtype
+from atomate2.forcefields.utils import (
+    ase_calculator,
+    batch_calculator,
+    cached_ase_calculator,
+    revert_default_dtype,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -24,6 +31,9 @@ if TYPE_CHECKING:
 
     from ase.calculators.calculator import Calculator
     from pymatgen.core.structure import Structure
+    from typing_extensions import Self
+
+    from atomate2.ase.schemas import AseResult
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +119,10 @@ class ForceFieldRelaxMaker(AseRelaxMaker):
         Keyword arguments that will get passed to :obj:`AseRelaxer()`.
     calculator_kwargs : dict
         Keyword arguments that will get passed to the ASE calculator.
+    cache_calculator : bool
+        Whether to reuse the ASE calculator from the process-wide
+        :obj:`.CalculatorCache` rather than reloading the model for every job.
+        Defaults to the FORCEFIELD_CACHE_CALCULATORS setting.
     ionic_step_data : tuple[str,...] or None
         Quantities to store in the TaskDocument ionic_steps.
         Possible options are "struct_or_mol", "energy",
@@ -132,6 +146,7 @@ class ForceFieldRelaxMaker(AseRelaxMaker):
     relax_kwargs: dict = field(default_factory=dict)
     optimizer_kwargs: dict = field(default_factory=dict)
     calculator_kwargs: dict = field(default_factory=dict)
+    cache_calculator: bool = SETTINGS.FORCEFIELD_CACHE_CALCULATORS
     task_document_kwargs: dict = field(default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -190,7 +205,10 @@ class ForceFieldRelaxMaker(AseRelaxMaker):
     @property
     def calculator(self) -> Calculator:
         """ASE calculator, can be overwritten by user."""
-        return ase_calculator(
+        get_calculator = (
+            cached_ase_calculator if self.cache_calculator else ase_calculator
+        )
+        return get_calculator(
             str(self.force_field_name),  # make mypy happy
             **self.calculator_kwargs,
         )
@@ -227,6 +245,188 @@ class ForceFieldStaticMaker(ForceFieldRelaxMaker):
     task_document_kwargs: dict = field(default_factory=dict)
 
 
+def _get_maker_kwargs(maker: ForceFieldRelaxMaker, maker_cls: type) -> dict:
+    """
+    Get the settings of a maker to create a batch maker from.
+
+    Parameters
+    ----------
+    maker : .ForceFieldRelaxMaker
+        The maker to take the settings from.
+    maker_cls : type
+        The class of which the fields are taken from ``maker``.
+
+    Returns
+    -------
+    dict
+        The init fields of ``maker_cls``, except for the name, with their values in
+        ``maker``.
+    """
+    return {
+        attr.name: getattr(maker, attr.name)
+        for attr in fields(maker_cls)
+        if attr.init and attr.name != "name"
+    }
+
+
+@dataclass
+class BatchForceFieldRelaxMaker(ForceFieldRelaxMaker):
+    """
+    Maker to relax several structures together using any force field.
+
+    All structures are relaxed in a single job with one calculator. At every
+    optimizer step, the structures which are not yet converged are evaluated
+    together; for force fields which support batched graphs (currently CHGNet),
+    this is a single model call. Otherwise, the structures are evaluated one after
+    the other with the shared calculator.
+
+    Parameters
+    ----------
+    name : str
+        The job name.
+    force_field_name : str or .MLFF
+        The name of the force field.
+    batch_size : int
+        Maximum number of structures evaluated in a single model call.
+    relax_cell : bool = True
+        Whether to allow the cell shape/volume to change during relaxation.
+    fix_symmetry : bool = False
+        Whether to fix the symmetry during relaxation.
+        Refines the symmetry of the initial structure.
+    symprec : float | None = 1e-2
+        Tolerance for symmetry finding in case of fix_symmetry.
+    steps : int
+        Maximum number of ionic steps allowed during relaxation.
+    relax_kwargs : dict
+        Keyword arguments that will get passed to :obj:`AseBatchRelaxer.relax`.
+    optimizer_kwargs : dict
+        Keyword arguments that will get passed to :obj:`AseBatchRelaxer()`.
+    calculator_kwargs : dict
+        Keyword arguments that will get passed to the ASE calculator.
+    """
+
+    name: str = "Force field batch relax"
+    batch_size: int = 16
+
+    @job(data=_FORCEFIELD_DATA_OBJECTS)
+    def make(
+        self, structures: list[Structure], prev_dir: str | Path | None = None
+    ) -> list[ForceFieldTaskDocument]:
+        """
+        Perform a relaxation of several structures using a force field.
+
+        Parameters
+        ----------
+        structures: list of .Structure
+            pymatgen structures.
+        prev_dir : str or Path or None
+            A previous calculation directory to copy output files from. Unused, just
+                added to match the method signature of other makers.
+
+        Returns
+        -------
+        list of ForceFieldTaskDocument
+            One task document per input structure, in the same order.
+        """
+        with revert_default_dtype():
+            ase_results = self.run_ase(structures, prev_dir=prev_dir)
+
+        return [
+            ForceFieldTaskDocument.from_ase_compatible_result(
+                str(self.force_field_name),  # make mypy happy
+                ase_result,
+                self.steps,
+                relax_kwargs=self.relax_kwargs,
+                optimizer_kwargs=self.optimizer_kwargs,
+                relax_cell=self.relax_cell,
+                fix_symmetry=self.fix_symmetry,
+                symprec=self.symprec if self.fix_symmetry else None,
+                ionic_step_data=self.ionic_step_data,
+                store_trajectory=self.store_trajectory,
+                tags=self.tags,
+                **self.task_document_kwargs,
+            )
+            for ase_result in ase_results
+        ]
+
+    def run_ase(  # type: ignore[override]
+        self,
+        structures: list[Structure],
+        prev_dir: str | Path | None = None,
+    ) -> list[AseResult]:
+        """
+        Relax several structures using ASE, not as a job.
+
+        Parameters
+        ----------
+        structures: list of .Structure
+            pymatgen structures.
+        prev_dir : str or Path or None
+            A previous calculation directory to copy output files from. Unused, just
+                added to match the method signature of other makers.
+        """
+        calculator = self.calculator
+        relaxer = AseBatchRelaxer(
+            calculator,
+            relax_cell=self.relax_cell,
+            fix_symmetry=self.fix_symmetry,
+            symprec=self.symprec,
+            batch_calculate=batch_calculator(calculator, batch_size=self.batch_size),
+            **self.optimizer_kwargs,
+        )
+        return relaxer.relax(structures, steps=self.steps, **self.relax_kwargs)
+
+    @classmethod
+    def from_relax_maker(cls, maker: ForceFieldRelaxMaker, **kwargs) -> Self:
+        """
+        Create a batch relax maker with the same settings as a relax maker.
+
+        Parameters
+        ----------
+        maker : .ForceFieldRelaxMaker
+            The maker to take the force field, relaxation and calculator settings
+            from.
+        **kwargs
+            Additional kwargs to pass to BatchForceFieldRelaxMaker.
+
+        Returns
+        -------
+        BatchForceFieldRelaxMaker
+        """
+        return cls(**(_get_maker_kwargs(maker, ForceFieldRelaxMaker) | kwargs))
+
+
+@dataclass
+class BatchForceFieldStaticMaker(BatchForceFieldRelaxMaker):
+    """
+    Maker to calculate forces and stresses of several structures in one job.
+
+    See :obj:`BatchForceFieldRelaxMaker` for a description of the parameters.
+    """
+
+    name: str = "Force field batch static"
+    relax_cell: bool = False
+    steps: int = 1
+
+    @classmethod
+    def from_static_maker(cls, maker: ForceFieldStaticMaker, **kwargs) -> Self:
+        """
+        Create a batch static maker with the same settings as a static maker.
+
+        Parameters
+        ----------
+        maker : .ForceFieldStaticMaker
+            The maker to take the force field and calculator settings from.
+        **kwargs
+            Additional kwargs to pass to BatchForceFieldStaticMaker.
+
+        Returns
+        -------
+        BatchForceFieldStaticMaker
+        """
+        return cls(**(_get_maker_kwargs(maker, ForceFieldStaticMaker) | kwargs))
+
+
 @deprecated(
     replacement=ForceFieldRelaxMaker,
     deadline=(2025, 1, 1),
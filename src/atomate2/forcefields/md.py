@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from jobflow import job
 from monty.dev import deprecated
 
+from atomate2 import SETTINGS
 from atomate2.ase.md import AseMDMaker, MDEnsemble
 from atomate2.forcefields import MLFF, _get_formatted_ff_name
 from atomate2.forcefields.jobs import (
@@ -16,7 +17,11 @@ from atomate2.forcefields.jobs import (
     _FORCEFIELD_DATA_OBJECTS,
 )
 from atomate2.forcefields.schemas import ForceFieldTaskDocument
-from atomate2.forcefields.utils import ase_calculator, revert_default_dtype
+from atomate2.forcefields.utils import (
+    ase_calculator,
+    cached_ase_calculator,
+    revert_default_dtype,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -76,6 +81,10 @@ class ForceFieldMDMaker(AseMDMaker):
         .MolecularDynamics function
     calculator_kwargs : dict
         kwargs to pass to the ASE calculator class
+    cache_calculator : bool
+        Whether to reuse the ASE calculator from the process-wide
+        :obj:`.CalculatorCache` rather than reloading the model for every job.
+        Defaults to the FORCEFIELD_CACHE_CALCULATORS setting.
     ionic_step_data : tuple[str,...] or None
         Quantities to store in the TaskDocument ionic_steps.
         Possible options are "struct_or_mol", "energy",
@@ -96,6 +105,12 @@ class ForceFieldMDMaker(AseMDMaker):
         If "xdatcar, writes a VASP-style XDATCAR
     traj_interval : int
         The step interval for saving the trajectories.
+    traj_chunk_size : int or None
+        If an int, the trajectory is streamed to `traj_file` in chunks of this
+        many frames during the run instead of being held in memory. Only the
+        first and last frames are then kept in the task document, which references
+        the trajectory file. Requires `traj_file` to be set with
+        `traj_file_fmt = "ase"`.
     mb_velocity_seed : int or None
         If an int, a random number seed for generating initial velocities
         from a Maxwell-Boltzmann distribution.
@@ -103,12 +118,23 @@ class ForceFieldMDMaker(AseMDMaker):
         Whether to initialize the atomic velocities with zero linear momentum
     zero_angular_momentum : bool = False
         Whether to initialize the atomic velocities with zero angular momentum
+    checkpoint_interval : int or None
+        If an int, write a restart checkpoint to `checkpoint_file` every this many
+        MD steps and at the end of the run.
+    checkpoint_file : str = "md_checkpoint.npz"
+        The name of the checkpoint file, both written to the current directory
+        and read from `prev_dir`.
+    resume : bool = False
+        Whether to resume an unfinished run from the checkpoint in `prev_dir`.
+        Checkpoints of finished runs are ignored, so that chained MD jobs passing
+        the previous directory start a new run from the given structure.
     task_document_kwargs: dict or None (deprecated)
         Options to pass to the TaskDoc.
     """
 
     name: str = "Forcefield MD"
     force_field_name: str | MLFF = MLFF.Forcefield
+    cache_calculator: bool = SETTINGS.FORCEFIELD_CACHE_CALCULATORS
     task_document_kwargs: dict = None
 
     def __post_init__(self) -> None:
@@ -141,8 +167,8 @@ class ForceFieldMDMaker(AseMDMaker):
         structure: .Structure
             pymatgen structure.
         prev_dir : str or Path or None
-            A previous calculation directory to copy output files from. Unused, just
-            added to match the method signature of other makers.
+            A previous calculation directory. If `resume` is set and it contains
+            the checkpoint of an unfinished run, the run is resumed from it.
         """
         with revert_default_dtype():
             md_result = self.run_ase(structure, prev_dir=prev_dir)
@@ -174,7 +200,10 @@ class ForceFieldMDMaker(AseMDMaker):
     @property
     def calculator(self) -> Calculator:
         """ASE calculator, can be overwritten by user."""
-        return ase_calculator(
+        get_calculator = (
+            cached_ase_calculator if self.cache_calculator else ase_calculator
+        )
+        return get_calculator(
             str(self.force_field_name),  # make mypy happy
             **self.calculator_kwargs,
         )
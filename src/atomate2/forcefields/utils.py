@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from monty.json import MontyDecoder
+from monty.json import MontyDecoder, jsanitize
 
+from atomate2 import SETTINGS
 from atomate2.forcefields import MLFF
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
     from typing import Any
 
+    from ase import Atoms
     from ase.calculators.calculator import Calculator
 
+logger = logging.getLogger(__name__)
+
 
 def ase_calculator(calculator_meta: str | dict, **kwargs: Any) -> Calculator | None:
     """
@@ -113,6 +123,268 @@ def ase_calculator(calculator_meta: str | dict, **kwargs: Any) -> Calculator | N
     return calculator
 
 
+def _calculator_cache_key(calculator_meta: str | dict, **kwargs: Any) -> str:
+    """
+    Get a canonical key for a calculator from its metadata and kwargs.
+
+    Parameters
+    ----------
+    calculator_meta : str or dict
+        The calculator metadata, see :obj:`ase_calculator`.
+    kwargs : optional kwargs to pass to a calculator
+
+    Returns
+    -------
+    str
+        The calculator name and a hash of its (sorted, JSON-serialized) kwargs.
+    """
+    payload = json.dumps(
+        jsanitize(
+            {"calculator_meta": calculator_meta, "kwargs": kwargs},
+            strict=False,
+            enum_values=True,
+        ),
+        sort_keys=True,
+        default=str,
+    )
+    name = calculator_meta if isinstance(calculator_meta, str) else "custom"
+    return f"{name}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+def _estimate_calculator_memory(calculator: Calculator) -> int:
+    """
+    Estimate the memory held by the model weights of a calculator in bytes.
+
+    Only torch modules (directly or in lists / tuples) attached to the calculator
+    are accounted for. Calculators without torch models are assigned zero.
+    """
+    n_bytes = 0
+    seen: set[int] = set()
+    for attr in vars(calculator).values():
+        for obj in attr if isinstance(attr, list | tuple) else (attr,):
+            if id(obj) in seen or not callable(getattr(obj, "parameters", None)):
+                continue
+            seen.add(id(obj))
+            try:
+                n_bytes += sum(
+                    param.numel() * param.element_size() for param in obj.parameters()
+                )
+            except (AttributeError, TypeError):
+                continue
+    return n_bytes
+
+
+class CalculatorCache:
+    """
+    Process-wide least-recently-used cache of instantiated ASE calculators.
+
+    Loading the weights of a machine-learned force field can dominate the run time
+    of short forcefield jobs executed in a single worker process. This cache keeps
+    instantiated calculators keyed on the calculator name and a hash of its kwargs.
+    Entries are evicted in least-recently-used order once either the number of
+    cached calculators exceeds ``max_size`` or the estimated memory held by the
+    model weights exceeds ``max_memory``.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of calculators to keep.
+    max_memory : int or None
+        Maximum estimated memory of the cached model weights in bytes. If None,
+        only ``max_size`` is enforced.
+    """
+
+    def __init__(self, max_size: int = 4, max_memory: int | None = None) -> None:
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.hits = 0
+        self.misses = 0
+        self._calculators: OrderedDict[str, tuple[Calculator, int]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Get the number of cached calculators."""
+        return len(self._calculators)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a calculator key is cached."""
+        return key in self._calculators
+
+    @property
+    def memory(self) -> int:
+        """Estimated memory of all cached model weights in bytes."""
+        return sum(n_bytes for _, n_bytes in self._calculators.values())
+
+    @property
+    def stats(self) -> dict[str, int | float | None]:
+        """Summary of cache usage."""
+        n_calls = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / n_calls if n_calls else 0.0,
+            "size": len(self),
+            "max_size": self.max_size,
+            "memory": self.memory,
+            "max_memory": self.max_memory,
+        }
+
+    def get(self, calculator_meta: str | dict, **kwargs: Any) -> Calculator:
+        """
+        Get a calculator from the cache, instantiating it on a miss.
+
+        Parameters
+        ----------
+        calculator_meta : str or dict
+            The calculator metadata, see :obj:`ase_calculator`.
+        kwargs : optional kwargs to pass to a calculator
+
+        Returns
+        -------
+        ASE .Calculator
+        """
+        key = _calculator_cache_key(calculator_meta, **kwargs)
+        with self._lock:
+            if key in self._calculators:
+                self.hits += 1
+                self._calculators.move_to_end(key)
+                return self._calculators[key][0]
+
+            self.misses += 1
+            calculator = ase_calculator(calculator_meta, **kwargs)
+            n_bytes = _estimate_calculator_memory(calculator)
+            if self.max_size > 0 and (
+                self.max_memory is None or n_bytes <= self.max_memory
+            ):
+                self._calculators[key] = (calculator, n_bytes)
+                self._enforce_limits()
+            return calculator
+
+    def evict(self, key: str | None = None) -> int:
+        """
+        Evict calculators from the cache.
+
+        Parameters
+        ----------
+        key : str or None
+            If a full cache key, only that entry is evicted. If a calculator name,
+            all entries for that calculator are evicted. If None, the least
+            recently used entry is evicted.
+
+        Returns
+        -------
+        int
+            The number of evicted calculators.
+        """
+        with self._lock:
+            if key is None:
+                keys = list(self._calculators)[:1]
+            else:
+                keys = [k for k in self._calculators if key in (k, k.rsplit(":", 1)[0])]
+            for k in keys:
+                del self._calculators[k]
+                logger.debug(f"Evicted {k} from the calculator cache")
+            return len(keys)
+
+    def clear(self, reset_stats: bool = True) -> None:
+        """Remove all calculators from the cache and optionally reset counters."""
+        with self._lock:
+            self._calculators.clear()
+            if reset_stats:
+                self.hits = self.misses = 0
+
+    def _enforce_limits(self) -> None:
+        while len(self._calculators) > self.max_size or (
+            self.max_memory is not None and self.memory > self.max_memory
+        ):
+            self.evict()
+
+
+_CALCULATOR_CACHE = CalculatorCache(
+    max_size=SETTINGS.FORCEFIELD_CALCULATOR_CACHE_SIZE,
+    max_memory=SETTINGS.FORCEFIELD_CALCULATOR_CACHE_MAX_MEMORY,
+)
+
+
+def get_calculator_cache() -> CalculatorCache:
+    """Get the process-wide calculator cache."""
+    return _CALCULATOR_CACHE
+
+
+def cached_ase_calculator(
+    calculator_meta: str | dict, **kwargs: Any
+) -> Calculator | None:
+    """
+    Create an ASE calculator, reusing a cached instance where possible.
+
+    See :obj:`ase_calculator` for a description of the parameters. Calculators
+    are stored in the process-wide :obj:`CalculatorCache`.
+    """
+    return _CALCULATOR_CACHE.get(calculator_meta, **kwargs)
+
+
+def _chgnet_batch_calculate(
+    calculator: Calculator,
+    atoms_list: list[Atoms],
+    properties: list[str],
+    batch_size: int = 16,
+) -> list[dict]:
+    """Evaluate a list of atoms with batched CHGNet graphs.
+
+    Mirrors the unit conversions of `chgnet.model.dynamics.CHGNetCalculator`.
+    """
+    from pymatgen.io.ase import AseAtomsAdaptor
+
+    structures = [AseAtomsAdaptor.get_structure(atoms) for atoms in atoms_list]
+    predictions = calculator.model.predict_structure(
+        structures, task="efsm", batch_size=batch_size
+    )
+    if isinstance(predictions, dict):
+        predictions = [predictions]
+
+    results = []
+    for structure, prediction in zip(structures, predictions, strict=True):
+        factor = structure.num_sites if calculator.model.is_intensive else 1
+        result = {
+            "energy": prediction["e"] * factor,
+            "forces": prediction["f"],
+            "magmoms": prediction["m"],
+            "stress": prediction["s"] * calculator.stress_weight,
+        }
+        results.append({k: v for k, v in result.items() if k in properties})
+    return results
+
+
+def batch_calculator(
+    calculator: Calculator, batch_size: int = 16
+) -> Callable[[list[Atoms], list[str]], list[dict]] | None:
+    """
+    Get a function which evaluates several structures in one batched model call.
+
+    Parameters
+    ----------
+    calculator : ASE .Calculator
+        The calculator to evaluate the structures with.
+    batch_size : int
+        The maximum number of structures evaluated in a single model call.
+
+    Returns
+    -------
+    Callable or None
+        A function with the signature expected by
+        :obj:`atomate2.ase.utils.AseBatchRelaxer`, or None if batched
+        evaluation is not supported for this calculator.
+    """
+    try:
+        from chgnet.model.dynamics import CHGNetCalculator
+    except ImportError:
+        return None
+
+    if isinstance(calculator, CHGNetCalculator):
+        return partial(_chgnet_batch_calculate, calculator, batch_size=batch_size)
+    return None
+
+
 @contextmanager
 def revert_default_dtype() -> Generator[None, None, None]:
     """Context manager for torch.default_dtype.
@@ -44,6 +44,46 @@ class Atomate2Settings(BaseSettings):
     CUSTODIAN_SCRATCH_DIR: Optional[str] = Field(
         None, description="Path to scratch directory used by custodian."
     )
+    GZIP_WORKERS: int = Field(
+        1,
+        description="Number of threads used to gzip output files. If 1, files are "
+        "compressed one after the other.",
+    )
+    GZIP_BLOCK_SIZE: Optional[int] = Field(
+        16 * 1024**2,
+        description="Files larger than this size (in bytes) are split into blocks "
+        "that are compressed in parallel (if GZIP_WORKERS > 1) and written as a "
+        "multi-member gzip file. If None, each file is compressed by a single thread.",
+    )
+    COPY_ZERO_COPY_MIN_SIZE: Optional[int] = Field(
+        16 * 1024**2,
+        description="Local files at least this size (in bytes) are copied by "
+        "reflink (copy-on-write clone), hardlink (see COPY_HARDLINK_READONLY) or "
+        "os.copy_file_range where the file system supports it, before falling back "
+        "to a regular copy. If None, files are always copied with shutil.copy2.",
+    )
+    COPY_HARDLINK_READONLY: bool = Field(
+        default=False,
+        description="Whether large read-only files (without any write permission) "
+        "may be hardlinked rather than copied, if they cannot be reflinked. The copy "
+        "then shares its data and permissions with the source file.",
+    )
+    SSH_POOL_CONNECTIONS: bool = Field(
+        default=True,
+        description="Whether file clients share SSH connections to remote hosts "
+        "through a process-wide pool, rather than opening new connections for every "
+        "file client. Each file client still opens its own SFTP channel.",
+    )
+    SSH_KEEPALIVE_INTERVAL: int = Field(
+        30,
+        description="Interval (in seconds) between keepalive packets sent on pooled "
+        "SSH connections. If 0, no keepalive packets are sent.",
+    )
+    SSH_POOL_IDLE_TIMEOUT: float = Field(
+        300,
+        description="Pooled SSH connections that have not been used by any file "
+        "client for this long (in seconds) are closed.",
+    )
 
     # VASP specific settings
     VASP_CMD: str = Field(
@@ -184,6 +224,22 @@ class Atomate2Settings(BaseSettings):
         "aims.x > aims.out", description="The default command used run FHI-aims"
     )
 
+    # Forcefield settings
+    FORCEFIELD_CACHE_CALCULATORS: bool = Field(
+        default=False,
+        description="Whether forcefield makers reuse instantiated ASE calculators "
+        "from a process-wide cache rather than reloading the model for every job. "
+        "Can be overridden on a per-maker basis via the cache_calculator attribute.",
+    )
+    FORCEFIELD_CALCULATOR_CACHE_SIZE: int = Field(
+        4, description="Maximum number of calculators kept in the calculator cache."
+    )
+    FORCEFIELD_CALCULATOR_CACHE_MAX_MEMORY: Optional[int] = Field(
+        None,
+        description="Maximum estimated memory (in bytes) of the model weights kept "
+        "in the calculator cache. If None, only the number of calculators is capped.",
+    )
+
     # Elastic constant settings
     ELASTIC_FITTING_METHOD: str = Field(
         "finite_difference", description="Elastic constant fitting method"
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import atexit
 import errno
+import gzip
+import itertools
+import logging
 import os
 import shutil
 import stat
+import threading
+import time
 import warnings
-from functools import wraps
-from glob import glob
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from fnmatch import fnmatch
+from functools import partial, wraps
+from glob import glob, has_magic
 from gzip import GzipFile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -17,10 +27,31 @@ import paramiko
 from monty.io import zopen
 from paramiko import SFTPClient, SSHClient
 
+from atomate2 import SETTINGS
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from types import TracebackType
 
+logger = logging.getLogger(__name__)
+
+# _IOW(0x94, 9, int) from linux/fs.h, clones the data of a file (reflink)
+_FICLONE = 0x40049409
+
+# errors indicating a copy strategy is not supported between two file systems
+_UNSUPPORTED_ERRNOS = {
+    errno.EBADF,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EXDEV,
+}
+
+# (strategy, source device, destination device) found not to be supported
+_UNSUPPORTED_STRATEGIES: set[tuple[str, int, int]] = set()
+
 
 class FileClient:
     """
@@ -40,17 +71,26 @@ class FileClient:
         Path to private key file (for remote connections only).
     config_filename : str or Path
         Path to OpenSSH config file defining host connection settings.
+    pool_connections : bool
+        Whether to take remote SSH connections from the process-wide
+        :obj:`.SSHConnectionPool`, so that they are reused by other file clients
+        rather than closed when this client is closed. The SFTP channels opened on
+        them belong to this client. Defaults to the SSH_POOL_CONNECTIONS setting.
     """
 
     def __init__(
         self,
         key_filename: str | Path = "~/.ssh/id_rsa",
         config_filename: str | Path = "~/.ssh/config",
+        pool_connections: bool = SETTINGS.SSH_POOL_CONNECTIONS,
     ) -> None:
         self.key_filename = key_filename
         self.config_filename = config_filename
+        self.pool_connections = pool_connections
 
         self.connections: dict[str, dict[str, Any]] = {}
+        # directory listings keyed by (host, directory), only used within snapshot()
+        self._snapshots: dict[tuple[str | None, str], Any] | None = None
 
     def connect(self, host: str) -> None:
         """
@@ -67,15 +107,25 @@ class FileClient:
         if host in self.connections:
             return
 
-        if "@" in host:
-            username, hostname = host.split("@", 1)
-        else:
-            username = None  # paramiko sets default username
-            hostname = host
+        if self.pool_connections:
+            connection = CONNECTION_POOL.acquire(
+                host, self.key_filename, self.config_filename
+            )
+            try:
+                # SFTP clients are not shared, see SSHConnectionPool
+                sftp = connection["ssh"].open_sftp()
+            except BaseException:
+                CONNECTION_POOL.release(
+                    host,
+                    self.key_filename,
+                    self.config_filename,
+                    connection["generation"],
+                )
+                raise
+            self.connections[host] = connection | {"sftp": sftp}
+            return
 
-        ssh = get_ssh_connection(
-            username, hostname, self.key_filename, self.config_filename
-        )
+        ssh = _connect_host(host, self.key_filename, self.config_filename)
         self.connections[host] = {"ssh": ssh, "sftp": ssh.open_sftp()}
 
     def get_ssh(self, host: str) -> SSHClient:
@@ -134,6 +184,8 @@ class FileClient:
         bool
             Whether the file exists.
         """
+        if self._use_snapshot(path, host):
+            return self._get_snapshot_kind(path, host) not in (None, "broken")
         if host is None:
             return Path(path).exists()
         path = str(self.abspath(path, host=host))
@@ -158,6 +210,8 @@ class FileClient:
         bool
             Whether the path is a file.
         """
+        if self._use_snapshot(path, host):
+            return self._get_snapshot_kind(path, host) == "file"
         if host is None:
             return Path(path).is_file()
         path = str(self.abspath(path, host=host))
@@ -181,6 +235,8 @@ class FileClient:
         bool
             Whether the path is a directory.
         """
+        if self._use_snapshot(path, host):
+            return self._get_snapshot_kind(path, host) == "dir"
         if host is None:
             return Path(path).is_dir()
         path = str(self.abspath(path, host=host))
@@ -204,6 +260,11 @@ class FileClient:
         list of Path
             List of filenames and directories.
         """
+        if self._use_snapshot(path, host):
+            listing = self._get_listing(self._snapshot_path(path, host), host)
+            if listing is not None:
+                return [Path(name) for name in listing]
+
         if host is None:
             path = self.abspath(path, host=host)
             return [p.relative_to(path) for p in Path(path).iterdir()]
@@ -217,10 +278,18 @@ class FileClient:
         dest_filename: str | Path,
         src_host: str | None = None,
         dest_host: str | None = None,
+        zero_copy_min_size: int | None = SETTINGS.COPY_ZERO_COPY_MIN_SIZE,
+        hardlink_readonly: bool = SETTINGS.COPY_HARDLINK_READONLY,
     ) -> None:
         """
         Copy a file from source to destination.
 
+        Local files of at least ``zero_copy_min_size`` bytes are copied with the
+        first strategy supported by the file systems, in order: a copy-on-write
+        reflink, a hardlink (only for read-only files if ``hardlink_readonly``),
+        ``os.copy_file_range``, and a regular copy. Strategies that fail between a
+        pair of file systems are not tried again for that pair.
+
         Parameters
         ----------
         src_filename : str or Path
@@ -231,13 +300,23 @@ class FileClient:
             A remote file system host for the source file.
         dest_host : str or None
             A remote file system host for the destination file.
+        zero_copy_min_size : int or None
+            Minimum size (in bytes) of local files to copy without a regular copy if
+            possible. If None, local files are always copied with ``shutil.copy2``.
+        hardlink_readonly : bool
+            Whether read-only local files can be hardlinked rather than copied.
         """
         src_filename = self.abspath(src_filename, host=src_host)
         dest_filename = self.abspath(dest_filename, host=dest_host)
 
         if src_host is None and dest_host is None:
             # copying on local machine
-            shutil.copy2(src_filename, dest_filename)
+            if zero_copy_min_size is None:
+                shutil.copy2(src_filename, dest_filename)
+            else:
+                _copy_local(
+                    src_filename, dest_filename, zero_copy_min_size, hardlink_readonly
+                )
         elif src_host is not None and dest_host is None:
             # copying from remote to local
             self.get_sftp(src_host).get(str(src_filename), str(dest_filename))
@@ -257,6 +336,73 @@ class FileClient:
                 "Copying between two different remote hosts is not supported."
             )
 
+        if self._snapshots is not None and self.is_dir(dest_filename, host=dest_host):
+            # the file was copied into the destination directory
+            dest_filename = dest_filename / src_filename.name
+        self._refresh_snapshot(dest_filename, host=dest_host)
+
+    def copy_gunzip(
+        self,
+        src_filename: str | Path,
+        dest_filename: str | Path,
+        src_host: str | None = None,
+        force: bool | str = False,
+    ) -> None:
+        """
+        Copy a file to the local file system, decompressing it if it is gzipped.
+
+        Gzipped files are decompressed while they are read from the source, so the
+        compressed file is never written to the destination. Files that are not
+        gzipped are copied as is.
+
+        Parameters
+        ----------
+        src_filename : str or Path
+            Full path to source file.
+        dest_filename : str or Path
+            Full path to the (decompressed) destination file.
+        src_host : str or None
+            A remote file system host for the source file.
+        force : bool
+            How to handle writing a decompressed file if it already exists. Accepts
+            either a string or bool:
+
+            - `"force"` or `True`: Overwrite the file if it already exists.
+            - `"raise"` or `False`: Raise an error if file already exists.
+            - `"skip"` Skip file if it already exists.
+        """
+        if not str(src_filename).lower().endswith("gz"):
+            self.copy(src_filename, dest_filename, src_host=src_host)
+            return
+
+        src_filename = self.abspath(src_filename, host=src_host)
+        dest_filename = self.abspath(dest_filename)
+
+        if dest_filename.exists() and not _check_overwrite(dest_filename, force):
+            return
+
+        if src_host is None:
+            f_src = open(src_filename, "rb")  # noqa: SIM115
+        else:
+            f_src = self.get_sftp(src_host).open(str(src_filename), "rb")
+            # read ahead asynchronously, the file is consumed sequentially
+            f_src.prefetch()
+
+        # decompress to a temporary file so errors never leave a truncated file
+        tmp_filename = dest_filename.with_name(f".{dest_filename.name}.tmp")
+        try:
+            with (
+                f_src,
+                GzipFile(fileobj=f_src, mode="rb") as f_in,
+                open(tmp_filename, "wb") as f_out,
+            ):
+                shutil.copyfileobj(f_in, f_out, length=1024**2)
+            os.replace(tmp_filename, dest_filename)
+        except BaseException:
+            tmp_filename.unlink(missing_ok=True)
+            raise
+        self._refresh_snapshot(dest_filename)
+
     def link(
         self,
         src_filename: str | Path,
@@ -280,6 +426,7 @@ class FileClient:
                 os.symlink(src_filename, dest_filename)
             else:
                 raise
+        self._refresh_snapshot(dest_filename)
 
     def remove(self, path: str | Path, host: str | None = None) -> None:
         """
@@ -295,8 +442,9 @@ class FileClient:
         if host is None:
             Path(path).unlink()
         else:
-            path = str(self.abspath(host, host=host))
+            path = str(self.abspath(path, host=host))
             self.get_sftp(host).unlink(path)
+        self._refresh_snapshot(path, host=host)
 
     def rename(
         self,
@@ -322,6 +470,8 @@ class FileClient:
             old_path = str(self.abspath(old_path, host=host))
             new_path = str(self.abspath(new_path, host=host))
             self.get_sftp(host).rename(old_path, new_path)
+        self._refresh_snapshot(old_path, host=host)
+        self._refresh_snapshot(new_path, host=host)
 
     def abspath(self, path: str | Path, host: str | None = None) -> Path:
         """Get the absolute path.
@@ -360,6 +510,16 @@ class FileClient:
         list[Path]
             A list of globs files and directories.
         """
+        path = Path(path)
+        if self._use_snapshot(path, host) and not has_magic(str(path.parent)):
+            listing = self._get_listing(self._snapshot_path(path.parent, host), host)
+            return [
+                path.parent / name
+                for name in listing or {}
+                if fnmatch(name, path.name)
+                and (not name.startswith(".") or path.name.startswith("."))
+            ]
+
         if host is None:
             files = glob(str(path))
         else:
@@ -375,6 +535,8 @@ class FileClient:
         host: str | None = None,
         compresslevel: int = 6,
         force: bool | str = False,
+        workers: int = 1,
+        block_size: int | None = None,
     ) -> None:
         """
         Gzip a file.
@@ -394,6 +556,14 @@ class FileClient:
             - `"force"` or `True`: Overwrite gzipped file if it already exists.
             - `"raise"` or `False`: Raise an error if file already exists.
             - `"skip"` Skip file if it already exists.
+        workers : int
+            Number of threads used to compress a local file larger than
+            ``block_size``.
+        block_size : int or None
+            If set and ``workers > 1``, local files larger than this size (in bytes)
+            are split into blocks that are compressed in parallel. The blocks are
+            written as consecutive gzip members, which standard gzip readers
+            decompress as a single file.
         """
         path = self.abspath(path, host=host)
         path_gz = path.parent / f"{path.name}.gz"
@@ -406,33 +576,25 @@ class FileClient:
             warnings.warn(f"{path} is a directory, skipping...", stacklevel=1)
             return
 
-        if self.exists(path_gz, host=host):
-            if force is False or force == "raise":
-                raise FileExistsError(f"{path_gz} file already exists")
-            if force is True or force == "force":
-                pass
-            elif force == "skip":
-                warnings.warn(
-                    f"{path_gz} file already exists, skipping...", stacklevel=2
-                )
-                return
-            else:
-                raise ValueError(
-                    f"Invalid value for force: {force} "
-                    "(must be True, False, 'raise', 'force', or 'skip'))"
-                )
+        if self.exists(path_gz, host=host) and not _check_overwrite(path_gz, force):
+            return
 
         if host is None:
-            with (
-                open(path, "rb") as f_in,
-                GzipFile(path_gz, "wb", compresslevel=compresslevel) as f_out,
-            ):
-                shutil.copyfileobj(f_in, f_out)
+            if workers > 1 and block_size and path.stat().st_size > block_size:
+                _gzip_blocks(path, path_gz, compresslevel, workers, block_size)
+            else:
+                with (
+                    open(path, "rb") as f_in,
+                    GzipFile(path_gz, "wb", compresslevel=compresslevel) as f_out,
+                ):
+                    shutil.copyfileobj(f_in, f_out)
             shutil.copystat(path, path_gz)
             path.unlink()
         else:
             ssh = self.get_ssh(host)
             _, _stdout, _ = ssh.exec_command(f"gzip -f {path!s}")
+        self._refresh_snapshot(path, host=host)
+        self._refresh_snapshot(path_gz, host=host)
 
     def gunzip(
         self,
@@ -464,21 +626,10 @@ class FileClient:
             warnings.warn(f"{path} is not gzipped, skipping...", stacklevel=2)
             return
 
-        if self.exists(path_nongz, host=host):
-            if force is False or force == "raise":
-                raise FileExistsError(f"{path_nongz} file already exists")
-            if force is True or force == "force":
-                pass
-            elif force == "skip":
-                warnings.warn(
-                    f"{path_nongz} file already exists, skipping...", stacklevel=2
-                )
-                return
-            else:
-                raise ValueError(
-                    f"Invalid value for force: {force} "
-                    "(must be True, False, 'raise', 'force', or 'skip'))"
-                )
+        if self.exists(path_nongz, host=host) and not _check_overwrite(
+            path_nongz, force
+        ):
+            return
 
         if host is None:
             with open(path_nongz, "wb") as f_out, zopen(path, "rb") as f_in:
@@ -487,12 +638,147 @@ class FileClient:
         else:
             ssh = self.get_ssh(host)
             _stdin, _stdout, _stderr = ssh.exec_command(f"gunzip -f {path!s}")
+        self._refresh_snapshot(path, host=host)
+        self._refresh_snapshot(path_nongz, host=host)
+
+    @contextmanager
+    def snapshot(self) -> Iterator[FileClient]:
+        """
+        Answer queries about directory contents from cached directory listings.
+
+        Within the context, each directory is listed once (a single ``scandir`` or
+        SFTP listing), and :obj:`FileClient.exists`, :obj:`FileClient.is_file`,
+        :obj:`FileClient.is_dir`, :obj:`FileClient.listdir` and
+        :obj:`FileClient.glob` (for patterns without wildcards in the directory) are
+        answered from the cached listing. Files written, removed or renamed through
+        this client are updated in the cached listings; changes made by other means
+        are not seen until the context is exited. Nested contexts share the
+        listings of the outermost one. Only the names and types of the entries are
+        cached, which ``scandir`` gets without a ``stat`` call per entry.
+
+        Returns
+        -------
+        FileClient
+            This file client.
+        """
+        if self._snapshots is not None:
+            yield self
+            return
+
+        self._snapshots = {}
+        try:
+            yield self
+        finally:
+            self._snapshots = None
+
+    def _use_snapshot(self, path: str | Path, host: str | None) -> bool:
+        """Whether a path can be looked up in the directory snapshots."""
+        # remote paths would need a round trip to be made absolute
+        return self._snapshots is not None and (
+            host is None or Path(path).is_absolute()
+        )
+
+    @staticmethod
+    def _snapshot_path(path: str | Path, host: str | None) -> Path:
+        """Get the path used to look up the directory snapshots."""
+        return Path(path).absolute() if host is None else Path(path)
+
+    def _get_listing(self, directory: Path, host: str | None) -> dict[str, str] | None:
+        """
+        Get the snapshot listing of a directory, listing it if not yet cached.
+
+        Parameters
+        ----------
+        directory : Path
+            The absolute path to the directory.
+        host : str or None
+            A remote file system host on which to perform file operations.
+
+        Returns
+        -------
+        dict or None
+            The type ("file", "dir", "other" or "broken" for broken symbolic links) of
+            each entry in the directory, or None if the directory cannot be listed.
+        """
+        key = (host, str(directory))
+        if key not in self._snapshots:
+            self._snapshots[key] = self._scandir(directory, host)
+        return self._snapshots[key]
+
+    def _get_snapshot_kind(self, path: str | Path, host: str | None) -> str | None:
+        """Get the type of a path from the snapshot, or None if it does not exist."""
+        path = self._snapshot_path(path, host)
+        if not path.name:
+            return "dir"
+        listing = self._get_listing(path.parent, host)
+        return None if listing is None else listing.get(path.name)
+
+    def _scandir(self, directory: Path, host: str | None) -> dict[str, str] | None:
+        """List a directory and the type of its entries."""
+        if host is None:
+            try:
+                with os.scandir(directory) as entries:
+                    return {entry.name: _get_entry_kind(entry) for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                return None
+
+        sftp = self.get_sftp(host)
+        try:
+            attrs = sftp.listdir_attr(str(directory))
+        except OSError:
+            return None
+        return {
+            attr.filename: _get_remote_kind(
+                sftp, str(directory / attr.filename), attr.st_mode
+            )
+            for attr in attrs
+        }
+
+    def _refresh_snapshot(self, path: str | Path, host: str | None = None) -> None:
+        """Update the snapshot entry of a path after it was written or removed."""
+        if self._snapshots is None:
+            return
+        if not self._use_snapshot(path, host):
+            self._snapshots.clear()
+            return
+
+        path = self._snapshot_path(path, host)
+        key = (host, str(path.parent))
+        if key not in self._snapshots:
+            return
+        if self._snapshots[key] is None:
+            # the directory did not exist when it was listed
+            del self._snapshots[key]
+            return
+
+        if host is None:
+            kind = _get_path_kind(str(path))
+        else:
+            sftp = self.get_sftp(host)
+            try:
+                kind = _get_remote_kind(sftp, str(path), sftp.lstat(str(path)).st_mode)
+            except FileNotFoundError:
+                kind = None
+
+        if kind is None:
+            self._snapshots[key].pop(path.name, None)
+        else:
+            self._snapshots[key][path.name] = kind
 
     def close(self) -> None:
-        """Close all connections."""
-        for connection in self.connections.values():
-            connection["ssh"].close()
-            connection["sftp"].close()
+        """Close all connections, or return them to the pool if pooled."""
+        for host, connection in self.connections.items():
+            if self.pool_connections:
+                connection["sftp"].close()
+                CONNECTION_POOL.release(
+                    host,
+                    self.key_filename,
+                    self.config_filename,
+                    connection["generation"],
+                )
+            else:
+                connection["ssh"].close()
+                connection["sftp"].close()
         self.connections = {}
 
     def __enter__(self) -> FileClient:  # noqa: PYI034
@@ -509,6 +795,407 @@ class FileClient:
         self.close()
 
 
+class SSHConnectionPool:
+    """
+    Process-wide pool of SSH connections to remote hosts.
+
+    Connections are keyed by host and ssh configuration, and shared by all file
+    clients (and threads) using the same host, so that a host is only connected to
+    once rather than once per file client. Only the SSH client and its transport are
+    shared: each file client opens its own SFTP channel on the shared transport, as
+    an SFTP client cannot serve concurrent requests from several threads.
+
+    Connections that are no longer active are reopened when next acquired.
+    Connections not used by any file client for ``idle_timeout`` seconds are closed
+    lazily, i.e., on the next call to :obj:`SSHConnectionPool.acquire` or
+    :obj:`SSHConnectionPool.release`; there is no background thread closing them.
+    Connections inherited by a forked process are discarded (but not closed, as
+    they belong to the parent process) and reopened in the child process.
+
+    Parameters
+    ----------
+    keepalive_interval : int
+        Interval (in seconds) between keepalive packets. If 0, no keepalive packets
+        are sent.
+    idle_timeout : float
+        Time (in seconds) after which unused connections are closed on the next
+        acquire or release.
+    """
+
+    def __init__(
+        self,
+        keepalive_interval: int = SETTINGS.SSH_KEEPALIVE_INTERVAL,
+        idle_timeout: float = SETTINGS.SSH_POOL_IDLE_TIMEOUT,
+    ) -> None:
+        self.keepalive_interval = keepalive_interval
+        self.idle_timeout = idle_timeout
+
+        # identifies each opened connection, so that releasing a connection that has
+        # since been replaced does not affect the replacement
+        self._generations = itertools.count()
+        self._reset()
+
+    def acquire(
+        self, host: str, key_filename: str | Path, config_filename: str | Path
+    ) -> dict[str, Any]:
+        """
+        Get an SSH connection to a host, connecting if necessary.
+
+        Each call should be matched by a call to :obj:`SSHConnectionPool.release`
+        with the generation of the returned connection. Connecting to a host only
+        blocks other threads acquiring a connection to the same host.
+
+        Parameters
+        ----------
+        host : str
+            A remote host filesystem, as "username@remote_host" or "remote_host".
+        key_filename : str or Path
+            Path to private key file.
+        config_filename : str or Path
+            Path to OpenSSH config file.
+
+        Returns
+        -------
+        dict
+            The "ssh" client connected to the host and the "generation" of the
+            connection.
+        """
+        key = (host, str(key_filename), str(config_filename))
+        self._check_fork()
+        with self._lock:
+            self._evict_idle()
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                connection = self._connections.get(key)
+                if connection is not None and _is_active(connection["ssh"]):
+                    return self._use(connection)
+                if connection is not None:
+                    del self._connections[key]
+
+            if connection is not None:
+                connection["ssh"].close()
+
+            # connect without holding the pool lock, so that other hosts can be used
+            ssh = _connect_host(host, key_filename, config_filename)
+            if self.keepalive_interval > 0:
+                ssh.get_transport().set_keepalive(self.keepalive_interval)
+
+            with self._lock:
+                connection = {
+                    "ssh": ssh,
+                    "generation": next(self._generations),
+                    "users": 0,
+                }
+                self._connections[key] = connection
+                return self._use(connection)
+
+    def release(
+        self,
+        host: str,
+        key_filename: str | Path,
+        config_filename: str | Path,
+        generation: int,
+    ) -> None:
+        """
+        Release a connection acquired from the pool.
+
+        The connection is kept open for other file clients until it is evicted.
+        Releasing a connection that has since been replaced (e.g., because it was
+        no longer active) has no effect on the replacement.
+
+        Parameters
+        ----------
+        host : str
+            A remote host filesystem, as "username@remote_host" or "remote_host".
+        key_filename : str or Path
+            Path to private key file.
+        config_filename : str or Path
+            Path to OpenSSH config file.
+        generation : int
+            The generation of the connection returned by
+            :obj:`SSHConnectionPool.acquire`.
+        """
+        key = (host, str(key_filename), str(config_filename))
+        self._check_fork()
+        with self._lock:
+            connection = self._connections.get(key)
+            if connection is not None and connection["generation"] == generation:
+                connection["users"] = max(connection["users"] - 1, 0)
+                connection["last_used"] = time.monotonic()
+            self._evict_idle()
+
+    def close(self) -> None:
+        """Close all connections in the pool."""
+        self._check_fork()
+        with self._lock:
+            for connection in self._connections.values():
+                connection["ssh"].close()
+            self._connections = {}
+
+    def __len__(self) -> int:
+        """Get the number of open connections."""
+        return len(self._connections)
+
+    def _reset(self) -> None:
+        """Forget all connections, without closing them."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        # held while connecting to a host, keyed like the connections
+        self._key_locks: dict[tuple[str, str, str], threading.Lock] = {}
+        self._connections: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+    def _check_fork(self) -> None:
+        """Discard the connections (and locks) inherited from a parent process."""
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _use(self, connection: dict[str, Any]) -> dict[str, Any]:
+        """Register a user of a connection; the pool lock must be held."""
+        connection["users"] += 1
+        connection["last_used"] = time.monotonic()
+        return {"ssh": connection["ssh"], "generation": connection["generation"]}
+
+    def _evict_idle(self) -> None:
+        """Close connections that have been unused for longer than the timeout."""
+        now = time.monotonic()
+        for key, connection in list(self._connections.items()):
+            if (
+                connection["users"] == 0
+                and now - connection["last_used"] > self.idle_timeout
+            ):
+                self._connections.pop(key)["ssh"].close()
+
+
+def _check_overwrite(path: Path, force: bool | str) -> bool:
+    """
+    Check how to handle writing a file that already exists.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the existing file.
+    force : bool or str
+        How to handle writing the file, see :obj:`FileClient.gzip`.
+
+    Returns
+    -------
+    bool
+        Whether the file should be overwritten (True) or skipped (False).
+    """
+    if force is False or force == "raise":
+        raise FileExistsError(f"{path} file already exists")
+    if force is True or force == "force":
+        return True
+    if force == "skip":
+        # warn at the caller of the FileClient method
+        warnings.warn(f"{path} file already exists, skipping...", stacklevel=3)
+        return False
+    raise ValueError(
+        f"Invalid value for force: {force} "
+        "(must be True, False, 'raise', 'force', or 'skip'))"
+    )
+
+
+def _connect_host(
+    host: str, key_filename: str | Path, config_filename: str | Path
+) -> SSHClient:
+    """Open an SSH connection to a host given as "username@remote_host"."""
+    if "@" in host:
+        username, hostname = host.split("@", 1)
+    else:
+        username = None  # paramiko sets default username
+        hostname = host
+    return get_ssh_connection(username, hostname, key_filename, config_filename)
+
+
+def _is_active(ssh: SSHClient) -> bool:
+    """Check whether the transport of an SSH connection is still active."""
+    transport = ssh.get_transport()
+    return transport is not None and transport.is_active()
+
+
+CONNECTION_POOL = SSHConnectionPool()
+atexit.register(CONNECTION_POOL.close)
+
+
+def _copy_local(
+    src_filename: Path,
+    dest_filename: Path,
+    zero_copy_min_size: int,
+    hardlink_readonly: bool,
+) -> str:
+    """
+    Copy a local file with the fastest strategy supported by the file systems.
+
+    Parameters
+    ----------
+    src_filename : Path
+        Full path to source file.
+    dest_filename : Path
+        Full path to destination file, or to the directory to copy it to.
+    zero_copy_min_size : int
+        Files smaller than this size (in bytes) are copied with ``shutil.copy2``.
+    hardlink_readonly : bool
+        Whether read-only files can be hardlinked.
+
+    Returns
+    -------
+    str
+        The strategy used: "reflink", "hardlink", "copy_file_range" or "copy".
+    """
+    if dest_filename.is_dir():
+        dest_filename = dest_filename / src_filename.name
+    if dest_filename.exists() and dest_filename.samefile(src_filename):
+        raise shutil.SameFileError(f"{src_filename} and {dest_filename} are the same")
+
+    src_stat = src_filename.stat()
+    if src_stat.st_size < zero_copy_min_size:
+        shutil.copy2(src_filename, dest_filename)
+        return "copy"
+
+    devices = (src_stat.st_dev, dest_filename.parent.stat().st_dev)
+    readonly = not src_stat.st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    strategies: list[tuple[str, Callable]] = [("reflink", _reflink)]
+    if hardlink_readonly and readonly:
+        strategies.append(("hardlink", _hardlink))
+    strategies.append(("copy_file_range", _copy_file_range))
+
+    used = "copy"
+    for name, strategy in strategies:
+        if (name, *devices) in _UNSUPPORTED_STRATEGIES:
+            continue
+        try:
+            strategy(src_filename, dest_filename, src_stat.st_size)
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            logger.debug(f"{name} not supported for {src_filename}: {exc}")
+            _UNSUPPORTED_STRATEGIES.add((name, *devices))
+        else:
+            used = name
+            break
+    else:
+        shutil.copyfile(src_filename, dest_filename)
+
+    if used != "hardlink":
+        shutil.copystat(src_filename, dest_filename)
+    logger.info(f"Copied {src_filename} to {dest_filename} using {used}")
+    return used
+
+
+def _reflink(src_filename: Path, dest_filename: Path, _: int) -> None:
+    """Clone the data of a file with copy-on-write (Linux only)."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.ENOSYS, "reflink is not available") from None
+
+    with open(src_filename, "rb") as f_src, open(dest_filename, "wb") as f_dest:
+        fcntl.ioctl(f_dest.fileno(), _FICLONE, f_src.fileno())
+
+
+def _hardlink(src_filename: Path, dest_filename: Path, _: int) -> None:
+    """Hardlink a file, replacing the destination if it exists."""
+    dest_filename.unlink(missing_ok=True)
+    os.link(src_filename, dest_filename)
+
+
+def _copy_file_range(src_filename: Path, dest_filename: Path, size: int) -> None:
+    """Copy a file in the kernel, server-side on file systems that support it."""
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range is not available")
+
+    with open(src_filename, "rb") as f_src, open(dest_filename, "wb") as f_dest:
+        while size > 0:
+            copied = os.copy_file_range(f_src.fileno(), f_dest.fileno(), size)
+            if copied == 0:
+                break
+            size -= copied
+
+    if size > 0:
+        # some file systems (e.g., procfs or FUSE) report that nothing was copied
+        raise OSError(errno.ENOTSUP, "copy_file_range stopped before the end of file")
+
+
+def _get_entry_kind(entry: os.DirEntry) -> str:
+    """Get the type of a local directory entry, following symbolic links."""
+    if entry.is_dir():
+        return "dir"
+    if entry.is_file():
+        return "file"
+    return _get_path_kind(entry.path)
+
+
+def _get_path_kind(path: str) -> str | None:
+    """Get the type of a local path, or None if it does not exist."""
+    if os.path.isdir(path):
+        return "dir"
+    if os.path.isfile(path):
+        return "file"
+    if os.path.exists(path):
+        return "other"
+    return "broken" if os.path.islink(path) else None
+
+
+def _get_remote_kind(sftp: SFTPClient, path: str, mode: int) -> str:
+    """Get the type of a remote path from its lstat mode, following symbolic links."""
+    if stat.S_ISLNK(mode):
+        try:
+            mode = sftp.stat(path).st_mode
+        except FileNotFoundError:
+            return "broken"
+    return _get_mode_kind(mode)
+
+
+def _get_mode_kind(mode: int) -> str:
+    """Get the type of a remote path from its (stat) mode."""
+    if stat.S_ISDIR(mode):
+        return "dir"
+    if stat.S_ISREG(mode):
+        return "file"
+    return "other"
+
+
+def _gzip_blocks(
+    path: Path, path_gz: Path, compresslevel: int, workers: int, block_size: int
+) -> None:
+    """
+    Gzip a file by compressing blocks of it in parallel.
+
+    Each block is written as a separate gzip member. At most ``workers + 1`` blocks
+    are held in memory at any time.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file to gzip.
+    path_gz : Path
+        Path to the gzipped file to write.
+    compresslevel : int
+        Level of compression, 1-9.
+    workers : int
+        Number of threads used for the compression.
+    block_size : int
+        Size of the blocks (in bytes).
+    """
+    compress = partial(gzip.compress, compresslevel=compresslevel)
+    with (
+        open(path, "rb") as f_in,
+        open(path_gz, "wb") as f_out,
+        ThreadPoolExecutor(max_workers=workers) as executor,
+    ):
+        # zlib releases the GIL, so the blocks are compressed concurrently
+        pending: deque = deque()
+        for block in iter(partial(f_in.read, block_size), b""):
+            pending.append(executor.submit(compress, block))
+            if len(pending) > workers:
+                f_out.write(pending.popleft().result())
+        while pending:
+            f_out.write(pending.popleft().result())
+
+
 def get_ssh_connection(
     username: str | None,
     hostname: str,
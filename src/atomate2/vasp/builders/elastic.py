@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import time
 from itertools import chain
 from typing import TYPE_CHECKING
 
 import numpy as np
 from maggma.builders import Builder
+from monty.json import jsanitize
 from pydash import get
 from pymatgen.analysis.elasticity import Deformation, Stress
+from pymatgen.core import Structure
 
 from atomate2 import SETTINGS
+from atomate2.common.builders.utils import get_last_updated, get_updated_keys
 from atomate2.common.schemas.elastic import ElasticDocument
 
 if TYPE_CHECKING:
@@ -29,6 +33,15 @@ class ElasticBuilder(Builder):
     2. Group the deformations by their parent structures.
     3. Create an ElasticDocument from the group of tasks.
 
+    If ``incremental`` is set, only formulas with deformation tasks that were added or
+    updated since the most recent elastic document are reprocessed. Note that tasks
+    are compared against the ``last_updated`` date of the elasticity store as a
+    whole, not of the elastic document of their formula. Tasks older than the most
+    recent elastic document are therefore never picked up, e.g., after their
+    documents were removed or a previous build failed, and elastic documents whose
+    deformation tasks were removed are not deleted. Run a full build to resolve
+    these cases.
+
     Parameters
     ----------
     tasks : .Store
@@ -47,6 +60,12 @@ class ElasticBuilder(Builder):
         - "pseudoinverse"
     structure_match_tol : float
         Numerical tolerance for structure equivalence.
+    incremental : bool
+        Whether to only process formulas with tasks that were updated after the most
+        recent elastic document, based on the ``last_updated_field`` of the stores.
+        Default is False.
+    update_chunk_size : int
+        The number of elastic documents to upsert per bulk write.
     **kwargs
         Keyword arguments that will be passed to the Builder init.
     """
@@ -59,6 +78,8 @@ class ElasticBuilder(Builder):
         symprec: float = SETTINGS.SYMPREC,
         fitting_method: str = SETTINGS.ELASTIC_FITTING_METHOD,
         structure_match_tol: float = 1e-5,
+        incremental: bool = False,
+        update_chunk_size: int = 1000,
         **kwargs,
     ) -> None:
         self.tasks = tasks
@@ -68,6 +89,9 @@ class ElasticBuilder(Builder):
         self.symprec = symprec
         self.fitting_method = fitting_method
         self.structure_match_tol = structure_match_tol
+        self.incremental = incremental
+        self.update_chunk_size = update_chunk_size
+        self.counts = {"skipped": 0, "rebuilt": 0, "written": 0}
 
         super().__init__(sources=[tasks], targets=[elasticity], **kwargs)
 
@@ -75,6 +99,7 @@ class ElasticBuilder(Builder):
         """Ensure indices on the tasks and elasticity collections."""
         self.tasks.ensure_index("output.formula_pretty")
         self.tasks.ensure_index("last_updated")
+        self.elasticity.ensure_index("fitting_uuid")
         self.elasticity.ensure_index("fitting_data.uuids.0")
         self.elasticity.ensure_index("last_updated")
 
@@ -90,6 +115,7 @@ class ElasticBuilder(Builder):
         self.logger.info("Elastic builder started")
         self.logger.debug("Adding indices")
         self.ensure_indexes()
+        self.counts = {"skipped": 0, "rebuilt": 0, "written": 0}
 
         # query for deformations
         qry = dict(self.query) | {
@@ -103,10 +129,24 @@ class ElasticBuilder(Builder):
             "output.output.stress",
             "output.formula_pretty",
             "output.dir_name",
+            self.tasks.last_updated_field,
         ]
 
         self.logger.info("Starting aggregation")
-        n_formulas = len(self.tasks.distinct("output.formula_pretty", criteria=qry))
+        formulas = self.tasks.distinct("output.formula_pretty", criteria=qry)
+        n_formulas = len(formulas)
+        if self.incremental:
+            formulas = get_updated_keys(
+                self.tasks, self.elasticity, "output.formula_pretty", qry, self.logger
+            )
+            qry["output.formula_pretty"] = {"$in": formulas}
+            self.counts["skipped"] = n_formulas - len(formulas)
+            self.logger.info(
+                f"Skipping {self.counts['skipped']} of {n_formulas} formulas with no "
+                "updated deformation tasks"
+            )
+            n_formulas = len(formulas)
+
         results = self.tasks.groupby(
             "output.formula_pretty", criteria=qry, properties=return_props
         )
@@ -117,7 +157,7 @@ class ElasticBuilder(Builder):
             self.logger.debug(f"Getting {formula} ({idx + 1} of {n_formulas})")
             yield docs
 
-    def process_item(self, tasks: list[dict]) -> list[ElasticDocument]:
+    def process_item(self, tasks: list[dict]) -> list[dict]:
         """
         Process deformation tasks into elasticity documents.
 
@@ -131,48 +171,82 @@ class ElasticBuilder(Builder):
 
         Returns
         -------
-        list of .ElasticDocument
-            A list of elastic documents for each unique parent structure.
+        list of dict
+            A list of serialized elastic documents for each unique parent structure.
         """
-        self.logger.debug(f"Processing {tasks[0]['output']['formula_pretty']}")
-
         if not tasks:
             return []
 
+        self.logger.debug(f"Processing {tasks[0]['output']['formula_pretty']}")
+        last_updated_field = self.tasks.last_updated_field
+
         # group deformations by parent structure
+        start = time.perf_counter()
         grouped = _group_deformations(tasks, self.structure_match_tol)
+        duration = time.perf_counter() - start
+        self.logger.debug(
+            f"Grouped {len(tasks)} deformations into {len(grouped)} parent "
+            f"structures in {duration:.3f} s "
+            f"({len(tasks) / max(duration, 1e-9):.0f} tasks/s)"
+        )
 
         elastic_docs = []
         for group in grouped:
             elastic_doc = _get_elastic_document(
                 group, self.symprec, self.fitting_method
             )
-            elastic_docs.append(elastic_doc)
+            doc = jsanitize(elastic_doc.model_dump(), allow_bson=True)
+
+            # stores can only upsert on top-level keys
+            doc["fitting_uuid"] = doc["fitting_data"]["uuids"][0]
+            last_updated = get_last_updated(group, last_updated_field)
+            if last_updated is not None:
+                doc[self.elasticity.last_updated_field] = last_updated
+            elastic_docs.append(doc)
 
         return elastic_docs
 
-    def update_targets(self, items: list[ElasticDocument]) -> None:
+    def update_targets(self, items: list[list[dict]]) -> None:
         """
         Insert new elastic documents into the elasticity store.
 
         Parameters
         ----------
-        items : list of .ElasticDocument
-            A list of elasticity documents.
+        items : list of list of dict
+            Lists of serialized elastic documents, one list per formula.
         """
-        _items = chain.from_iterable(filter(bool, items))
+        docs = list(chain.from_iterable(filter(bool, items)))
+        self.counts["rebuilt"] += len(items)
 
-        if len(list(_items)) > 0:
-            self.logger.info(f"Updating {len(list(_items))} elastic documents")
-            self.elasticity.update(_items, key="fitting_data.uuids.0")
-        else:
+        if not docs:
             self.logger.info("No items to update")
+            return
+
+        self.logger.info(f"Updating {len(docs)} elastic documents")
+        for idx in range(0, len(docs), self.update_chunk_size):
+            chunk = docs[idx : idx + self.update_chunk_size]
+            self.elasticity.update(chunk, key="fitting_uuid")
+            self.counts["written"] += len(chunk)
+
+    def finalize(self) -> None:
+        """Log the number of skipped, rebuilt and written items and clean up."""
+        self.logger.info(
+            f"Elastic builder finished: {self.counts['skipped']} formulas skipped, "
+            f"{self.counts['rebuilt']} formulas rebuilt, "
+            f"{self.counts['written']} elastic documents written"
+        )
+        super().finalize()
 
 
 def _group_deformations(tasks: list[dict], tol: float) -> list[list[dict]]:
     """
     Group deformation tasks by their parent structure.
 
+    Tasks are bucketed by the number of sites and a fingerprint of the lattice and
+    fractional coordinates of their parent structure. Two structures within the
+    tolerance always fall in the same or neighbouring buckets, so the exact check
+    is only performed against the groups in these buckets.
+
     Parameters
     ----------
     tasks : list of dict
@@ -185,38 +259,79 @@ def _group_deformations(tasks: list[dict], tol: float) -> list[list[dict]]:
     list of list of dict
         The tasks grouped by their parent (undeformed structure).
     """
-    grouped_tasks = [[tasks[0]]]
-
-    for task in tasks[1:]:
-        orig_structure = get(task, "output.transformations.history.0.input_structure")
-
-        match = False
-        for group in grouped_tasks:
-            group_orig_structure = get(
-                group[0], "output.transformations.history.0.input_structure"
-            )
-
-            # strict but fast structure matching, the structures should be identical
-            lattice_match = np.allclose(
-                orig_structure.lattice.matrix,
-                group_orig_structure.lattice.matrix,
-                atol=tol,
-            )
-            coords_match = np.allclose(
-                orig_structure.frac_coords, group_orig_structure.frac_coords, atol=tol
-            )
-            if lattice_match and coords_match:
-                group.append(task)
-                match = True
-                break
+    rtol = 1e-5  # default relative tolerance of np.allclose
+    parents = [_get_parent_structure(task) for task in tasks]
+    lattices = [parent.lattice.matrix for parent in parents]
+    coords = [parent.frac_coords for parent in parents]
+
+    # sum of the allowed deviations bounds the difference of the fingerprints
+    fingerprints = []
+    widths: dict[int, float] = {}
+    for lattice, frac_coords in zip(lattices, coords, strict=True):
+        fingerprints.append(lattice.sum() + frac_coords.sum())
+        n_sites = len(frac_coords)
+        max_deviation = (9 + 3 * n_sites) * tol + rtol * (
+            np.abs(lattice).sum() + np.abs(frac_coords).sum()
+        )
+        widths[n_sites] = max(widths.get(n_sites, 0), max_deviation)
+
+    grouped_tasks: list[list[dict]] = []
+    representatives: list[int] = []
+    buckets: dict[tuple[int, int], list[int]] = {}
+    for idx, task in enumerate(tasks):
+        n_sites = len(coords[idx])
+        width = widths[n_sites]
+        bucket = int(np.floor(fingerprints[idx] / width)) if width > 0 else 0
+
+        # strict but fast structure matching, the structures should be identical
+        candidates = (
+            buckets.get((n_sites, bucket + shift), []) for shift in (-1, 0, 1)
+        )
+        match = min(
+            (
+                group_idx
+                for group_idx in chain.from_iterable(candidates)
+                if np.allclose(
+                    lattices[idx], lattices[representatives[group_idx]], atol=tol
+                )
+                and np.allclose(
+                    coords[idx], coords[representatives[group_idx]], atol=tol
+                )
+            ),
+            default=None,
+        )
 
-        if not match:
+        if match is None:
             # no match; start a new group
+            buckets.setdefault((n_sites, bucket), []).append(len(grouped_tasks))
+            representatives.append(idx)
             grouped_tasks.append([task])
+        else:
+            grouped_tasks[match].append(task)
 
     return grouped_tasks
 
 
+def _get_parent_structure(task: dict) -> Structure:
+    """
+    Get the parent (undeformed) structure of a deformation task.
+
+    Parameters
+    ----------
+    task : dict
+        A deformation task.
+
+    Returns
+    -------
+    Structure
+        The structure before the deformation was applied.
+    """
+    structure = get(task, "output.transformations.history.0.input_structure")
+    if isinstance(structure, dict):
+        return Structure.from_dict(structure)
+    return structure
+
+
 def _get_elastic_document(
     tasks: list[dict],
     symprec: float,
@@ -244,7 +359,7 @@ def _get_elastic_document(
     ElasticDocument
         An elastic document.
     """
-    structure = get(tasks[0], "output.transformations.history.0.input_structure")
+    structure = _get_parent_structure(tasks[0])
 
     stresses = []
     deformations = []
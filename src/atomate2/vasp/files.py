@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from atomate2 import SETTINGS
-from atomate2.common.files import copy_files, get_zfile, gunzip_files, rename_files
+from atomate2.common.files import get_zfile, rename_files
 from atomate2.utils.file_client import FileClient, auto_fileclient
 from atomate2.utils.path import strip_hostname
 
@@ -38,7 +38,8 @@ def copy_vasp_outputs(
     For folders containing multiple calculations (e.g., suffixed with relax1, relax2,
     etc), this function will only copy the files with the highest numbered suffix and
     the suffix will be removed. Additional vasp files will be also be copied with the
-    same suffix applied. Lastly, this function will gunzip any gzipped files.
+    same suffix applied. Gzipped files are decompressed as they are copied, so only
+    the uncompressed files are written to the current directory.
 
     Parameters
     ----------
@@ -67,8 +68,11 @@ def copy_vasp_outputs(
 
     logger.info(f"Copying VASP inputs from {src_dir}")
 
-    relax_ext = get_largest_relax_extension(src_dir, src_host, file_client=file_client)
-    directory_listing = file_client.listdir(src_dir, host=src_host)
+    with file_client.snapshot():
+        relax_ext = get_largest_relax_extension(
+            src_dir, src_host, file_client=file_client
+        )
+        directory_listing = file_client.listdir(src_dir, host=src_host)
 
     # find required files
     files = ("INCAR", "OUTCAR", "CONTCAR", "vasprun.xml", *additional_vasp_files)
@@ -86,30 +90,18 @@ def copy_vasp_outputs(
     if len([f for f in optional_files if "POTCAR" in f.name]) == 0:
         raise FileNotFoundError(f"Could not find a POTCAR file in {src_dir!r} to copy")
 
-    copy_files(
-        src_dir,
-        src_host=src_host,
-        include_files=required_files + optional_files,
-        file_client=file_client,
-    )
-
-    gunzip_files(
-        include_files=required_files + optional_files,
-        allow_missing=True,
-        file_client=file_client,
-        force=force_overwrite,
-    )
-
-    # rename files to remove relax extension
-    if relax_ext:
-        all_files = optional_files + required_files
-        files_to_rename = {
-            file.name.replace(".gz", ""): file.name.replace(relax_ext, "").replace(
-                ".gz", ""
-            )
-            for file in all_files
-        }
-        rename_files(files_to_rename, allow_missing=True, file_client=file_client)
+    # copy and gunzip in a single pass, directly to the names without relax extension
+    src_dir = file_client.abspath(src_dir, host=src_host)
+    for file in required_files + optional_files:
+        dest_name = file.name.replace(relax_ext, "") if relax_ext else file.name
+        if dest_name.lower().endswith("gz"):
+            dest_name = str(Path(dest_name).with_suffix(""))
+        file_client.copy_gunzip(
+            src_dir / file,
+            Path.cwd() / dest_name,
+            src_host=src_host,
+            force=force_overwrite,
+        )
 
     if contcar_to_poscar:
         rename_files({"CONTCAR": "POSCAR"}, file_client=file_client)
@@ -8,7 +8,7 @@ Light tests here to validate that base classes work as intended
 import os
 
 import pytest
-from jobflow import run_locally
+from jobflow import Flow, run_locally
 
 from atomate2.ase.md import GFNxTBMDMaker, LennardJonesMDMaker
 from atomate2.ase.schemas import AseStructureTaskDoc
@@ -89,3 +89,155 @@ def test_ase_npt_maker(calculator_name, lj_fcc_ne_pars, fcc_ne_structure, tmp_di
     assert os.path.isfile("XDATCAR")
 
     assert len(output.objects["trajectory"]) == n_steps
+
+
+def test_ase_md_streamed_trajectory(lj_fcc_ne_pars, fcc_ne_structure, tmp_dir):
+    from ase.io import Trajectory as AseTrajectory
+
+    md_kwargs = {
+        "calculator_kwargs": lj_fcc_ne_pars,
+        "mb_velocity_seed": _mb_velocity_seed,
+        "temperature": 1000,
+        "ensemble": "nvt",
+        "dynamics": "berendsen",
+        "ase_md_kwargs": {"taut": 100.0},
+        "n_steps": (n_steps := 50),
+        "store_trajectory": "partial",
+        "ionic_step_data": ("energy",),
+    }
+    in_memory = LennardJonesMDMaker(traj_file="in_memory.traj", **md_kwargs)
+    streamed = LennardJonesMDMaker(
+        traj_file="streamed.traj", traj_chunk_size=7, **md_kwargs
+    )
+    outputs = [
+        run_locally(job)[job.uuid][1].output
+        for job in (in_memory.make(fcc_ne_structure), streamed.make(fcc_ne_structure))
+    ]
+
+    ref_traj = AseTrajectory("in_memory.traj")
+    streamed_traj = AseTrajectory("streamed.traj")
+    assert len(streamed_traj) == len(ref_traj) == n_steps + 1
+    for ref_atoms, atoms in zip(ref_traj, streamed_traj, strict=True):
+        assert atoms.get_positions() == pytest.approx(ref_atoms.get_positions())
+        assert atoms.get_potential_energy() == pytest.approx(
+            ref_atoms.get_potential_energy()
+        )
+
+    ref_output, output = outputs
+    assert ref_output.trajectory_file is None
+    assert output.trajectory_file == os.path.abspath("streamed.traj")
+    assert "trajectory" not in output.objects
+    assert output.output.n_steps == ref_output.output.n_steps == n_steps + 1
+    assert len(output.output.ionic_steps) == 2
+    assert output.output.energy == pytest.approx(ref_output.output.energy)
+    assert output.input.structure.cart_coords == pytest.approx(
+        ref_output.input.structure.cart_coords
+    )
+
+    with pytest.raises(ValueError, match="requires `traj_file`"):
+        LennardJonesMDMaker(traj_chunk_size=7, **md_kwargs).run_ase(fcc_ne_structure)
+
+
+def test_ase_md_checkpoint_restart(lj_fcc_ne_pars, fcc_ne_structure, tmp_dir):
+    from dataclasses import dataclass
+
+    import numpy as np
+    from ase.calculators.lj import LennardJones
+
+    class _InterruptedLennardJones(LennardJones):
+        """Fail after a fixed number of calculations, like a walltime kill."""
+
+        n_calls = 0
+
+        def calculate(self, *args, **kwargs):
+            type(self).n_calls += 1
+            if self.n_calls > 26:
+                raise RuntimeError("Walltime exceeded")
+            super().calculate(*args, **kwargs)
+
+    @dataclass
+    class InterruptedMDMaker(LennardJonesMDMaker):
+        @property
+        def calculator(self):
+            return _InterruptedLennardJones(**self.calculator_kwargs)
+
+    structure = fcc_ne_structure * (2, 2, 2)
+    md_kwargs = {
+        "calculator_kwargs": lj_fcc_ne_pars,
+        "mb_velocity_seed": _mb_velocity_seed,
+        "temperature": [300, 1000],
+        "ensemble": "nvt",
+        "n_steps": 40,
+        "checkpoint_interval": 10,
+    }
+
+    os.mkdir(ref_dir := "reference")
+    os.chdir(ref_dir)
+    ref_result = LennardJonesMDMaker(
+        **md_kwargs, ase_md_kwargs={"rng": np.random.default_rng(0)}
+    ).run_ase(structure)
+    os.chdir("..")
+
+    os.mkdir(interrupted_dir := "interrupted")
+    os.chdir(interrupted_dir)
+    with pytest.raises(RuntimeError, match="Walltime exceeded"):
+        InterruptedMDMaker(
+            **md_kwargs, ase_md_kwargs={"rng": np.random.default_rng(0)}
+        ).run_ase(structure)
+    os.chdir("..")
+
+    # resume from step 20 without repeating any steps, the state of the random
+    # number generator is restored from the checkpoint
+    resumed_maker = LennardJonesMDMaker(
+        **md_kwargs, ase_md_kwargs={"rng": np.random.default_rng(1)}, resume=True
+    )
+    with pytest.raises(ValueError, match="run of 40 steps"):
+        LennardJonesMDMaker(**md_kwargs | {"n_steps": 50}, resume=True).run_ase(
+            structure, prev_dir=interrupted_dir
+        )
+    result = resumed_maker.run_ase(structure, prev_dir=interrupted_dir)
+    assert len(result.trajectory) == 21
+    assert result.trajectory[0].cart_coords == pytest.approx(
+        ref_result.trajectory[20].cart_coords
+    )
+    assert result.final_mol_or_struct.cart_coords == pytest.approx(
+        ref_result.final_mol_or_struct.cart_coords
+    )
+    assert [
+        props["temperature"] for props in result.trajectory.frame_properties
+    ] == pytest.approx(
+        [props["temperature"] for props in ref_result.trajectory.frame_properties[20:]]
+    )
+    assert os.path.isfile("md_checkpoint.npz")
+
+
+def test_ase_md_chained_checkpoints(lj_fcc_ne_pars, fcc_ne_structure, tmp_dir):
+    md_kwargs = {
+        "calculator_kwargs": lj_fcc_ne_pars,
+        "mb_velocity_seed": _mb_velocity_seed,
+        "ensemble": "nvt",
+        "n_steps": 10,
+        "checkpoint_interval": 5,
+    }
+    first = LennardJonesMDMaker(temperature=300, **md_kwargs).make(fcc_ne_structure)
+    # the checkpoint of the finished first stage is not resumed, neither by default
+    # nor with resume set
+    stages = [
+        LennardJonesMDMaker(temperature=1000, **md_kwargs).make(
+            first.output.structure, prev_dir=first.output.dir_name
+        ),
+        LennardJonesMDMaker(temperature=1000, resume=True, **md_kwargs).make(
+            first.output.structure, prev_dir=first.output.dir_name
+        ),
+    ]
+    responses = run_locally(
+        Flow([first, *stages]), create_folders=True, ensure_success=True
+    )
+
+    first_output = responses[first.uuid][1].output
+    for stage in stages:
+        output = responses[stage.uuid][1].output
+        assert output.dir_name != first_output.dir_name
+        # all steps of the new stage are run rather than zero steps
+        assert output.output.n_steps == 11
+        assert output.structure != first_output.structure
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 from ase.build import bulk
 from ase.calculators.lj import LennardJones
@@ -13,7 +14,7 @@ from numpy.testing import assert_allclose
 if TYPE_CHECKING:
     from pymatgen.core import Structure
 
-from atomate2.ase.utils import AseRelaxer, TrajectoryObserver
+from atomate2.ase.utils import AseBatchRelaxer, AseRelaxer, TrajectoryObserver
 
 
 def test_trajectory_observer(si_structure: Structure, test_dir, tmp_dir):
@@ -128,3 +129,72 @@ def test_fix_symmetry(fix_symmetry):
         assert symmetry_init["number"] == symmetry_final["number"] == 229
     else:
         assert symmetry_init["number"] != symmetry_final["number"] == 99
+
+
+def test_batch_relaxer(si_structure, tmp_dir):
+    structures = []
+    for scale in (0.98, 1.0, 1.05):
+        structure = si_structure.copy()
+        structure.scale_lattice(scale * structure.volume)
+        structure.perturb(0.05, min_distance=0.01)
+        structures.append(structure)
+
+    batch_results = AseBatchRelaxer(LennardJones()).relax(
+        structures, fmax=0.01, steps=200, final_atoms_object_file=None
+    )
+    assert len(batch_results) == len(structures)
+
+    for structure, batch_result in zip(structures, batch_results, strict=True):
+        result = AseRelaxer(LennardJones()).relax(
+            structure, fmax=0.01, steps=200, final_atoms_object_file=None
+        )
+        assert len(batch_result.trajectory) == len(result.trajectory)
+        assert batch_result.final_mol_or_struct.volume == pytest.approx(
+            result.final_mol_or_struct.volume
+        )
+        assert batch_result.trajectory.frame_properties[-1]["energy"] == pytest.approx(
+            result.trajectory.frame_properties[-1]["energy"]
+        )
+
+    with pytest.raises(ValueError, match="Line-search optimizers"):
+        AseBatchRelaxer(LennardJones(), optimizer="BFGSLineSearch")
+
+
+def test_trajectory_observer_storage(si_structure: Structure):
+    atoms = si_structure.to_ase_atoms()
+    atoms.calc = LennardJones()
+
+    # preallocate fewer frames than stored to check that storage grows
+    traj = TrajectoryObserver(atoms, n_frames=2)
+    for _ in range(5):
+        atoms.positions[0] += 0.01
+        traj()
+
+    assert len(traj.energies) == len(traj.cells) == 5
+    assert np.shape(traj.forces) == (5, len(atoms), 3)
+    assert np.shape(traj.stresses) == (5, 6)
+    assert isinstance(traj.energies[0], float)
+    assert len(list(traj.forces)) == 5
+    assert_allclose(traj.atom_positions[-1], atoms.positions)
+    assert traj.nbytes > 0
+
+    traj_dict = traj.as_dict()
+    assert isinstance(traj_dict["forces"], list)
+    assert_allclose(traj_dict["forces"][2], traj.forces[2])
+
+    pmg_traj = traj.to_pymatgen_trajectory(filename=None)
+    assert len(pmg_traj) == 5
+    assert_allclose(pmg_traj[-1].cart_coords, atoms.positions, atol=1e-10)
+    assert pmg_traj.frame_properties[3]["energy"] == pytest.approx(traj.energies[3])
+
+    # frames cannot be changed in place, but can be replaced
+    with pytest.raises(AttributeError):
+        traj.energies.append(0.0)
+    with pytest.raises(TypeError):
+        traj.energies[0] = 0.0
+    with pytest.raises(ValueError, match="read-only"):
+        traj.forces[0][0] = 0.0
+    energies = list(traj.energies)
+    traj.energies = [energy + 1 for energy in energies]
+    assert list(traj.energies) == pytest.approx([energy + 1 for energy in energies])
+    assert traj.energies == [energy + 1 for energy in energies]
@@ -0,0 +1,188 @@
+import numpy as np
+from jobflow import run_locally
+from pymatgen.core import Lattice, Structure
+from pytest import approx
+
+from atomate2.common.jobs.anharmonicity import (
+    DynmatEigenCache,
+    build_dynmat,
+    get_dynmat_eigens,
+    get_dynmat_eigensystem,
+    get_dynmat_hash,
+    get_eigens,
+    get_sigma_a_per_mode,
+)
+from atomate2.common.schemas.phonons import ForceConstants
+
+
+def _random_force_constants(structure, rng):
+    n_dof = 3 * len(structure)
+    mat = rng.normal(size=(n_dof, n_dof))
+    force_constants = (mat @ mat.T).reshape(len(structure), 3, len(structure), 3)
+    return ForceConstants(force_constants=force_constants.swapaxes(1, 2).tolist())
+
+
+def test_get_sigma_a_per_mode():
+    rng = np.random.default_rng(1234)
+    structure = Structure(
+        Lattice.cubic(6.0), ["Na", "Cl"] * 4, rng.random((8, 3)), to_unit_cell=True
+    )
+    force_constants = _random_force_constants(structure, rng)
+    dft_forces = rng.normal(size=(5, len(structure), 3))
+    harmonic_forces = rng.normal(size=(5, len(structure), 3))
+
+    cache = {}
+    sigmas = get_sigma_a_per_mode(
+        force_constants, structure, dft_forces, harmonic_forces, eigen_cache=cache
+    )
+    assert list(cache) == [get_dynmat_hash(force_constants, structure)]
+
+    # reference: project each sample separately
+    eig_val, eig_vec = get_eigens(build_dynmat(force_constants, structure))
+    inv_sqrt_mass = np.array([site.species.weight for site in structure]) ** -0.5
+    proj = {
+        key: np.array(
+            [eig_vec.T @ (inv_sqrt_mass[:, None] * f).flatten() for f in forces]
+        )[:, 3:]
+        for key, forces in (("dft", dft_forces), ("harmonic", harmonic_forces))
+    }
+    expected = np.std(proj["dft"] - proj["harmonic"], axis=0) / np.std(
+        proj["dft"], axis=0
+    )
+    assert len(sigmas) == len(structure) * 3 - 3
+    assert [sigma for _, sigma in sigmas] == approx(
+        expected[np.argsort(eig_val[3:])].tolist()
+    )
+
+    # cached eigen-decomposition is reused
+    cache[next(iter(cache))] = (eig_val, np.eye(len(eig_val)))
+    cached_sigmas = get_sigma_a_per_mode(
+        force_constants, structure, dft_forces, harmonic_forces, eigen_cache=cache
+    )
+    assert not np.allclose(cached_sigmas, sigmas)
+
+
+def test_dynmat_eigen_cache(tmp_dir):
+    rng = np.random.default_rng(1234)
+    structure = Structure(
+        Lattice.cubic(6.0), ["Na", "Cl"] * 4, rng.random((8, 3)), to_unit_cell=True
+    )
+    force_constants = _random_force_constants(structure, rng)
+    key = get_dynmat_hash(force_constants, structure)
+
+    eigen_job = get_dynmat_eigensystem(
+        force_constants, structure, cache_dir="eigen_cache"
+    )
+    cache_dir = run_locally(eigen_job, ensure_success=True)[eigen_job.uuid][1].output
+
+    cache = DynmatEigenCache(cache_dir)
+    assert list(cache) == [key]
+    eig_val, eig_vec = get_eigens(build_dynmat(force_constants, structure))
+    assert cache[key][0] == approx(eig_val)
+    assert np.abs(cache[key][1]) == approx(np.abs(eig_vec))
+
+    # the persisted eigensystem is loaded rather than recomputed
+    cache[key] = (eig_val, np.eye(len(eig_val)))
+    assert get_dynmat_eigens(force_constants, structure, cache=cache_dir)[1] == approx(
+        np.eye(len(eig_val))
+    )
+    del cache[key]
+    assert len(cache) == 0
+
+
+def test_dynmat_eigen_cache_unreachable(tmp_path):
+    rng = np.random.default_rng(1234)
+    structure = Structure(
+        Lattice.cubic(6.0), ["Na", "Cl"] * 4, rng.random((8, 3)), to_unit_cell=True
+    )
+    force_constants = _random_force_constants(structure, rng)
+    eig_val, _ = get_eigens(build_dynmat(force_constants, structure))
+
+    # a directory which cannot be created, as permissions do not apply to root
+    (tmp_path / "file").write_text("not a directory")
+    cache_dir = tmp_path / "file" / "eigen_cache"
+    eigens = get_dynmat_eigens(force_constants, structure, cache=cache_dir)
+    assert eigens[0] == approx(eig_val)
+    assert not cache_dir.exists()
+
+
+def test_displace_structure_batch():
+    from monty.json import MontyDecoder, jsanitize
+
+    from atomate2.common.jobs.anharmonicity import (
+        StructureBatch,
+        box_muller,
+        displace_structure,
+        get_dynmat_eigens,
+    )
+
+    rng = np.random.default_rng(1234)
+    structure = Structure(
+        Lattice.cubic(6.0), ["Na", "Cl"] * 4, rng.random((8, 3)), to_unit_cell=True
+    )
+    mat = rng.normal(size=(24, 24))
+    force_constants = ForceConstants(
+        force_constants=(mat @ mat.T + 50 * np.eye(24))
+        .reshape(8, 3, 8, 3)
+        .swapaxes(1, 2)
+        .tolist()
+    )
+
+    batch = displace_structure.original(
+        structure, force_constants, temp=300, one_shot=False, seed=42, n_samples=4
+    )
+    assert isinstance(batch, StructureBatch)
+    assert len(batch) == 4
+    assert batch.coords.shape == (4, 8, 3)
+
+    # samples match drawing displacements one at a time with the same seed
+    eig_val, eig_vec = get_dynmat_eigens(force_constants, structure)
+    x_acs = eig_vec[:, 3:].reshape((-1, 3, len(eig_val) - 3))
+    x_acs *= np.sign(
+        [x_acs[..., idx].flat[np.argmax(abs(x_acs[..., idx]))] for idx in range(21)]
+    )
+    sample_rng = np.random.default_rng(42)
+    inv_sqrt_mass = np.array([site.species.weight for site in structure]) ** -0.5
+    for displaced in batch:
+        disp = box_muller(eig_val[3:], x_acs, 300, sample_rng)
+        assert displaced.cart_coords == approx(
+            structure.cart_coords + disp * inv_sqrt_mass[:, None]
+        )
+
+    decoded = MontyDecoder().process_decoded(jsanitize(batch, strict=True))
+    assert decoded.to_structures() == batch.to_structures()
+
+
+def test_get_forces():
+    from atomate2.common.jobs.anharmonicity import get_forces
+
+    rng = np.random.default_rng(1234)
+    structure = Structure(
+        Lattice.cubic(6.0), ["Na", "Cl"] * 4, rng.random((8, 3)), to_unit_cell=True
+    )
+    force_constants = _random_force_constants(structure, rng)
+    displacements = rng.normal(scale=0.01, size=(5, 8, 3))
+    displaced_structures = {
+        "coords": (structure.cart_coords + displacements).tolist(),
+        "forces": rng.normal(size=(5, 8, 3)).tolist(),
+    }
+
+    fc_2d = np.swapaxes(force_constants.force_constants, 1, 2).reshape(24, 24)
+    expected = [-(fc_2d @ disp.flatten()).reshape(-1, 3) for disp in displacements]
+
+    dft_forces, harmonic_forces = get_forces.original(
+        force_constants, structure, displaced_structures
+    )
+    assert isinstance(harmonic_forces, np.ndarray)
+    assert dft_forces == approx(np.array(displaced_structures["forces"]))
+    assert harmonic_forces == approx(np.array(expected))
+
+    _, harmonic_forces_32 = get_forces.original(
+        force_constants,
+        structure,
+        displaced_structures,
+        dtype="float32",
+        chunk_size=2,
+    )
+    assert harmonic_forces_32.dtype == np.float32
+    assert harmonic_forces_32 == approx(np.array(expected), rel=1e-4, abs=1e-5)
@@ -154,3 +154,48 @@ def test_apply_strain_to_structure(clean_dir, si_structure):
         transformations[i].final_structure.volume == approx(expected)
         for i, expected in enumerate(expected_volumes)
     )
+
+
+def test_fit_eos_datasets():
+    from scipy.optimize import approx_fprime
+
+    from atomate2.common.analysis.eos import (
+        birch_murnaghan_pressure,
+        birch_murnaghan_pressure_jacobian,
+        fit_energy_eos,
+        fit_pressure_eos,
+    )
+
+    pars = [_eos_test_pars[key] for key in ("b0", "b1", "v0")]
+    volumes = _eos_test_pars["v0"] * np.linspace(0.95, 1.05, 5)
+    numerical_jacobian = [
+        approx_fprime(pars, lambda x, vol=vol: birch_murnaghan_pressure(vol, *x), 1e-7)
+        for vol in volumes
+    ]
+    assert birch_murnaghan_pressure_jacobian(volumes, *pars) == approx(
+        np.array(numerical_jacobian), rel=1e-4
+    )
+
+    # e.g., a series of temperatures with a slowly expanding equilibrium volume
+    v0s = _eos_test_pars["v0"] * np.linspace(1.0, 1.02, 4)
+    all_volumes = [v0 * np.linspace(0.95, 1.05, 5) for v0 in v0s]
+    pressures = [
+        birch_murnaghan_pressure(vols, *pars[:2], v0)
+        for vols, v0 in zip(all_volumes, v0s, strict=True)
+    ]
+    for warm_start in (False, True):
+        fitted = fit_pressure_eos(all_volumes, pressures, warm_start=warm_start)
+        for eos_params, v0 in zip(fitted, v0s, strict=True):
+            assert eos_params == approx([*pars[:2], v0])
+
+    energies = [
+        taylor_energy(vols, _eos_test_pars["e0"], *pars[:2], v0)
+        for vols, v0 in zip(all_volumes, v0s, strict=True)
+    ]
+    eos_models = ("birch_murnaghan", "vinet")
+    cold = fit_energy_eos(all_volumes, energies, eos_models, warm_start=False)
+    warm = fit_energy_eos(all_volumes, energies, eos_models, warm_start=True)
+    for cold_results, warm_results, v0 in zip(cold, warm, v0s, strict=True):
+        for eos_name in eos_models:
+            assert warm_results[eos_name]["v0"] == approx(v0, rel=1e-3)
+            assert warm_results[eos_name] == approx(cold_results[eos_name], rel=1e-5)
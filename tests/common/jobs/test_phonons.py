@@ -35,3 +35,90 @@ def test_supercell2(si_structure, tmp_dir):
     assert_allclose(
         responses[supercell.output.uuid][1].output, [[6, -2, 0], [0, 6, 0], [-3, -2, 5]]
     )
+
+
+def test_generate_shared_phonon_displacements(si_structure):
+    from atomate2.common.jobs.phonons import (
+        generate_phonon_displacements,
+        generate_shared_phonon_displacements,
+    )
+
+    structures = []
+    for scale in (0.98, 1.0, 1.02):
+        structure = si_structure.copy()
+        structure.scale_lattice(si_structure.volume * scale)
+        structures.append(structure)
+    strained = si_structure.copy()
+    strained.apply_strain([0.02, 0.0, 0.0])
+    structures.append(strained)
+
+    kwargs = {
+        "supercell_matrix": [[2, 0, 0], [0, 2, 0], [0, 0, 2]],
+        "displacement": 0.01,
+        "sym_reduce": True,
+        "symprec": 1e-4,
+        "use_symmetrized_structure": None,
+        "kpath_scheme": "seekpath",
+        "code": "vasp",
+    }
+    shared = generate_shared_phonon_displacements.original(structures, **kwargs)
+
+    # isotropically scaled volumes share one symmetry analysis
+    assert shared["groups"] == [0, 0, 0, 1]
+    for structure, displacements in zip(
+        structures, shared["displacements"], strict=True
+    ):
+        expected = generate_phonon_displacements.original(structure, **kwargs)
+        assert len(displacements) == len(expected)
+        for displaced, ref in zip(displacements, expected, strict=True):
+            assert_allclose(displaced.lattice.matrix, ref.lattice.matrix)
+            assert_allclose(displaced.cart_coords, ref.cart_coords, atol=1e-12)
+
+
+def test_phonon_make_volumes(tmp_dir):
+    from dataclasses import dataclass, field
+
+    import numpy as np
+    from pymatgen.core import Lattice, Structure
+
+    from atomate2.ase.jobs import LennardJonesStaticMaker
+    from atomate2.common.flows.phonons import BasePhononMaker
+
+    @dataclass
+    class LennardJonesPhononMaker(BasePhononMaker):
+        code: str = "ase"
+        phonon_displacement_maker: LennardJonesStaticMaker = field(
+            default_factory=LennardJonesStaticMaker
+        )
+
+        @property
+        def prev_calc_dir_argname(self) -> None:
+            return None
+
+    fcc = Structure(
+        Lattice.cubic(1.55),
+        ["Ar"] * 4,
+        [[0, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0.5], [0, 0.5, 0.5]],
+    )
+    structures = []
+    for scale in (0.98, 1.02):
+        structure = fcc.copy()
+        structure.scale_lattice(fcc.volume * scale)
+        structures.append(structure)
+
+    maker = LennardJonesPhononMaker()
+    flow = maker.make_volumes(structures, supercell_matrix=np.eye(3).tolist())
+    flow_jobs = {flow_job.uuid: flow_job for flow_job in flow.jobs}
+    for istruct, output in enumerate(flow.output):
+        collect = flow_jobs[output.uuid]
+        assert collect.name.endswith(f" structure {istruct + 1}")
+
+    responses = run_locally(flow, create_folders=True, ensure_success=True)
+
+    for structure, output in zip(structures, flow.output, strict=True):
+        single = maker.make(structure, supercell_matrix=np.eye(3).tolist())
+        ref = run_locally(single, create_folders=True, ensure_success=True)
+        assert_allclose(
+            responses[output.uuid][1].output.force_constants.force_constants,
+            ref[single.output.uuid][1].output.force_constants.force_constants,
+        )
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pymatgen.core import Lattice, Structure
+
+from atomate2.common.jobs.qha import analyze_free_energy
+
+
+def test_analyze_free_energy(tmp_dir):
+    structure = Structure(Lattice.cubic(3.0), ["Al"], [[0, 0, 0]])
+    temperatures = np.linspace(0, 500, 51)
+    volumes = [27.6, 25.8, 27.0, 26.4, 28.2, 26.1]
+
+    phonon_outputs = []
+    for idx, volume in enumerate(volumes):
+        # quadratic electronic energy and a phonon free energy softening with volume
+        free_energy = -0.02 * temperatures**1.5 * (1 + 0.01 * (volume - 27))
+        phonon_outputs.append(
+            SimpleNamespace(
+                volume_per_formula_unit=volume,
+                formula_units=1,
+                supercell_matrix=np.eye(3).tolist(),
+                temperatures=temperatures.tolist(),
+                has_imaginary_modes=idx == 5,
+                total_dft_energy=0.1 * (volume - 27.0) ** 2,
+                free_energies=free_energy.tolist(),
+                heat_capacities=(temperatures * volume).tolist(),
+                entropies=(temperatures / volume).tolist(),
+            )
+        )
+
+    doc = analyze_free_energy.original(phonon_outputs, structure=structure, t_max=300)
+
+    # volumes are sorted and those with imaginary modes are left out
+    assert doc.volumes == sorted(volumes[:5])
+    assert doc.temperatures == temperatures.tolist()
+    assert np.shape(doc.free_energies) == (51, 5)
+    order = np.argsort(volumes[:5])
+    expected = np.array([phonon_outputs[idx].free_energies for idx in order]).T
+    np.testing.assert_allclose(doc.free_energies, expected)
+    assert doc.heat_capacities[-1] == pytest.approx(500 * np.sort(volumes[:5]))
+    assert doc.volume_temperature[0] == pytest.approx(27.0, abs=0.05)
+
+    doc = analyze_free_energy.original(
+        phonon_outputs, structure=structure, t_max=300, ignore_imaginary_modes=True
+    )
+    assert doc.volumes == sorted(volumes)
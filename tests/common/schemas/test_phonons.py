@@ -5,12 +5,15 @@ import pytest
 from monty.json import MontyEncoder
 from pydantic import ValidationError
 
+import atomate2.common.schemas.phonons
 from atomate2.common.schemas.phonons import (
+    ForceConstants,
     PhononBSDOSDoc,
     PhononComputationalSettings,
     PhononJobDirs,
     PhononUUIDs,
     ThermalDisplacementData,
+    get_thermal_properties,
 )
 
 
@@ -58,3 +61,81 @@ def test_phonon_bs_dos_doc():
 def test_model_validate(model_cls):
     validated = model_cls.model_validate_json(json.dumps(model_cls(), cls=MontyEncoder))
     assert isinstance(validated, model_cls)
+
+
+def test_get_thermal_properties():
+    from pymatgen.core import Lattice, Structure
+    from pymatgen.phonon.dos import PhononDos
+
+    frequencies = np.linspace(-0.5, 12, 400)
+    dos = PhononDos(frequencies, np.exp(-((frequencies - 6) ** 2)) + 0.1)
+    structure = Structure(
+        Lattice.cubic(4),
+        ["Na", "Cl"] * 2,
+        [[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0, 0], [0, 0.5, 0.5]],
+    )
+    temperatures = np.arange(0, 500, 10)
+
+    properties = get_thermal_properties(dos, temperatures, structure)
+    expected = {
+        "free_energies": dos.helmholtz_free_energy,
+        "entropies": dos.entropy,
+        "internal_energies": dos.internal_energy,
+        "heat_capacities": dos.cv,
+    }
+    for key, method in expected.items():
+        assert properties[key] == pytest.approx(
+            [method(temp=temp, structure=structure) for temp in temperatures]
+        )
+
+
+def test_compact_force_constants(monkeypatch):
+    decoded_arrays = []
+    original_decode_array = atomate2.common.schemas.phonons.decode_array
+
+    def decode_array(encoded):
+        decoded_arrays.append(original_decode_array(encoded))
+        return decoded_arrays[-1]
+
+    monkeypatch.setattr(atomate2.common.schemas.phonons, "decode_array", decode_array)
+
+    rng = np.random.default_rng(1234)
+    fc_array = rng.normal(size=(4, 4, 3, 3))
+
+    force_constants = ForceConstants(fc_array, compact=True)
+    encoded = json.loads(json.dumps(force_constants, cls=MontyEncoder))
+    assert set(encoded["force_constants"]) == {"dtype", "shape", "data"}
+
+    # compact data are only decoded when accessed
+    decoded = ForceConstants.from_dict(encoded)
+    assert decoded.as_dict()["force_constants"] == encoded["force_constants"]
+    assert decoded_arrays == []
+    np.testing.assert_array_equal(decoded.force_constants, fc_array)
+    assert len(decoded_arrays) == 1
+
+    # decoded force constants can be modified in place, e.g. to symmetrize them
+    decoded.force_constants[0, 0] = 0.0
+    assert decoded.force_constants[0, 0] == pytest.approx(np.zeros((3, 3)))
+
+    # non-compact force constants are stored as nested lists
+    plain = ForceConstants(fc_array).as_dict()
+    assert plain["force_constants"] == fc_array.tolist()
+    np.testing.assert_array_equal(
+        ForceConstants.from_dict(plain).force_constants, fc_array
+    )
+
+    kwargs = {
+        "total_dft_energy": None,
+        "supercell_matrix": np.eye(3),
+        "primitive_matrix": np.eye(3),
+        "code": "test",
+        "phonopy_settings": PhononComputationalSettings(
+            npoints_band=1, kpath_scheme="test", kpoint_density_dos=1
+        ),
+        "force_constants": force_constants,
+    }
+    validated = PhononBSDOSDoc.model_validate_json(
+        json.dumps(PhononBSDOSDoc(**kwargs), cls=MontyEncoder)
+    )
+    assert validated.force_constants.compact
+    np.testing.assert_array_equal(validated.force_constants.force_constants, fc_array)
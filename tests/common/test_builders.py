@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+
+from pymatgen.core import Lattice, Structure
+
+from atomate2.common.builders.magnetism import _group_orderings
+from atomate2.common.builders.utils import get_last_updated
+
+
+def test_group_orderings():
+    rocksalt = Structure(Lattice.cubic(4.2), ["Mn", "O"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    # the same parent structure with a different site order and in a supercell
+    reordered = Structure(Lattice.cubic(4.2), ["O", "Mn"], [[0.5] * 3, [0, 0, 0]])
+    supercell = rocksalt * (2, 1, 1)
+    zinc_blende = Structure(
+        Lattice([[0, 2.2, 2.2], [2.2, 0, 2.2], [2.2, 2.2, 0]]),
+        ["Mn", "O"],
+        [[0, 0, 0], [0.25, 0.25, 0.25]],
+    )
+
+    parents = [rocksalt, zinc_blende, reordered, supercell, zinc_blende]
+    tasks = [
+        {"uuid": idx, "metadata": {"parent_structure": parent.as_dict()}}
+        for idx, parent in enumerate(parents)
+    ]
+    grouped = _group_orderings(tasks, ltol=0.2, stol=0.3, angle_tol=5)
+    assert [[task["uuid"] for task in group] for group in grouped] == [
+        [0, 2, 3],
+        [1, 4],
+    ]
+
+    # groups keep the order of their first task, even though the structure matcher
+    # sorts the structures by composition
+    iron_oxide = rocksalt.copy()
+    iron_oxide.replace_species({"Mn": "Fe"})
+    tasks.append({"uuid": 5, "metadata": {"parent_structure": iron_oxide.as_dict()}})
+    grouped = _group_orderings(tasks, ltol=0.2, stol=0.3, angle_tol=5)
+    assert [[task["uuid"] for task in group] for group in grouped] == [
+        [0, 2, 3],
+        [1, 4],
+        [5],
+    ]
+
+
+def test_get_last_updated():
+    dates = [
+        datetime(2024, 1, 2, tzinfo=timezone.utc),
+        datetime(2024, 3, 1, tzinfo=timezone.utc),
+    ]
+    docs = [{"output": {"last_updated": date}} for date in dates] + [{"output": {}}]
+    assert get_last_updated(docs, "output.last_updated") == dates[1]
+    assert get_last_updated([{"output": {}}], "output.last_updated") is None
@@ -1,6 +1,17 @@
+import errno
+import gzip
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+from paramiko import SFTPAttributes
+
+import atomate2.utils.file_client
 from atomate2.common.files import gunzip_files, gzip_files, gzip_output_folder
+from atomate2.utils.file_client import FileClient, SSHConnectionPool
 
 
 def test_gunzip_force_overwrites(tmp_path):
@@ -33,6 +44,31 @@ def test_gunzip_force_overwrites(tmp_path):
         assert f.read_text() == f"{fname} overwritten"
 
 
+def test_copy_gunzip(tmp_path):
+    content = os.urandom(1000) * 100
+    (tmp_path / "src.gz").write_bytes(gzip.compress(content))
+    dest = tmp_path / "dest"
+
+    client = FileClient()
+    client.copy_gunzip(tmp_path / "src.gz", dest)
+    assert dest.read_bytes() == content
+
+    with pytest.raises(FileExistsError):
+        client.copy_gunzip(tmp_path / "src.gz", dest)
+    with pytest.warns(UserWarning, match="already exists"):
+        client.copy_gunzip(tmp_path / "src.gz", dest, force="skip")
+
+    # a corrupted file does not leave a truncated destination file behind
+    (tmp_path / "corrupted.gz").write_bytes(gzip.compress(content)[:-1000])
+    with pytest.raises(EOFError):
+        client.copy_gunzip(tmp_path / "corrupted.gz", tmp_path / "corrupted")
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "corrupted.gz",
+        "dest",
+        "src.gz",
+    ]
+
+
 def test_zip_outputs(tmp_dir):
     for file_name in ("a", "b"):
         (Path.cwd() / file_name).touch()
@@ -57,3 +93,293 @@ def test_zip_outputs(tmp_dir):
     assert (Path.cwd() / "a.gz").exists()
     assert not (Path.cwd() / "b").exists()
     assert (Path.cwd() / "b.gz").exists()
+
+
+def test_gzip_files_parallel(tmp_path):
+    contents = {f"file{idx}": os.urandom(100) * (idx + 1) for idx in range(6)}
+    contents["large"] = os.urandom(1000) * 10
+    for fname, content in contents.items():
+        (tmp_path / fname).write_bytes(content)
+
+    gzip_files(tmp_path, workers=3, block_size=1024)
+
+    for fname, content in contents.items():
+        assert not (tmp_path / fname).exists()
+        with gzip.open(tmp_path / f"{fname}.gz") as file:
+            assert file.read() == content
+
+    # the large file is written as one gzip member per block
+    compressed = (tmp_path / "large.gz").read_bytes()
+    assert compressed.count(b"\x1f\x8b\x08") >= 10
+
+    gunzip_files(tmp_path)
+    assert (tmp_path / "large").read_bytes() == contents["large"]
+
+
+def test_ssh_connection_pool(monkeypatch):
+    class FakeTransport:
+        active = True
+        keepalive = None
+
+        def is_active(self):
+            return self.active
+
+        def set_keepalive(self, interval):
+            self.keepalive = interval
+
+    class FakeSFTPClient:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    class FakeSSHClient:
+        def __init__(self):
+            self.transport = FakeTransport()
+            self.closed = False
+
+        def get_transport(self):
+            return self.transport
+
+        def open_sftp(self):
+            return FakeSFTPClient()
+
+        def close(self):
+            self.closed = True
+
+    connected = []
+    slow_host_connecting = threading.Event()
+    slow_host_release = threading.Event()
+
+    def get_ssh_connection(username, hostname, *args):
+        connected.append((username, hostname))
+        if hostname == "slow":
+            slow_host_connecting.set()
+            assert slow_host_release.wait(timeout=10)
+        return FakeSSHClient()
+
+    pool = SSHConnectionPool(keepalive_interval=10, idle_timeout=60)
+    monkeypatch.setattr(
+        atomate2.utils.file_client, "get_ssh_connection", get_ssh_connection
+    )
+    monkeypatch.setattr(atomate2.utils.file_client, "CONNECTION_POOL", pool)
+
+    # ssh connections are shared across file clients and threads, but every file
+    # client has its own sftp client
+    def use_client(_):
+        with FileClient() as file_client:
+            return file_client.get_ssh("user@remote"), file_client.get_sftp(
+                "user@remote"
+            )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients, sftp_clients = zip(*executor.map(use_client, range(8)), strict=True)
+    assert connected == [("user", "remote")]
+    assert len({id(client) for client in clients}) == 1
+    assert len({id(sftp) for sftp in sftp_clients}) == 8
+    assert all(sftp.closed for sftp in sftp_clients)
+    assert not clients[0].closed
+    assert clients[0].transport.keepalive == 10
+
+    # inactive connections are reopened
+    stale_client = FileClient()
+    stale_client.get_ssh("user@remote")
+    clients[0].transport.active = False
+    file_client = FileClient()
+    ssh = file_client.get_ssh("user@remote")
+    assert clients[0].closed
+    assert ssh is not clients[0]
+    assert len(connected) == 2
+
+    # releasing the replaced connection does not release the new connection
+    pool.idle_timeout = -1
+    stale_client.close()
+    assert not ssh.closed
+    pool.idle_timeout = 60
+    file_client.close()
+
+    # idle connections are evicted, but not those in use
+    file_client = FileClient()
+    file_client.get_ssh("other")
+    pool.idle_timeout = -1
+    pool.release("missing", "~/.ssh/id_rsa", "~/.ssh/config", -1)
+    assert ssh.closed
+    assert len(pool) == 1
+    file_client.close()
+    assert len(pool) == 0
+
+    # unpooled clients close their own connections
+    with FileClient(pool_connections=False) as file_client:
+        ssh = file_client.get_ssh("remote")
+    assert ssh.closed
+
+    # connecting to a slow host does not block other hosts
+    pool.idle_timeout = 60
+    slow_client, file_client = FileClient(), FileClient()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow = executor.submit(slow_client.get_ssh, "slow")
+        assert slow_host_connecting.wait(timeout=10)
+        ssh = file_client.get_ssh("other")
+        slow_host_release.set()
+        slow.result()
+    file_client.close()
+    slow_client.close()
+    assert len(pool) == 2
+
+    # connections inherited from a parent process are neither used nor closed
+    with monkeypatch.context() as fork:
+        fork.setattr(os, "getpid", lambda: -1)
+        with FileClient() as file_client:
+            assert file_client.get_ssh("other") is not ssh
+        assert len(pool) == 1
+        assert not ssh.closed
+
+
+def test_file_client_snapshot(tmp_path, monkeypatch):
+    for name in ("INCAR", "OUTCAR.relax1", ".hidden"):
+        (tmp_path / name).write_text(name)
+    (tmp_path / "OUTCAR.relax2.gz").write_bytes(gzip.compress(b"OUTCAR"))
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "broken").symlink_to(tmp_path / "missing")
+
+    scanned = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(str(path))
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+
+    file_client = FileClient()
+    paths = [tmp_path / name for name in ("INCAR", "subdir", "broken", "POSCAR")]
+    patterns = ["*.relax*", "*", ".*", "INCAR", "POSCAR*", "subdir/*"]
+    expected = {
+        "exists": [file_client.exists(path) for path in paths],
+        "is_file": [file_client.is_file(path) for path in paths],
+        "is_dir": [file_client.is_dir(path) for path in paths],
+        "glob": [sorted(file_client.glob(tmp_path / pat)) for pat in patterns],
+        "listdir": sorted(file_client.listdir(tmp_path)),
+    }
+    scanned.clear()
+
+    with file_client.snapshot(), file_client.snapshot():
+        assert expected == {
+            "exists": [file_client.exists(path) for path in paths],
+            "is_file": [file_client.is_file(path) for path in paths],
+            "is_dir": [file_client.is_dir(path) for path in paths],
+            "glob": [sorted(file_client.glob(tmp_path / pat)) for pat in patterns],
+            "listdir": sorted(file_client.listdir(tmp_path)),
+        }
+        assert scanned == [str(tmp_path), str(tmp_path / "subdir")]
+
+        # changes made through the file client update the snapshot
+        file_client.copy(tmp_path / "INCAR", tmp_path / "POSCAR")
+        file_client.rename(tmp_path / "OUTCAR.relax1", tmp_path / "OUTCAR")
+        file_client.gunzip(tmp_path / "OUTCAR.relax2.gz", force=True)
+        file_client.gzip(tmp_path / "INCAR")
+        file_client.remove(tmp_path / "broken")
+        assert sorted(map(str, file_client.listdir(tmp_path))) == sorted(
+            os.listdir(tmp_path)
+        )
+        assert file_client.is_file(tmp_path / "POSCAR")
+        assert not file_client.exists(tmp_path / "INCAR")
+
+        # files copied to a directory are added to the listing of that directory
+        file_client.copy(tmp_path / "POSCAR", tmp_path / "subdir")
+        assert file_client.listdir(tmp_path / "subdir") == [Path("POSCAR")]
+        assert file_client.is_file(tmp_path / "subdir" / "POSCAR")
+
+        # other changes are not seen until the snapshot is discarded
+        (tmp_path / "KPOINTS").write_text("KPOINTS")
+        assert not file_client.exists(tmp_path / "KPOINTS")
+        assert len(scanned) == 2
+
+    assert file_client.exists(tmp_path / "KPOINTS")
+
+
+def test_file_client_snapshot_remote_symlinks(tmp_path):
+    class FakeSFTPClient:
+        """SFTP client working on the local file system."""
+
+        def listdir_attr(self, path):
+            return [
+                SFTPAttributes.from_stat(os.lstat(entry.path), entry.name)
+                for entry in os.scandir(path)
+            ]
+
+        def stat(self, path):
+            return SFTPAttributes.from_stat(os.stat(path))
+
+    (tmp_path / "OUTCAR").write_text("OUTCAR")
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "OUTCAR")
+    (tmp_path / "dirlink").symlink_to(tmp_path / "subdir")
+    (tmp_path / "broken").symlink_to(tmp_path / "missing")
+
+    file_client = FileClient(pool_connections=False)
+    file_client.connections["remote"] = {"ssh": None, "sftp": FakeSFTPClient()}
+    with file_client.snapshot():
+        assert file_client.is_file(tmp_path / "link", host="remote")
+        assert file_client.exists(tmp_path / "link", host="remote")
+        assert file_client.is_dir(tmp_path / "dirlink", host="remote")
+        assert not file_client.exists(tmp_path / "broken", host="remote")
+        assert not file_client.is_file(tmp_path / "broken", host="remote")
+
+
+def test_file_client_copy_strategies(tmp_path, monkeypatch, caplog):
+    unsupported = set()
+    monkeypatch.setattr(
+        atomate2.utils.file_client, "_UNSUPPORTED_STRATEGIES", unsupported
+    )
+
+    data = os.urandom(64 * 1024)
+    src = tmp_path / "WAVECAR"
+    src.write_bytes(data)
+
+    def used_strategy():
+        return caplog.records[-1].getMessage().split()[-1] if caplog.records else None
+
+    file_client = FileClient()
+    with caplog.at_level(logging.INFO, logger="atomate2.utils.file_client"):
+        # small files are copied as before
+        file_client.copy(src, tmp_path / "small", zero_copy_min_size=len(data) + 1)
+        assert used_strategy() is None
+        assert (tmp_path / "small").read_bytes() == data
+
+        file_client.copy(src, tmp_path / "large", zero_copy_min_size=1024)
+        assert used_strategy() in ("reflink", "copy_file_range", "copy")
+        assert (tmp_path / "large").read_bytes() == data
+        assert (tmp_path / "large").stat().st_mtime == src.stat().st_mtime
+
+        # read-only files are only hardlinked if requested and not reflinked
+        unsupported.add(("reflink", src.stat().st_dev, tmp_path.stat().st_dev))
+        src.chmod(0o444)
+        file_client.copy(src, tmp_path / "copied", zero_copy_min_size=1024)
+        assert not (tmp_path / "copied").samefile(src)
+        file_client.copy(
+            src, tmp_path / "linked", zero_copy_min_size=1024, hardlink_readonly=True
+        )
+        assert used_strategy() == "hardlink"
+        assert (tmp_path / "linked").samefile(src)
+
+        # unsupported strategies are remembered and the regular copy is used
+        def copy_file_range(*args):
+            copy_file_range.calls += 1
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        copy_file_range.calls = 0
+        monkeypatch.setattr(os, "copy_file_range", copy_file_range, raising=False)
+        for dest in ("fallback1", "fallback2"):
+            file_client.copy(src, tmp_path / dest, zero_copy_min_size=1024)
+            assert used_strategy() == "copy"
+            assert (tmp_path / dest).read_bytes() == data
+        assert copy_file_range.calls == 1
+
+        # files are copied regularly if copy_file_range stops early
+        unsupported.clear()
+        unsupported.add(("reflink", src.stat().st_dev, tmp_path.stat().st_dev))
+        monkeypatch.setattr(os, "copy_file_range", lambda *_: 0, raising=False)
+        file_client.copy(src, tmp_path / "short", zero_copy_min_size=1024)
+        assert used_strategy() == "copy"
+        assert (tmp_path / "short").read_bytes() == data
@@ -0,0 +1,60 @@
+import pytest
+from pymatgen.core import Lattice, Structure
+from pymatgen.transformations.advanced_transformations import (
+    CubicSupercellTransformation,
+)
+
+from atomate2.common.utils import get_supercell_matrix
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"prefer_90_degrees": False},
+        {"prefer_90_degrees": False, "max_length": 14, "allow_orthorhombic": True},
+        {"prefer_90_degrees": False, "force_diagonal": True},
+    ],
+)
+def test_get_supercell_matrix(kwargs):
+    structure = Structure(
+        Lattice.from_parameters(3.1, 4.2, 5.3, 80, 95, 110),
+        ["Si", "O"],
+        [[0, 0, 0], [0.3, 0.4, 0.6]],
+    )
+    kwargs = {"min_length": 10, "max_length": None} | kwargs
+
+    transformation = CubicSupercellTransformation(
+        min_length=kwargs["min_length"],
+        max_length=kwargs["max_length"],
+        force_diagonal=kwargs.get("force_diagonal", False),
+        allow_orthorhombic=kwargs.get("allow_orthorhombic", False),
+    )
+    transformation.apply_transformation(structure)
+    expected = transformation.transformation_matrix.transpose().tolist()
+    assert get_supercell_matrix(structure, **kwargs) == expected
+
+    # the search is memoized
+    assert get_supercell_matrix(structure.copy(), **kwargs) == expected
+
+
+def test_get_supercell_matrix_max_atoms():
+    structure = Structure(
+        Lattice.hexagonal(3.2, 5.1),
+        ["Zn"] * 2,
+        [[1 / 3, 2 / 3, 0], [2 / 3, 1 / 3, 0.5]],
+    )
+
+    # no 90 degree cell within 10 atoms, fall back to any angles
+    supercell_matrix = get_supercell_matrix(
+        structure, min_length=5, max_length=None, prefer_90_degrees=True, max_atoms=10
+    )
+    assert supercell_matrix == [[2, 1, 0], [0, 2, 0], [0, 0, 1]]
+
+    with pytest.raises(AttributeError, match="max number of atoms"):
+        get_supercell_matrix(
+            structure,
+            min_length=6,
+            max_length=None,
+            prefer_90_degrees=False,
+            max_atoms=16,
+        )
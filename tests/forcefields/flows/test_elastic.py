@@ -1,10 +1,11 @@
 import pytest
 from jobflow import run_locally
+from numpy.testing import assert_allclose
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 from atomate2.common.schemas.elastic import ElasticDocument
 from atomate2.forcefields.flows.elastic import ElasticMaker
-from atomate2.forcefields.jobs import ForceFieldRelaxMaker
+from atomate2.forcefields.jobs import BatchForceFieldRelaxMaker, ForceFieldRelaxMaker
 
 
 @pytest.mark.parametrize("convenience_constructor", [True, False])
@@ -42,3 +43,28 @@ def test_elastic_wf_with_mace(
         0.002005039, abs=0.01
     )
     assert elastic_output.chemsys == "Si"
+
+
+def test_elastic_wf_batch_deformations(clean_dir, si_structure, test_dir):
+    si_prim = SpacegroupAnalyzer(si_structure).get_primitive_standard_structure()
+    model_path = f"{test_dir}/forcefields/mace/MACE.model"
+    common_kwds = {
+        "calculator_kwargs": {"model": model_path, "default_dtype": "float64"},
+        "relax_kwargs": {"fmax": 0.00001},
+    }
+
+    elastic_tensors = []
+    for batch_deformations in (False, True):
+        maker = ElasticMaker.from_force_field_name(
+            force_field_name="MACE",
+            mlff_kwargs=common_kwds,
+            batch_deformations=batch_deformations,
+        )
+        flow = maker.make(si_prim)
+        responses = run_locally(flow, create_folders=True, ensure_success=True)
+        elastic_tensors.append(
+            responses[flow[-1].uuid][1].output.elastic_tensor.ieee_format
+        )
+
+    assert isinstance(maker.elastic_relax_maker, BatchForceFieldRelaxMaker)
+    assert_allclose(*elastic_tensors, atol=1e-3)
@@ -15,6 +15,7 @@ from atomate2.common.schemas.phonons import (
     PhononUUIDs,
 )
 from atomate2.forcefields.flows.phonons import PhononMaker
+from atomate2.forcefields.jobs import BatchForceFieldStaticMaker
 
 
 @pytest.mark.parametrize("from_name", [False, True])
@@ -102,3 +103,27 @@ def test_phonon_wf_force_field(
     # check phonon plots exist
     assert os.path.isfile(filename_bs)
     assert os.path.isfile(filename_dos)
+
+
+def test_phonon_wf_force_field_batch(clean_dir, si_structure: Structure):
+    phonon_kwargs = dict(
+        use_symmetrized_structure="conventional",
+        create_thermal_displacements=False,
+        store_force_constants=False,
+        prefer_90_degrees=False,
+        generate_frequencies_eigenvectors_kwargs={"tstep": 100},
+    )
+
+    free_energies = []
+    for batch_displacements in (False, True):
+        phonon_maker = PhononMaker(
+            batch_displacements=batch_displacements, **phonon_kwargs
+        )
+        flow = phonon_maker.make(si_structure)
+        responses = run_locally(flow, create_folders=True, ensure_success=True)
+        free_energies.append(responses[flow[-1].uuid][1].output.free_energies)
+
+    assert isinstance(
+        phonon_maker.phonon_displacement_maker, BatchForceFieldStaticMaker
+    )
+    assert_allclose(*free_energies, atol=1e-4)
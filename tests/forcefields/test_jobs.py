@@ -9,6 +9,7 @@ from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pytest import approx, importorskip
 
 from atomate2.forcefields.jobs import (
+    BatchForceFieldRelaxMaker,
     CHGNetRelaxMaker,
     CHGNetStaticMaker,
     ForceFieldRelaxMaker,
@@ -133,6 +134,30 @@ def test_chgnet_relax_maker(si_structure: Structure, relax_cell: bool):
         CHGNetRelaxMaker()
 
 
+def test_chgnet_batch_relax_maker(si_structure: Structure):
+    structures = []
+    for disp in (0.05, 0.1):
+        structure = si_structure.copy()
+        structure.translate_sites(0, [0, 0, disp])
+        structures.append(structure)
+
+    job = BatchForceFieldRelaxMaker(
+        force_field_name="CHGNet", steps=25, relax_cell=False
+    ).make(structures)
+    responses = run_locally(job, ensure_success=True)
+    batch_outputs = responses[job.uuid][1].output
+    assert len(batch_outputs) == len(structures)
+
+    for structure, batch_output in zip(structures, batch_outputs, strict=True):
+        assert isinstance(batch_output, ForceFieldTaskDocument)
+        job = ForceFieldRelaxMaker(
+            force_field_name="CHGNet", steps=25, relax_cell=False
+        ).make(structure)
+        output = run_locally(job, ensure_success=True)[job.uuid][1].output
+        assert batch_output.output.n_steps == output.output.n_steps
+        assert batch_output.output.energy == approx(output.output.energy, abs=1e-4)
+
+
 @pytest.mark.skip(reason="M3GNet requires DGL which is PyTorch 2.4 incompatible")
 def test_m3gnet_static_maker(si_structure):
     # generate job
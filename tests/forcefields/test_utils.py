@@ -1,7 +1,7 @@
 import pytest
 
 from atomate2.forcefields import MLFF
-from atomate2.forcefields.utils import ase_calculator
+from atomate2.forcefields.utils import CalculatorCache, ase_calculator
 
 
 @pytest.mark.parametrize(("force_field"), [mlff.value for mlff in MLFF])
@@ -49,3 +49,31 @@ def test_m3gnet_pot():
     assert str(m3gnet_pes_calc.potential) != str(m3gnet_default.potential)
     assert m3gnet_pes_calc.stress_weight == m3gnet_calculator.stress_weight
     assert m3gnet_pes_calc.stress_weight == m3gnet_default.stress_weight
+
+
+def test_calculator_cache():
+    lj_meta = {"@module": "ase.calculators.lj", "@callable": "LennardJones"}
+    cache = CalculatorCache(max_size=2)
+
+    calc = cache.get(lj_meta, sigma=1.0)
+    assert cache.get(lj_meta, sigma=1.0) is calc
+    assert cache.get(lj_meta, sigma=2.0) is not calc
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+    # least recently used calculator (sigma=1.0) is dropped
+    cache.get(lj_meta, sigma=3.0)
+    assert len(cache) == 2
+    assert cache.get(lj_meta, sigma=1.0) is not calc
+    assert cache.stats["misses"] == 4
+
+    assert cache.evict("custom") == 2
+    assert len(cache) == 0
+
+    cache.get(lj_meta, sigma=1.0)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+    no_cache = CalculatorCache(max_size=0)
+    assert no_cache.get(lj_meta) is not no_cache.get(lj_meta)
+    assert len(no_cache) == 0
@@ -0,0 +1,119 @@
+import numpy as np
+from pymatgen.core import Lattice, Structure
+from pytest import approx
+
+from atomate2.vasp.builders.elastic import _group_deformations
+
+
+def _deformation_task(structure: Structure, uuid: int) -> dict:
+    return {
+        "uuid": uuid,
+        "output": {
+            "transformations": {"history": [{"input_structure": structure.as_dict()}]}
+        },
+    }
+
+
+def test_group_deformations():
+    rng = np.random.default_rng(42)
+    parents = [
+        Structure(Lattice.cubic(4.0 + 0.1 * idx), ["Na", "Cl"], rng.random((2, 3)))
+        for idx in range(5)
+    ]
+    parents.append(
+        Structure(Lattice.cubic(4.0), ["Na"] * 2 + ["Cl"] * 2, [[0] * 3] * 4)
+    )
+
+    tasks = []
+    expected = {}
+    for idx in rng.integers(len(parents), size=60):
+        parent = parents[idx].copy()
+        # perturb within the matching tolerance
+        parent.lattice = Lattice(parent.lattice.matrix + rng.uniform(-5e-6, 5e-6))
+        tasks.append(_deformation_task(parent, len(tasks)))
+        expected.setdefault(int(idx), []).append(len(tasks) - 1)
+
+    grouped = _group_deformations(tasks, tol=1e-5)
+    assert sorted([task["uuid"] for task in group] for group in grouped) == sorted(
+        expected.values()
+    )
+
+
+def _elastic_tasks(structure: Structure, prefix: str, last_updated) -> list[dict]:
+    from pymatgen.analysis.elasticity import ElasticTensor, Strain
+
+    # cubic elastic tensor with c11 = 200, c12 = 100 and c44 = 50 GPa
+    voigt = np.full((6, 6), 0.0)
+    voigt[:3, :3] = 100.0
+    np.fill_diagonal(voigt, [200.0] * 3 + [50.0] * 3)
+    tensor = ElasticTensor.from_voigt(voigt)
+
+    tasks = []
+    for idx in range(6):
+        for magnitude in (-0.01, 0.01):
+            strain = Strain.from_voigt(np.eye(6)[idx] * magnitude)
+            deformation = strain.get_deformation_matrix()
+            # VASP stresses are in kBar and have the opposite sign
+            stress = -10.0 * tensor.calculate_stress(strain)
+            tasks.append(
+                {
+                    "uuid": f"{prefix}-{idx}-{magnitude:+.2f}",
+                    "last_updated": last_updated,
+                    "output": {
+                        "formula_pretty": structure.reduced_formula,
+                        "dir_name": "/",
+                        "orig_inputs": {"NSW": 99, "ISIF": 3},
+                        "output": {"stress": stress.tolist()},
+                        "transformations": {
+                            "history": [
+                                {
+                                    "@class": "DeformationTransformation",
+                                    "input_structure": structure.as_dict(),
+                                    "deformation": deformation.tolist(),
+                                }
+                            ]
+                        },
+                    },
+                }
+            )
+    return tasks
+
+
+def test_elastic_builder_incremental():
+    from datetime import datetime, timedelta
+
+    from maggma.stores import MemoryStore
+
+    from atomate2.vasp.builders.elastic import ElasticBuilder
+
+    now = datetime.fromisoformat("2024-01-01T00:00:00")
+    tasks = MemoryStore()
+    elasticity = MemoryStore()
+    tasks.connect()
+    tasks.update(
+        _elastic_tasks(Structure(Lattice.cubic(4.0), ["Na"], [[0, 0, 0]]), "na", now),
+        key="uuid",
+    )
+
+    builder = ElasticBuilder(tasks, elasticity, incremental=True, update_chunk_size=1)
+    builder.connect()
+    # run the builder steps without finalize, which closes the stores
+    builder.update_targets([builder.process_item(item) for item in builder.get_items()])
+    assert elasticity.count() == 1
+    assert elasticity.last_updated == now
+    assert builder.counts == {"skipped": 0, "rebuilt": 1, "written": 1}
+
+    tasks.update(
+        _elastic_tasks(
+            Structure(Lattice.cubic(3.0), ["K"], [[0, 0, 0]]),
+            "k",
+            now + timedelta(hours=1),
+        ),
+        key="uuid",
+    )
+    builder.update_targets([builder.process_item(item) for item in builder.get_items()])
+    assert elasticity.count() == 2
+    assert builder.counts == {"skipped": 1, "rebuilt": 1, "written": 1}
+    doc = elasticity.query_one({"formula_pretty": "K"})
+    assert doc["fitting_uuid"] == doc["fitting_data"]["uuids"][0]
+    assert doc["elastic_tensor"]["ieee_format"][0][0] == approx(200, rel=1e-3)
@@ -45,3 +45,27 @@ def test_get_largest_relax_extension(vasp_test_dir):
     path = vasp_test_dir / "Si_band_structure" / "static" / "outputs"
     extension = get_largest_relax_extension(directory=path)
     assert extension == ""
+
+
+def test_copy_vasp_outputs_gunzip(vasp_test_dir, tmp_dir):
+    import gzip
+
+    path = vasp_test_dir / "Si_old_double_relax" / "outputs"
+    copy_vasp_outputs(src_dir=path)
+
+    # files are decompressed and the relax extension removed in a single pass
+    assert not list(Path.cwd().glob("*.gz"))
+    assert not list(Path.cwd().glob("*.relax*"))
+    with gzip.open(path / "CONTCAR.relax2.gz", "rb") as f:
+        assert Path("POSCAR").read_bytes() == f.read()
+
+    with pytest.raises(FileExistsError):
+        copy_vasp_outputs(src_dir=path, contcar_to_poscar=False)
+
+    Path("INCAR").write_text("overwritten")
+    copy_vasp_outputs(src_dir=path, contcar_to_poscar=False, force_overwrite="skip")
+    assert Path("INCAR").read_text() == "overwritten"
+
+    copy_vasp_outputs(src_dir=path, contcar_to_poscar=False, force_overwrite=True)
+    with gzip.open(path / "INCAR.relax2.gz", "rb") as f:
+        assert Path("INCAR").read_bytes() == f.read()